@@ -27,6 +27,8 @@ import nltk
 import pandas as pd
 import numpy as np
 
+from symptom_index import SymptomIndex
+
 # Download required NLTK data
 try:
     nltk.download('punkt', quiet=True)
@@ -47,6 +49,7 @@ logger = logging.getLogger(__name__)
 class MedicalChatbot:
     def __init__(self):
         self.disease_data = self.load_disease_data()
+        self.symptom_index = SymptomIndex(self.disease_data)
         self.conversation_history = []
         
     def load_disease_data(self):
@@ -94,26 +97,8 @@ class MedicalChatbot:
     
     def analyze_symptoms(self, symptoms_text):
         """Analyze symptoms and suggest possible conditions"""
-        symptoms_text = symptoms_text.lower()
-        possible_diseases = []
-        
-        for disease, info in self.disease_data.items():
-            symptom_matches = 0
-            for symptom in info['symptoms']:
-                if symptom.lower() in symptoms_text:
-                    symptom_matches += 1
-            
-            if symptom_matches > 0:
-                confidence = (symptom_matches / len(info['symptoms'])) * 100
-                possible_diseases.append({
-                    'disease': info['name'],
-                    'confidence': round(confidence, 2),
-                    'matched_symptoms': symptom_matches
-                })
-        
-        # Sort by confidence
-        possible_diseases.sort(key=lambda x: x['confidence'], reverse=True)
-        return possible_diseases[:3]  # Return top 3 matches
+        # Top 3 matches from the precomputed symptom index
+        return self.symptom_index.score(symptoms_text, limit=3)
     
     def get_disease_info(self, disease_name):
         """Get detailed information about a specific disease"""
@@ -337,4 +322,5 @@ def health_tips():
     })
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Development server only; production runs backend/serve.py under gunicorn
+    app.run(debug=os.environ.get('FLASK_DEBUG', 'false').lower() in ('1', 'true'), host='0.0.0.0', port=5000)
\ No newline at end of file
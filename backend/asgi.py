@@ -0,0 +1,86 @@
+# ASGI entry point: non-blocking /api/chat, every other route served by the Flask app
+#
+# Run from the backend directory:
+#     uvicorn asgi:application --host 0.0.0.0 --port 5000
+import asyncio
+import json
+import logging
+
+from asgiref.wsgi import WsgiToAsgi
+
+from integrated_app import app, chatbot, build_chat_reply, get_session_id
+from language_detector import detect_language
+
+logger = logging.getLogger(__name__)
+
+flask_application = WsgiToAsgi(app)
+
+
+async def read_json_body(receive):
+    """Collect the request body and decode it as JSON"""
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+    return json.loads(body or b'{}')
+
+
+async def send_json(send, payload, status=200):
+    body = json.dumps(payload).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('ascii')),
+            (b'access-control-allow-origin', b'*')
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def chat(scope, receive, send):
+    """Async /api/chat: the event loop stays free while Gemini answers"""
+    try:
+        data = await read_json_body(receive)
+        user_message = data.get('message', '')
+        session_id = get_session_id(data)
+
+        if not user_message:
+            await send_json(send, {'error': 'Message is required'}, 400)
+            return
+
+        # Same rule as the Flask route: detect the language when the client does not send one
+        language = data.get('language') or detect_language(user_message)
+
+        # History may be a SQLite query, so it is read off the event loop
+        loop = asyncio.get_running_loop()
+        context, prompt_stats = await loop.run_in_executor(None, chatbot.build_conversation_context, session_id)
+        response = await chatbot.generate_response_async(user_message, language, context)
+        await send_json(send, build_chat_reply(user_message, response, language, session_id, prompt_stats))
+
+    except Exception as e:
+        logger.error(f"Error in async chat endpoint: {str(e)}")
+        await send_json(send, {'error': 'Internal server error'}, 500)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            chatbot.shutdown()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+    elif scope['type'] == 'http' and scope['path'] == '/api/chat' and scope['method'] == 'POST':
+        await chat(scope, receive, send)
+    else:
+        await flask_application(scope, receive, send)
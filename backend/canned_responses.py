@@ -0,0 +1,286 @@
+# Fixed chatbot messages, pre-translated into every supported language
+from disease_lookup import normalize_term
+
+# key -> {language code: text}; 'en' is the wording the chatbot sends
+CANNED_RESPONSES = {
+    'greeting': {
+        'en': 'Hello! How can I help you with your health concerns today?',
+        'hi': 'नमस्ते! आज मैं आपकी स्वास्थ्य समस्याओं में कैसे मदद कर सकता हूं?',
+        'te': 'నమస్కారం! ఈ రోజు మీ ఆరోగ్య సమస్యలతో నేను ఎలా సహాయం చేయగలను?',
+        'ta': 'வணக்கம்! இன்று உங்கள் உடல்நலக் கவலைகளுக்கு நான் எப்படி உதவ முடியும்?',
+        'bn': 'নমস্কার! আজ আপনার স্বাস্থ্য সংক্রান্ত বিষয়ে আমি কীভাবে সাহায্য করতে পারি?',
+        'gu': 'નમસ્તે! આજે હું તમારી સ્વાસ્થ્ય સંબંધિત ચિંતાઓમાં કેવી રીતે મદદ કરી શકું?',
+        'mr': 'नमस्कार! आज मी तुमच्या आरोग्यविषयक समस्यांमध्ये कशी मदत करू शकतो?',
+        'kn': 'ನಮಸ್ಕಾರ! ಇಂದು ನಿಮ್ಮ ಆರೋಗ್ಯ ಸಮಸ್ಯೆಗಳಿಗೆ ನಾನು ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?',
+        'ml': 'നമസ്കാരം! ഇന്ന് നിങ്ങളുടെ ആരോഗ്യ പ്രശ്നങ്ങളിൽ എനിക്ക് എങ്ങനെ സഹായിക്കാനാകും?',
+        'or': 'ନମସ୍କାର! ଆଜି ମୁଁ ଆପଣଙ୍କ ସ୍ୱାସ୍ଥ୍ୟ ସମସ୍ୟାରେ କିପରି ସାହାଯ୍ୟ କରିପାରିବି?',
+        'pa': 'ਸਤ ਸ੍ਰੀ ਅਕਾਲ! ਅੱਜ ਮੈਂ ਤੁਹਾਡੀਆਂ ਸਿਹਤ ਸੰਬੰਧੀ ਚਿੰਤਾਵਾਂ ਵਿੱਚ ਕਿਵੇਂ ਮਦਦ ਕਰ ਸਕਦਾ ਹਾਂ?',
+        'ur': 'السلام علیکم! آج میں آپ کی صحت سے متعلق پریشانیوں میں کیسے مدد کر سکتا ہوں؟'
+    },
+    'emergency_warning': {
+        'en': 'This seems like a medical emergency. Please seek immediate medical attention.',
+        'hi': 'यह एक मेडिकल इमरजेंसी लगती है। कृपया तुरंत चिकित्सा सहायता लें।',
+        'te': 'ఇది వైద్య అత్యవసర పరిస్థితిలా కనిపిస్తోంది। దయచేసి వెంటనే వైద్య సహాయం తీసుకోండి।',
+        'ta': 'இது ஒரு மருத்துவ அவசரநிலை போல் தெரிகிறது. தயவுசெய்து உடனடியாக மருத்துவ உதவியை நாடுங்கள்.',
+        'bn': 'এটি একটি চিকিৎসা জরুরি অবস্থা বলে মনে হচ্ছে। অনুগ্রহ করে অবিলম্বে চিকিৎসা সহায়তা নিন।',
+        'gu': 'આ તબીબી કટોકટી હોય તેવું લાગે છે. કૃપા કરીને તાત્કાલિક તબીબી સહાય લો.',
+        'mr': 'ही वैद्यकीय आणीबाणी असल्याचे दिसते. कृपया त्वरित वैद्यकीय मदत घ्या.',
+        'kn': 'ಇದು ವೈದ್ಯಕೀಯ ತುರ್ತು ಪರಿಸ್ಥಿತಿಯಂತೆ ಕಾಣುತ್ತದೆ. ದಯವಿಟ್ಟು ತಕ್ಷಣ ವೈದ್ಯಕೀಯ ಸಹಾಯ ಪಡೆಯಿರಿ.',
+        'ml': 'ഇതൊരു മെഡിക്കൽ അടിയന്തരാവസ്ഥയാണെന്ന് തോന്നുന്നു. ദയവായി ഉടൻ വൈദ്യസഹായം തേടുക.',
+        'or': 'ଏହା ଏକ ଚିକିତ୍ସା ଜରୁରୀକାଳୀନ ପରିସ୍ଥିତି ପରି ଲାଗୁଛି। ଦୟାକରି ତୁରନ୍ତ ଚିକିତ୍ସା ସହାୟତା ନିଅନ୍ତୁ।',
+        'pa': 'ਇਹ ਇੱਕ ਮੈਡੀਕਲ ਐਮਰਜੈਂਸੀ ਜਾਪਦੀ ਹੈ। ਕਿਰਪਾ ਕਰਕੇ ਤੁਰੰਤ ਡਾਕਟਰੀ ਸਹਾਇਤਾ ਲਓ।',
+        'ur': 'یہ ایک طبی ایمرجنسی لگتی ہے۔ براہ کرم فوری طبی امداد حاصل کریں۔'
+    },
+    'disclaimer': {
+        'en': 'This is for informational purposes only. Please consult a healthcare professional.',
+        'hi': 'यह केवल जानकारी के लिए है। कृपया किसी स्वास्थ्य पेशेवर से सलाह लें।',
+        'te': 'ఇది కేవలం సమాచార ప్రయోజనాల కోసం మాత్రమే. దయచేసి ఆరోగ్య నిపుణుడిని సంప్రదించండి।',
+        'ta': 'இது தகவலுக்காக மட்டுமே. தயவுசெய்து ஒரு சுகாதார நிபுணரை அணுகவும்.',
+        'bn': 'এটি শুধুমাত্র তথ্যের জন্য। অনুগ্রহ করে একজন স্বাস্থ্য বিশেষজ্ঞের পরামর্শ নিন।',
+        'gu': 'આ માત્ર માહિતી માટે છે. કૃપા કરીને આરોગ્ય નિષ્ણાતની સલાહ લો.',
+        'mr': 'हे केवळ माहितीसाठी आहे. कृपया आरोग्य तज्ज्ञांचा सल्ला घ्या.',
+        'kn': 'ಇದು ಕೇವಲ ಮಾಹಿತಿಗಾಗಿ ಮಾತ್ರ. ದಯವಿಟ್ಟು ಆರೋಗ್ಯ ತಜ್ಞರನ್ನು ಸಂಪರ್ಕಿಸಿ.',
+        'ml': 'ഇത് വിവരങ്ങൾക്ക് വേണ്ടി മാത്രമാണ്. ദയവായി ഒരു ആരോഗ്യ വിദഗ്ധനെ സമീപിക്കുക.',
+        'or': 'ଏହା କେବଳ ସୂଚନା ପାଇଁ। ଦୟାକରି ଜଣେ ସ୍ୱାସ୍ଥ୍ୟ ବିଶେଷଜ୍ଞଙ୍କ ପରାମର୍ଶ ନିଅନ୍ତୁ।',
+        'pa': 'ਇਹ ਸਿਰਫ਼ ਜਾਣਕਾਰੀ ਲਈ ਹੈ। ਕਿਰਪਾ ਕਰਕੇ ਕਿਸੇ ਸਿਹਤ ਮਾਹਰ ਨਾਲ ਸਲਾਹ ਕਰੋ।',
+        'ur': 'یہ صرف معلومات کے لیے ہے۔ براہ کرم کسی طبی ماہر سے مشورہ کریں۔'
+    },
+    'no_match': {
+        'en': 'I couldn\'t find specific information. Please provide more details.',
+        'hi': 'मुझे विशिष्ट जानकारी नहीं मिली। कृपया अधिक विवरण दें।',
+        'te': 'నాకు నిర్దిష్ట సమాచారం కనుగొనలేకపోయింది. దయచేసి మరిన్ని వివరాలు ఇవ్వండి।',
+        'ta': 'குறிப்பிட்ட தகவல் எதுவும் கிடைக்கவில்லை. தயவுசெய்து கூடுதல் விவரங்களைத் தரவும்.',
+        'bn': 'আমি নির্দিষ্ট কোনো তথ্য খুঁজে পাইনি। অনুগ্রহ করে আরও বিস্তারিত জানান।',
+        'gu': 'મને ચોક્કસ માહિતી મળી નથી. કૃપા કરીને વધુ વિગતો આપો.',
+        'mr': 'मला नेमकी माहिती सापडली नाही. कृपया अधिक तपशील द्या.',
+        'kn': 'ನನಗೆ ನಿರ್ದಿಷ್ಟ ಮಾಹಿತಿ ಸಿಗಲಿಲ್ಲ. ದಯವಿಟ್ಟು ಹೆಚ್ಚಿನ ವಿವರಗಳನ್ನು ನೀಡಿ.',
+        'ml': 'എനിക്ക് കൃത്യമായ വിവരങ്ങൾ കണ്ടെത്താനായില്ല. ദയവായി കൂടുതൽ വിശദാംശങ്ങൾ നൽകുക.',
+        'or': 'ମୁଁ ନିର୍ଦ୍ଦିଷ୍ଟ ସୂଚନା ପାଇଲି ନାହିଁ। ଦୟାକରି ଅଧିକ ବିବରଣୀ ଦିଅନ୍ତୁ।',
+        'pa': 'ਮੈਨੂੰ ਖਾਸ ਜਾਣਕਾਰੀ ਨਹੀਂ ਮਿਲੀ। ਕਿਰਪਾ ਕਰਕੇ ਹੋਰ ਵੇਰਵੇ ਦਿਓ।',
+        'ur': 'مجھے مخصوص معلومات نہیں ملیں۔ براہ کرم مزید تفصیلات فراہم کریں۔'
+    },
+
+    # Rule-based chatbot messages (MedicalChatbot.get_rule_based_response)
+    'emergency': {
+        'en': 'This seems like a medical emergency. Please call emergency services immediately or visit the nearest hospital.',
+        'hi': 'यह एक मेडिकल इमरजेंसी लगती है। कृपया तुरंत आपातकालीन सेवाओं को कॉल करें या नज़दीकी अस्पताल जाएं।',
+        'te': 'ఇది వైద్య అత్యవసర పరిస్థితిలా కనిపిస్తోంది. దయచేసి వెంటనే అత్యవసర సేవలకు కాల్ చేయండి లేదా సమీపంలోని ఆసుపత్రికి వెళ్ళండి.',
+        'ta': 'இது ஒரு மருத்துவ அவசரநிலை போல் தெரிகிறது. தயவுசெய்து உடனடியாக அவசர சேவைகளை அழைக்கவும் அல்லது அருகிலுள்ள மருத்துவமனைக்குச் செல்லவும்.',
+        'bn': 'এটি একটি চিকিৎসা জরুরি অবস্থা বলে মনে হচ্ছে। অনুগ্রহ করে এখনই জরুরি পরিষেবায় ফোন করুন অথবা নিকটতম হাসপাতালে যান।',
+        'gu': 'આ તબીબી કટોકટી હોય તેવું લાગે છે. કૃપા કરીને તરત જ ઇમરજન્સી સેવાઓને કૉલ કરો અથવા નજીકની હોસ્પિટલમાં જાઓ.',
+        'mr': 'ही वैद्यकीय आणीबाणी असल्याचे दिसते. कृपया त्वरित आपत्कालीन सेवांना कॉल करा किंवा जवळच्या रुग्णालयात जा.',
+        'kn': 'ಇದು ವೈದ್ಯಕೀಯ ತುರ್ತು ಪರಿಸ್ಥಿತಿಯಂತೆ ಕಾಣುತ್ತದೆ. ದಯವಿಟ್ಟು ತಕ್ಷಣ ತುರ್ತು ಸೇವೆಗಳಿಗೆ ಕರೆ ಮಾಡಿ ಅಥವಾ ಹತ್ತಿರದ ಆಸ್ಪತ್ರೆಗೆ ಭೇಟಿ ನೀಡಿ.',
+        'ml': 'ഇതൊരു മെഡിക്കൽ അടിയന്തരാവസ്ഥയാണെന്ന് തോന്നുന്നു. ദയവായി ഉടൻ അടിയന്തര സേവനങ്ങളെ വിളിക്കുക അല്ലെങ്കിൽ അടുത്തുള്ള ആശുപത്രിയിൽ പോകുക.',
+        'or': 'ଏହା ଏକ ଚିକିତ୍ସା ଜରୁରୀକାଳୀନ ପରିସ୍ଥିତି ପରି ଲାଗୁଛି। ଦୟାକରି ତୁରନ୍ତ ଜରୁରୀକାଳୀନ ସେବାକୁ କଲ୍ କରନ୍ତୁ କିମ୍ବା ନିକଟତମ ଡାକ୍ତରଖାନାକୁ ଯାଆନ୍ତୁ।',
+        'pa': 'ਇਹ ਇੱਕ ਮੈਡੀਕਲ ਐਮਰਜੈਂਸੀ ਜਾਪਦੀ ਹੈ। ਕਿਰਪਾ ਕਰਕੇ ਤੁਰੰਤ ਐਮਰਜੈਂਸੀ ਸੇਵਾਵਾਂ ਨੂੰ ਕਾਲ ਕਰੋ ਜਾਂ ਨਜ਼ਦੀਕੀ ਹਸਪਤਾਲ ਜਾਓ।',
+        'ur': 'یہ ایک طبی ایمرجنسی لگتی ہے۔ براہ کرم فوراً ایمرجنسی سروسز کو کال کریں یا قریبی ہسپتال جائیں۔'
+    },
+    'emergency_advice': {
+        'en': 'If this is a life-threatening emergency, call 108 immediately. Do not delay seeking professional medical help.',
+        'hi': 'यदि यह जानलेवा आपात स्थिति है, तो तुरंत 108 पर कॉल करें। पेशेवर चिकित्सा सहायता लेने में देरी न करें।',
+        'te': 'ఇది ప్రాణాపాయ అత్యవసర పరిస్థితి అయితే, వెంటనే 108కి కాల్ చేయండి. వృత్తిపరమైన వైద్య సహాయం పొందడంలో ఆలస్యం చేయవద్దు.',
+        'ta': 'இது உயிருக்கு ஆபத்தான அவசரநிலை என்றால், உடனடியாக 108 ஐ அழைக்கவும். தொழில்முறை மருத்துவ உதவியை நாடுவதில் தாமதிக்க வேண்டாம்.',
+        'bn': 'এটি যদি প্রাণঘাতী জরুরি অবস্থা হয়, তাহলে এখনই 108-এ ফোন করুন। পেশাদার চিকিৎসা সহায়তা নিতে দেরি করবেন না।',
+        'gu': 'જો આ જીવલેણ કટોકટી હોય, તો તરત જ 108 પર કૉલ કરો. વ્યાવસાયિક તબીબી મદદ લેવામાં વિલંબ ન કરો.',
+        'mr': 'ही जीवघेणी आणीबाणी असल्यास, त्वरित 108 वर कॉल करा. व्यावसायिक वैद्यकीय मदत घेण्यास उशीर करू नका.',
+        'kn': 'ಇದು ಜೀವಕ್ಕೆ ಅಪಾಯಕಾರಿಯಾದ ತುರ್ತು ಪರಿಸ್ಥಿತಿಯಾಗಿದ್ದರೆ, ತಕ್ಷಣ 108ಗೆ ಕರೆ ಮಾಡಿ. ವೃತ್ತಿಪರ ವೈದ್ಯಕೀಯ ಸಹಾಯ ಪಡೆಯಲು ತಡ ಮಾಡಬೇಡಿ.',
+        'ml': 'ഇത് ജീവന് ഭീഷണിയായ അടിയന്തരാവസ്ഥയാണെങ്കിൽ, ഉടൻ 108-ൽ വിളിക്കുക. വിദഗ്ധ വൈദ്യസഹായം തേടാൻ വൈകരുത്.',
+        'or': 'ଯଦି ଏହା ଜୀବନ ପାଇଁ ବିପଜ୍ଜନକ ଜରୁରୀକାଳୀନ ପରିସ୍ଥିତି, ତେବେ ତୁରନ୍ତ 108 କୁ କଲ୍ କରନ୍ତୁ। ବୃତ୍ତିଗତ ଚିକିତ୍ସା ସହାୟତା ନେବାରେ ବିଳମ୍ବ କରନ୍ତୁ ନାହିଁ।',
+        'pa': 'ਜੇਕਰ ਇਹ ਜਾਨਲੇਵਾ ਐਮਰਜੈਂਸੀ ਹੈ, ਤਾਂ ਤੁਰੰਤ 108 \'ਤੇ ਕਾਲ ਕਰੋ। ਪੇਸ਼ੇਵਰ ਡਾਕਟਰੀ ਮਦਦ ਲੈਣ ਵਿੱਚ ਦੇਰੀ ਨਾ ਕਰੋ।',
+        'ur': 'اگر یہ جان لیوا ایمرجنسی ہے تو فوراً 108 پر کال کریں۔ پیشہ ور طبی مدد حاصل کرنے میں تاخیر نہ کریں۔'
+    },
+    'mental_health': {
+        'en': 'Mental health is just as important as physical health. Here are some resources that might help:',
+        'hi': 'मानसिक स्वास्थ्य भी शारीरिक स्वास्थ्य जितना ही महत्वपूर्ण है। यहां कुछ संसाधन हैं जो मदद कर सकते हैं:',
+        'te': 'మానసిక ఆరోగ్యం కూడా శారీరక ఆరోగ్యం అంతే ముఖ్యం. సహాయపడగల కొన్ని వనరులు ఇక్కడ ఉన్నాయి:',
+        'ta': 'மன ஆரோக்கியம் உடல் ஆரோக்கியத்தைப் போலவே முக்கியமானது. உதவக்கூடிய சில வளங்கள் இதோ:',
+        'bn': 'মানসিক স্বাস্থ্য শারীরিক স্বাস্থ্যের মতোই গুরুত্বপূর্ণ। এখানে কিছু সহায়ক সংস্থান দেওয়া হলো:',
+        'gu': 'માનસિક સ્વાસ્થ્ય શારીરિક સ્વાસ્થ્ય જેટલું જ મહત્વપૂર્ણ છે. અહીં કેટલાક સંસાધનો છે જે મદદ કરી શકે છે:',
+        'mr': 'मानसिक आरोग्य हे शारीरिक आरोग्याइतकेच महत्त्वाचे आहे. मदत करू शकतील अशी काही संसाधने येथे आहेत:',
+        'kn': 'ಮಾನಸಿಕ ಆರೋಗ್ಯವು ದೈಹಿಕ ಆರೋಗ್ಯದಷ್ಟೇ ಮುಖ್ಯ. ಸಹಾಯ ಮಾಡಬಹುದಾದ ಕೆಲವು ಸಂಪನ್ಮೂಲಗಳು ಇಲ್ಲಿವೆ:',
+        'ml': 'മാനസികാരോഗ്യം ശാരീരികാരോഗ്യം പോലെ തന്നെ പ്രധാനമാണ്. സഹായകരമായേക്കാവുന്ന ചില വിഭവങ്ങൾ ഇതാ:',
+        'or': 'ମାନସିକ ସ୍ୱାସ୍ଥ୍ୟ ଶାରୀରିକ ସ୍ୱାସ୍ଥ୍ୟ ପରି ସମାନ ଗୁରୁତ୍ୱପୂର୍ଣ୍ଣ। ଏଠାରେ କିଛି ସହାୟକ ସମ୍ବଳ ଅଛି:',
+        'pa': 'ਮਾਨਸਿਕ ਸਿਹਤ ਵੀ ਸਰੀਰਕ ਸਿਹਤ ਜਿੰਨੀ ਹੀ ਮਹੱਤਵਪੂਰਨ ਹੈ। ਇੱਥੇ ਕੁਝ ਸਰੋਤ ਹਨ ਜੋ ਮਦਦ ਕਰ ਸਕਦੇ ਹਨ:',
+        'ur': 'ذہنی صحت بھی جسمانی صحت جتنی ہی اہم ہے۔ یہاں کچھ وسائل ہیں جو مددگار ہو سکتے ہیں:'
+    },
+    'mental_health_talk': {
+        'en': 'Talk to a trusted friend, family member, or counselor',
+        'hi': 'किसी भरोसेमंद दोस्त, परिवार के सदस्य या परामर्शदाता से बात करें',
+        'te': 'నమ్మకమైన స్నేహితుడు, కుటుంబ సభ్యుడు లేదా కౌన్సెలర్‌తో మాట్లాడండి',
+        'ta': 'நம்பிக்கையான நண்பர், குடும்ப உறுப்பினர் அல்லது ஆலோசகரிடம் பேசுங்கள்',
+        'bn': 'বিশ্বস্ত বন্ধু, পরিবারের সদস্য বা কাউন্সেলরের সঙ্গে কথা বলুন',
+        'gu': 'કોઈ વિશ્વાસુ મિત્ર, પરિવારના સભ્ય અથવા કાઉન્સેલર સાથે વાત કરો',
+        'mr': 'विश्वासू मित्र, कुटुंबातील सदस्य किंवा समुपदेशकाशी बोला',
+        'kn': 'ನಂಬಿಕಸ್ಥ ಸ್ನೇಹಿತರು, ಕುಟುಂಬದ ಸದಸ್ಯರು ಅಥವಾ ಆಪ್ತಸಲಹೆಗಾರರೊಂದಿಗೆ ಮಾತನಾಡಿ',
+        'ml': 'വിശ്വസ്തനായ ഒരു സുഹൃത്തിനോടോ കുടുംബാംഗത്തോടോ കൗൺസിലറോടോ സംസാരിക്കുക',
+        'or': 'ଜଣେ ବିଶ୍ୱସ୍ତ ବନ୍ଧୁ, ପରିବାର ସଦସ୍ୟ କିମ୍ବା ପରାମର୍ଶଦାତାଙ୍କ ସହ କଥା ହୁଅନ୍ତୁ',
+        'pa': 'ਕਿਸੇ ਭਰੋਸੇਮੰਦ ਦੋਸਤ, ਪਰਿਵਾਰਕ ਮੈਂਬਰ ਜਾਂ ਸਲਾਹਕਾਰ ਨਾਲ ਗੱਲ ਕਰੋ',
+        'ur': 'کسی قابل اعتماد دوست، خاندان کے فرد یا کونسلر سے بات کریں'
+    },
+    'mental_health_relax': {
+        'en': 'Practice relaxation techniques like deep breathing',
+        'hi': 'गहरी सांस लेने जैसी विश्राम तकनीकों का अभ्यास करें',
+        'te': 'లోతైన శ్వాస వంటి విశ్రాంతి పద్ధతులను అభ్యసించండి',
+        'ta': 'ஆழ்ந்த சுவாசம் போன்ற தளர்வு நுட்பங்களைப் பயிற்சி செய்யுங்கள்',
+        'bn': 'গভীর শ্বাস নেওয়ার মতো শিথিলকরণ কৌশল অনুশীলন করুন',
+        'gu': 'ઊંડા શ્વાસ લેવા જેવી આરામની તકનીકોનો અભ્યાસ કરો',
+        'mr': 'दीर्घ श्वसनासारख्या विश्रांती तंत्रांचा सराव करा',
+        'kn': 'ಆಳವಾದ ಉಸಿರಾಟದಂತಹ ವಿಶ್ರಾಂತಿ ತಂತ್ರಗಳನ್ನು ಅಭ್ಯಾಸ ಮಾಡಿ',
+        'ml': 'ദീർഘശ്വാസം പോലുള്ള വിശ്രമ രീതികൾ പരിശീലിക്കുക',
+        'or': 'ଗଭୀର ଶ୍ୱାସ ନେବା ଭଳି ଆରାମ କୌଶଳ ଅଭ୍ୟାସ କରନ୍ତୁ',
+        'pa': 'ਡੂੰਘੇ ਸਾਹ ਲੈਣ ਵਰਗੀਆਂ ਆਰਾਮ ਦੀਆਂ ਤਕਨੀਕਾਂ ਦਾ ਅਭਿਆਸ ਕਰੋ',
+        'ur': 'گہری سانس لینے جیسی آرام دہ تکنیکوں کی مشق کریں'
+    },
+    'mental_health_sleep': {
+        'en': 'Maintain a regular sleep schedule',
+        'hi': 'सोने का नियमित समय बनाए रखें',
+        'te': 'క్రమమైన నిద్ర సమయాన్ని పాటించండి',
+        'ta': 'சீரான தூக்க நேரத்தைப் பின்பற்றுங்கள்',
+        'bn': 'নিয়মিত ঘুমের সময়সূচি বজায় রাখুন',
+        'gu': 'ઊંઘનો નિયમિત સમય જાળવો',
+        'mr': 'झोपेचे नियमित वेळापत्रक पाळा',
+        'kn': 'ನಿಯಮಿತ ನಿದ್ರೆಯ ವೇಳಾಪಟ್ಟಿಯನ್ನು ಪಾಲಿಸಿ',
+        'ml': 'കൃത്യമായ ഉറക്കസമയം പാലിക്കുക',
+        'or': 'ନିୟମିତ ଶୋଇବା ସମୟ ବଜାୟ ରଖନ୍ତୁ',
+        'pa': 'ਸੌਣ ਦਾ ਨਿਯਮਤ ਸਮਾਂ ਬਣਾਈ ਰੱਖੋ',
+        'ur': 'سونے کا باقاعدہ معمول برقرار رکھیں'
+    },
+    'mental_health_activity': {
+        'en': 'Engage in physical activity',
+        'hi': 'शारीरिक गतिविधि करें',
+        'te': 'శారీరక శ్రమలో పాల్గొనండి',
+        'ta': 'உடல் செயல்பாடுகளில் ஈடுபடுங்கள்',
+        'bn': 'শারীরিক কার্যকলাপে অংশ নিন',
+        'gu': 'શારીરિક પ્રવૃત્તિ કરો',
+        'mr': 'शारीरिक हालचाल करा',
+        'kn': 'ದೈಹಿಕ ಚಟುವಟಿಕೆಯಲ್ಲಿ ತೊಡಗಿಸಿಕೊಳ್ಳಿ',
+        'ml': 'ശാരീരിക പ്രവർത്തനങ്ങളിൽ ഏർപ്പെടുക',
+        'or': 'ଶାରୀରିକ କାର୍ଯ୍ୟକଳାପରେ ନିୟୋଜିତ ହୁଅନ୍ତୁ',
+        'pa': 'ਸਰੀਰਕ ਗਤੀਵਿਧੀ ਕਰੋ',
+        'ur': 'جسمانی سرگرمی میں حصہ لیں'
+    },
+    'mental_health_counseling': {
+        'en': 'Consider professional counseling or therapy',
+        'hi': 'पेशेवर परामर्श या थेरेपी पर विचार करें',
+        'te': 'వృత్తిపరమైన కౌన్సెలింగ్ లేదా థెరపీని పరిగణించండి',
+        'ta': 'தொழில்முறை ஆலோசனை அல்லது சிகிச்சையைக் கருத்தில் கொள்ளுங்கள்',
+        'bn': 'পেশাদার কাউন্সেলিং বা থেরাপির কথা বিবেচনা করুন',
+        'gu': 'વ્યાવસાયિક કાઉન્સેલિંગ અથવા થેરાપીનો વિચાર કરો',
+        'mr': 'व्यावसायिक समुपदेशन किंवा थेरपीचा विचार करा',
+        'kn': 'ವೃತ್ತಿಪರ ಆಪ್ತಸಮಾಲೋಚನೆ ಅಥವಾ ಚಿಕಿತ್ಸೆಯನ್ನು ಪರಿಗಣಿಸಿ',
+        'ml': 'പ്രൊഫഷണൽ കൗൺസിലിംഗോ തെറാപ്പിയോ പരിഗണിക്കുക',
+        'or': 'ବୃତ୍ତିଗତ ପରାମର୍ଶ କିମ୍ବା ଥେରାପି ବିଷୟରେ ବିଚାର କରନ୍ତୁ',
+        'pa': 'ਪੇਸ਼ੇਵਰ ਕਾਉਂਸਲਿੰਗ ਜਾਂ ਥੈਰੇਪੀ ਬਾਰੇ ਵਿਚਾਰ ਕਰੋ',
+        'ur': 'پیشہ ورانہ کونسلنگ یا تھراپی پر غور کریں'
+    },
+    'mental_health_disclaimer': {
+        'en': 'If you are having thoughts of self-harm, please seek immediate professional help or call emergency services.',
+        'hi': 'यदि आपके मन में खुद को नुकसान पहुंचाने के विचार आ रहे हैं, तो कृपया तुरंत पेशेवर मदद लें या आपातकालीन सेवाओं को कॉल करें।',
+        'te': 'మీకు మిమ్మల్ని మీరు హాని చేసుకోవాలనే ఆలోచనలు వస్తుంటే, దయచేసి వెంటనే వృత్తిపరమైన సహాయం పొందండి లేదా అత్యవసర సేవలకు కాల్ చేయండి.',
+        'ta': 'உங்களுக்குத் தீங்கு செய்துகொள்ளும் எண்ணங்கள் இருந்தால், தயவுசெய்து உடனடியாகத் தொழில்முறை உதவியை நாடுங்கள் அல்லது அவசர சேவைகளை அழைக்கவும்.',
+        'bn': 'যদি আপনার মনে নিজের ক্ষতি করার চিন্তা আসে, অনুগ্রহ করে অবিলম্বে পেশাদার সাহায্য নিন অথবা জরুরি পরিষেবায় ফোন করুন।',
+        'gu': 'જો તમને પોતાને નુકસાન પહોંચાડવાના વિચારો આવતા હોય, તો કૃપા કરીને તરત જ વ્યાવસાયિક મદદ લો અથવા ઇમરજન્સી સેવાઓને કૉલ કરો.',
+        'mr': 'तुमच्या मनात स्वतःला इजा करण्याचे विचार येत असल्यास, कृपया त्वरित व्यावसायिक मदत घ्या किंवा आपत्कालीन सेवांना कॉल करा.',
+        'kn': 'ನಿಮಗೆ ನಿಮ್ಮನ್ನು ನೀವೇ ಹಾನಿ ಮಾಡಿಕೊಳ್ಳುವ ಆಲೋಚನೆಗಳು ಬರುತ್ತಿದ್ದರೆ, ದಯವಿಟ್ಟು ತಕ್ಷಣ ವೃತ್ತಿಪರ ಸಹಾಯ ಪಡೆಯಿರಿ ಅಥವಾ ತುರ್ತು ಸೇವೆಗಳಿಗೆ ಕರೆ ಮಾಡಿ.',
+        'ml': 'സ്വയം ഉപദ്രവിക്കാനുള്ള ചിന്തകൾ ഉണ്ടെങ്കിൽ, ദയവായി ഉടൻ വിദഗ്ധ സഹായം തേടുക അല്ലെങ്കിൽ അടിയന്തര സേവനങ്ങളെ വിളിക്കുക.',
+        'or': 'ଯଦି ଆପଣଙ୍କ ମନରେ ନିଜକୁ କ୍ଷତି ପହଞ୍ଚାଇବାର ଚିନ୍ତା ଆସୁଛି, ଦୟାକରି ତୁରନ୍ତ ବୃତ୍ତିଗତ ସହାୟତା ନିଅନ୍ତୁ କିମ୍ବା ଜରୁରୀକାଳୀନ ସେବାକୁ କଲ୍ କରନ୍ତୁ।',
+        'pa': 'ਜੇਕਰ ਤੁਹਾਨੂੰ ਆਪਣੇ ਆਪ ਨੂੰ ਨੁਕਸਾਨ ਪਹੁੰਚਾਉਣ ਦੇ ਵਿਚਾਰ ਆ ਰਹੇ ਹਨ, ਤਾਂ ਕਿਰਪਾ ਕਰਕੇ ਤੁਰੰਤ ਪੇਸ਼ੇਵਰ ਮਦਦ ਲਓ ਜਾਂ ਐਮਰਜੈਂਸੀ ਸੇਵਾਵਾਂ ਨੂੰ ਕਾਲ ਕਰੋ।',
+        'ur': 'اگر آپ کو خود کو نقصان پہنچانے کے خیالات آ رہے ہیں تو براہ کرم فوری طور پر پیشہ ور مدد حاصل کریں یا ایمرجنسی سروسز کو کال کریں۔'
+    },
+    'symptom_analysis': {
+        'en': 'Based on your symptoms, here are some possible conditions:',
+        'hi': 'आपके लक्षणों के आधार पर, ये कुछ संभावित स्थितियां हैं:',
+        'te': 'మీ లక్షణాల ఆధారంగా, కొన్ని సంభావ్య పరిస్థితులు ఇవి:',
+        'ta': 'உங்கள் அறிகுறிகளின் அடிப்படையில், சாத்தியமான சில நிலைகள் இதோ:',
+        'bn': 'আপনার লক্ষণগুলির ভিত্তিতে, কিছু সম্ভাব্য অবস্থা নিচে দেওয়া হলো:',
+        'gu': 'તમારાં લક્ષણોના આધારે, અહીં કેટલીક સંભવિત સ્થિતિઓ છે:',
+        'mr': 'तुमच्या लक्षणांच्या आधारे, या काही संभाव्य स्थिती आहेत:',
+        'kn': 'ನಿಮ್ಮ ರೋಗಲಕ್ಷಣಗಳ ಆಧಾರದ ಮೇಲೆ, ಕೆಲವು ಸಂಭವನೀಯ ಸ್ಥಿತಿಗಳು ಇಲ್ಲಿವೆ:',
+        'ml': 'നിങ്ങളുടെ ലക്ഷണങ്ങളുടെ അടിസ്ഥാനത്തിൽ, സാധ്യമായ ചില അവസ്ഥകൾ ഇതാ:',
+        'or': 'ଆପଣଙ୍କ ଲକ୍ଷଣ ଆଧାରରେ, ଏଠାରେ କିଛି ସମ୍ଭାବ୍ୟ ଅବସ୍ଥା ଅଛି:',
+        'pa': 'ਤੁਹਾਡੇ ਲੱਛਣਾਂ ਦੇ ਆਧਾਰ \'ਤੇ, ਇਹ ਕੁਝ ਸੰਭਾਵਿਤ ਸਥਿਤੀਆਂ ਹਨ:',
+        'ur': 'آپ کی علامات کی بنیاد پر، یہ کچھ ممکنہ بیماریاں ہیں:'
+    },
+    'symptom_disclaimer': {
+        'en': 'This is not a medical diagnosis. Please consult a healthcare professional for proper diagnosis and treatment.',
+        'hi': 'यह चिकित्सा निदान नहीं है। सही निदान और उपचार के लिए कृपया किसी स्वास्थ्य पेशेवर से सलाह लें।',
+        'te': 'ఇది వైద్య నిర్ధారణ కాదు. సరైన నిర్ధారణ మరియు చికిత్స కోసం దయచేసి ఆరోగ్య నిపుణుడిని సంప్రదించండి.',
+        'ta': 'இது மருத்துவ நோயறிதல் அல்ல. சரியான நோயறிதல் மற்றும் சிகிச்சைக்கு தயவுசெய்து ஒரு சுகாதார நிபுணரை அணுகவும்.',
+        'bn': 'এটি কোনো চিকিৎসা রোগনির্ণয় নয়। সঠিক রোগনির্ণয় ও চিকিৎসার জন্য অনুগ্রহ করে একজন স্বাস্থ্য বিশেষজ্ঞের পরামর্শ নিন।',
+        'gu': 'આ તબીબી નિદાન નથી. યોગ્ય નિદાન અને સારવાર માટે કૃપા કરીને આરોગ્ય નિષ્ણાતની સલાહ લો.',
+        'mr': 'हे वैद्यकीय निदान नाही. योग्य निदान आणि उपचारांसाठी कृपया आरोग्य तज्ज्ञांचा सल्ला घ्या.',
+        'kn': 'ಇದು ವೈದ್ಯಕೀಯ ರೋಗನಿರ್ಣಯವಲ್ಲ. ಸರಿಯಾದ ರೋಗನಿರ್ಣಯ ಮತ್ತು ಚಿಕಿತ್ಸೆಗಾಗಿ ದಯವಿಟ್ಟು ಆರೋಗ್ಯ ತಜ್ಞರನ್ನು ಸಂಪರ್ಕಿಸಿ.',
+        'ml': 'ഇതൊരു മെഡിക്കൽ രോഗനിർണയമല്ല. ശരിയായ രോഗനിർണയത്തിനും ചികിത്സയ്ക്കും ദയവായി ഒരു ആരോഗ്യ വിദഗ്ധനെ സമീപിക്കുക.',
+        'or': 'ଏହା ଏକ ଚିକିତ୍ସା ନିଦାନ ନୁହେଁ। ସଠିକ୍ ନିଦାନ ଓ ଚିକିତ୍ସା ପାଇଁ ଦୟାକରି ଜଣେ ସ୍ୱାସ୍ଥ୍ୟ ବିଶେଷଜ୍ଞଙ୍କ ପରାମର୍ଶ ନିଅନ୍ତୁ।',
+        'pa': 'ਇਹ ਡਾਕਟਰੀ ਨਿਦਾਨ ਨਹੀਂ ਹੈ। ਸਹੀ ਨਿਦਾਨ ਅਤੇ ਇਲਾਜ ਲਈ ਕਿਰਪਾ ਕਰਕੇ ਕਿਸੇ ਸਿਹਤ ਮਾਹਰ ਨਾਲ ਸਲਾਹ ਕਰੋ।',
+        'ur': 'یہ طبی تشخیص نہیں ہے۔ درست تشخیص اور علاج کے لیے براہ کرم کسی طبی ماہر سے مشورہ کریں۔'
+    },
+    'symptom_no_match': {
+        'en': 'I couldn\'t identify specific conditions based on your symptoms. Please provide more details or consult a healthcare professional.',
+        'hi': 'मैं आपके लक्षणों के आधार पर विशिष्ट स्थितियों की पहचान नहीं कर सका। कृपया अधिक विवरण दें या किसी स्वास्थ्य पेशेवर से सलाह लें।',
+        'te': 'మీ లక్షణాల ఆధారంగా నేను నిర్దిష్ట పరిస్థితులను గుర్తించలేకపోయాను. దయచేసి మరిన్ని వివరాలు ఇవ్వండి లేదా ఆరోగ్య నిపుణుడిని సంప్రదించండి.',
+        'ta': 'உங்கள் அறிகுறிகளின் அடிப்படையில் குறிப்பிட்ட நிலைகளை என்னால் கண்டறிய முடியவில்லை. தயவுசெய்து கூடுதல் விவரங்களைத் தரவும் அல்லது ஒரு சுகாதார நிபுணரை அணுகவும்.',
+        'bn': 'আপনার লক্ষণগুলির ভিত্তিতে আমি নির্দিষ্ট কোনো অবস্থা শনাক্ত করতে পারিনি। অনুগ্রহ করে আরও বিস্তারিত জানান অথবা একজন স্বাস্থ্য বিশেষজ্ঞের পরামর্শ নিন।',
+        'gu': 'તમારાં લક્ષણોના આધારે હું ચોક્કસ સ્થિતિઓ ઓળખી શક્યો નથી. કૃપા કરીને વધુ વિગતો આપો અથવા આરોગ્ય નિષ્ણાતની સલાહ લો.',
+        'mr': 'तुमच्या लक्षणांच्या आधारे मी नेमक्या स्थिती ओळखू शकलो नाही. कृपया अधिक तपशील द्या किंवा आरोग्य तज्ज्ञांचा सल्ला घ्या.',
+        'kn': 'ನಿಮ್ಮ ರೋಗಲಕ್ಷಣಗಳ ಆಧಾರದ ಮೇಲೆ ನಿರ್ದಿಷ್ಟ ಸ್ಥಿತಿಗಳನ್ನು ಗುರುತಿಸಲು ನನಗೆ ಸಾಧ್ಯವಾಗಲಿಲ್ಲ. ದಯವಿಟ್ಟು ಹೆಚ್ಚಿನ ವಿವರಗಳನ್ನು ನೀಡಿ ಅಥವಾ ಆರೋಗ್ಯ ತಜ್ಞರನ್ನು ಸಂಪರ್ಕಿಸಿ.',
+        'ml': 'നിങ്ങളുടെ ലക്ഷണങ്ങളുടെ അടിസ്ഥാനത്തിൽ കൃത്യമായ അവസ്ഥകൾ കണ്ടെത്താൻ എനിക്ക് കഴിഞ്ഞില്ല. ദയവായി കൂടുതൽ വിശദാംശങ്ങൾ നൽകുക അല്ലെങ്കിൽ ഒരു ആരോഗ്യ വിദഗ്ധനെ സമീപിക്കുക.',
+        'or': 'ଆପଣଙ୍କ ଲକ୍ଷଣ ଆଧାରରେ ମୁଁ ନିର୍ଦ୍ଦିଷ୍ଟ ଅବସ୍ଥା ଚିହ୍ନଟ କରିପାରିଲି ନାହିଁ। ଦୟାକରି ଅଧିକ ବିବରଣୀ ଦିଅନ୍ତୁ କିମ୍ବା ଜଣେ ସ୍ୱାସ୍ଥ୍ୟ ବିଶେଷଜ୍ଞଙ୍କ ପରାମର୍ଶ ନିଅନ୍ତୁ।',
+        'pa': 'ਤੁਹਾਡੇ ਲੱਛਣਾਂ ਦੇ ਆਧਾਰ \'ਤੇ ਮੈਂ ਖਾਸ ਸਥਿਤੀਆਂ ਦੀ ਪਛਾਣ ਨਹੀਂ ਕਰ ਸਕਿਆ। ਕਿਰਪਾ ਕਰਕੇ ਹੋਰ ਵੇਰਵੇ ਦਿਓ ਜਾਂ ਕਿਸੇ ਸਿਹਤ ਮਾਹਰ ਨਾਲ ਸਲਾਹ ਕਰੋ।',
+        'ur': 'آپ کی علامات کی بنیاد پر میں مخصوص بیماریوں کی نشاندہی نہیں کر سکا۔ براہ کرم مزید تفصیلات فراہم کریں یا کسی طبی ماہر سے مشورہ کریں۔'
+    },
+    'general': {
+        'en': 'I\'m here to help with health information. You can ask me about symptoms, diseases, or general health advice. How can I assist you today?',
+        'hi': 'मैं स्वास्थ्य जानकारी में मदद के लिए यहां हूं। आप मुझसे लक्षणों, बीमारियों या सामान्य स्वास्थ्य सलाह के बारे में पूछ सकते हैं। आज मैं आपकी कैसे सहायता कर सकता हूं?',
+        'te': 'ఆరోగ్య సమాచారంతో సహాయం చేయడానికి నేను ఇక్కడ ఉన్నాను. మీరు లక్షణాలు, వ్యాధులు లేదా సాధారణ ఆరోగ్య సలహాల గురించి నన్ను అడగవచ్చు. ఈ రోజు నేను మీకు ఎలా సహాయం చేయగలను?',
+        'ta': 'சுகாதாரத் தகவல்களுடன் உதவ நான் இங்கே இருக்கிறேன். அறிகுறிகள், நோய்கள் அல்லது பொதுவான சுகாதார ஆலோசனைகள் பற்றி நீங்கள் என்னிடம் கேட்கலாம். இன்று நான் உங்களுக்கு எப்படி உதவ முடியும்?',
+        'bn': 'আমি স্বাস্থ্য বিষয়ক তথ্য দিয়ে সাহায্য করতে এখানে আছি। আপনি আমাকে লক্ষণ, রোগ বা সাধারণ স্বাস্থ্য পরামর্শ সম্পর্কে জিজ্ঞাসা করতে পারেন। আজ আমি আপনাকে কীভাবে সাহায্য করতে পারি?',
+        'gu': 'હું સ્વાસ્થ્ય માહિતીમાં મદદ કરવા માટે અહીં છું. તમે મને લક્ષણો, રોગો અથવા સામાન્ય સ્વાસ્થ્ય સલાહ વિશે પૂછી શકો છો. આજે હું તમારી કેવી રીતે મદદ કરી શકું?',
+        'mr': 'मी आरोग्यविषयक माहितीसाठी मदत करण्यासाठी येथे आहे. तुम्ही मला लक्षणे, आजार किंवा सामान्य आरोग्य सल्ल्याबद्दल विचारू शकता. आज मी तुमची कशी मदत करू शकतो?',
+        'kn': 'ಆರೋಗ್ಯ ಮಾಹಿತಿಯೊಂದಿಗೆ ಸಹಾಯ ಮಾಡಲು ನಾನು ಇಲ್ಲಿದ್ದೇನೆ. ನೀವು ರೋಗಲಕ್ಷಣಗಳು, ರೋಗಗಳು ಅಥವಾ ಸಾಮಾನ್ಯ ಆರೋಗ್ಯ ಸಲಹೆಯ ಬಗ್ಗೆ ನನ್ನನ್ನು ಕೇಳಬಹುದು. ಇಂದು ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?',
+        'ml': 'ആരോഗ്യ വിവരങ്ങൾ നൽകി സഹായിക്കാൻ ഞാൻ ഇവിടെയുണ്ട്. ലക്ഷണങ്ങൾ, രോഗങ്ങൾ, അല്ലെങ്കിൽ പൊതുവായ ആരോഗ്യ ഉപദേശങ്ങൾ എന്നിവയെക്കുറിച്ച് നിങ്ങൾക്ക് എന്നോട് ചോദിക്കാം. ഇന്ന് എനിക്ക് നിങ്ങളെ എങ്ങനെ സഹായിക്കാനാകും?',
+        'or': 'ମୁଁ ସ୍ୱାସ୍ଥ୍ୟ ସୂଚନାରେ ସାହାଯ୍ୟ କରିବା ପାଇଁ ଏଠାରେ ଅଛି। ଆପଣ ମୋତେ ଲକ୍ଷଣ, ରୋଗ କିମ୍ବା ସାଧାରଣ ସ୍ୱାସ୍ଥ୍ୟ ପରାମର୍ଶ ବିଷୟରେ ପଚାରିପାରିବେ। ଆଜି ମୁଁ ଆପଣଙ୍କୁ କିପରି ସାହାଯ୍ୟ କରିପାରିବି?',
+        'pa': 'ਮੈਂ ਸਿਹਤ ਜਾਣਕਾਰੀ ਵਿੱਚ ਮਦਦ ਕਰਨ ਲਈ ਇੱਥੇ ਹਾਂ। ਤੁਸੀਂ ਮੈਨੂੰ ਲੱਛਣਾਂ, ਬਿਮਾਰੀਆਂ ਜਾਂ ਆਮ ਸਿਹਤ ਸਲਾਹ ਬਾਰੇ ਪੁੱਛ ਸਕਦੇ ਹੋ। ਅੱਜ ਮੈਂ ਤੁਹਾਡੀ ਕਿਵੇਂ ਮਦਦ ਕਰ ਸਕਦਾ ਹਾਂ?',
+        'ur': 'میں صحت سے متعلق معلومات میں مدد کے لیے یہاں ہوں۔ آپ مجھ سے علامات، بیماریوں یا عمومی صحت کے مشورے کے بارے میں پوچھ سکتے ہیں۔ آج میں آپ کی کیسے مدد کر سکتا ہوں؟'
+    }
+}
+
+
+def canned_text(key, language='en'):
+    """A canned message in one language, falling back to English"""
+    translations = CANNED_RESPONSES[key]
+    return translations.get(language, translations['en'])
+
+
+class CannedResponses:
+    """Exact lookup of canned messages across languages.
+
+    Every (language, normalized text) pair is hashed once at start-up,
+    so finding the translation of a canned message is one dict lookup.
+    Normalization only folds case, width and whitespace; a fragment or a
+    different sentence is a miss, never a partial match.
+    """
+
+    def __init__(self, responses=None):
+        self.responses = responses or CANNED_RESPONSES
+        self._keys = {}
+        for key, translations in self.responses.items():
+            for language, text in translations.items():
+                self._keys.setdefault((language, normalize_term(text)), key)
+
+    def key_for(self, text, language='en'):
+        """Canned message key for this exact text, or None"""
+        return self._keys.get((language, normalize_term(text)))
+
+    def lookup(self, text, target_language, source_language='en'):
+        """Stored translation of a canned message, or None when the text is not canned"""
+        key = self.key_for(text, source_language)
+        if key is None:
+            return None
+        return self.responses[key].get(target_language)
+
+    def languages(self):
+        return sorted({language for translations in self.responses.values() for language in translations})
+
+    def __len__(self):
+        return len(self.responses)
@@ -0,0 +1,143 @@
+# Circuit breaker with an adaptive timeout for upstream model calls
+import threading
+import time
+from collections import deque
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Calls remembered per rolling window, whatever its length in seconds
+MAX_WINDOW_CALLS = 1000
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling upstream while the circuit is open"""
+
+
+class CircuitBreaker:
+    """Closed -> open -> half-open breaker over a rolling window of calls.
+
+    The circuit opens when, over the last ``window_seconds`` and at least
+    ``min_calls`` calls, the error rate reaches ``error_rate_threshold``
+    or the share of calls slower than ``slow_call_seconds`` reaches
+    ``slow_call_rate_threshold``. While open every call is rejected with
+    CircuitOpenError. After ``open_seconds`` up to ``half_open_calls``
+    probes are let through: a success closes the circuit, a failure
+    opens it again.
+
+    ``timeout`` adapts to upstream health: ``timeout_multiplier`` times
+    the p95 latency of recent successful calls, kept between
+    ``min_timeout`` and ``max_timeout``.
+    """
+
+    def __init__(self, window_seconds=60, min_calls=10, error_rate_threshold=0.5, slow_call_seconds=5.0,
+                 slow_call_rate_threshold=0.8, open_seconds=30, half_open_calls=1,
+                 min_timeout=1.0, max_timeout=8.0, timeout_multiplier=2.0):
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+
+        self.state = CLOSED
+        self.timeout = max_timeout
+        self._calls = deque(maxlen=MAX_WINDOW_CALLS)  # (finished_at, ok, latency)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+        self.transitions = {}
+        self.rejected = 0
+
+    def _transition(self, state):
+        key = f'{self.state}->{state}'
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._calls.clear()
+        self._probes_in_flight = 0
+
+    def _window(self, now):
+        cutoff = now - self.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+        return self._calls
+
+    def _refresh_timeout(self, calls):
+        latencies = sorted(latency for _, ok, latency in calls if ok)
+        if not latencies:
+            self.timeout = self.max_timeout
+            return
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        self.timeout = min(self.max_timeout, max(self.min_timeout, p95 * self.timeout_multiplier))
+
+    def acquire(self):
+        """Admit one call and return its timeout in seconds, or raise CircuitOpenError"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    self.rejected += 1
+                    raise CircuitOpenError('Gemini circuit is open')
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError('Gemini circuit is half-open and probing')
+                self._probes_in_flight += 1
+            return self.timeout
+
+    def release(self):
+        """Give back an admitted call that ended without an outcome (e.g. the client went away)"""
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes_in_flight:
+                self._probes_in_flight -= 1
+
+    def record_success(self, latency):
+        self._record(True, latency)
+
+    def record_failure(self, latency):
+        self._record(False, latency)
+
+    def _record(self, ok, latency):
+        now = time.monotonic()
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._transition(CLOSED if ok else OPEN)
+                if ok:
+                    self._calls.append((now, ok, latency))
+                    self._refresh_timeout(self._calls)
+                return
+            if self.state == OPEN:
+                # A call admitted before the circuit opened; it only feeds the timeout estimate
+                return
+            calls = self._window(now)
+            calls.append((now, ok, latency))
+            self._refresh_timeout(calls)
+            if len(calls) >= self.min_calls:
+                errors = sum(1 for _, call_ok, _ in calls if not call_ok)
+                slow = sum(1 for _, _, call_latency in calls if call_latency >= self.slow_call_seconds)
+                if (errors / len(calls) >= self.error_rate_threshold
+                        or slow / len(calls) >= self.slow_call_rate_threshold):
+                    self._transition(OPEN)
+
+    def stats(self):
+        with self._lock:
+            calls = self._window(time.monotonic())
+            errors = sum(1 for _, ok, _ in calls if not ok)
+            slow = sum(1 for _, _, latency in calls if latency >= self.slow_call_seconds)
+            return {
+                'state': self.state,
+                'window_calls': len(calls),
+                'error_rate': round(errors / len(calls), 4) if calls else 0.0,
+                'slow_call_rate': round(slow / len(calls), 4) if calls else 0.0,
+                'timeout_seconds': round(self.timeout, 3),
+                'rejected': self.rejected,
+                'transitions': dict(self.transitions)
+            }
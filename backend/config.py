@@ -7,7 +7,7 @@ load_dotenv()
 class Config:
     # Flask Configuration
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-secret-key-for-sih-2025'
-    DEBUG = os.environ.get('FLASK_DEBUG') or True
+    DEBUG = os.environ.get('FLASK_DEBUG', 'false').lower() in ('1', 'true')
     
     # API Keys (for production use)
     OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
@@ -16,6 +16,76 @@ class Config:
     # Database Configuration
     DATABASE_URL = os.environ.get('DATABASE_URL') or 'sqlite:///medical_chatbot.db'
     
+    # Disease Knowledge Base (reloaded in place when the file changes; 0 disables polling)
+    KNOWLEDGE_BASE_FILE = os.environ.get('KNOWLEDGE_BASE_FILE')  # defaults to data/diseases.json
+    KNOWLEDGE_BASE_POLL_SECONDS = float(os.environ.get('KNOWLEDGE_BASE_POLL_SECONDS', 5))
+    KNOWLEDGE_BASE_CATALOG_DIR = os.environ.get('KNOWLEDGE_BASE_CATALOG_DIR')  # compiled mmap catalogs, defaults to data/.catalog
+    # 'phrase' exact matching (reports 'confidence') or 'bm25' ranked retrieval (reports 'relevance' instead)
+    SYMPTOM_ENGINE = os.environ.get('SYMPTOM_ENGINE', 'phrase')
+    SYMPTOM_LEXICON_FILE = os.environ.get('SYMPTOM_LEXICON_FILE')  # extra native-language symptom/emergency keywords (JSON)
+    
+    # Gemini Client
+    GEMINI_API_ENDPOINT = os.environ.get('GEMINI_API_ENDPOINT')  # e.g. a proxy or local test server
+    GEMINI_TIMEOUT = float(os.environ.get('GEMINI_TIMEOUT', 8))  # upper bound of the adaptive timeout
+    GEMINI_TIMEOUT_MIN = float(os.environ.get('GEMINI_TIMEOUT_MIN', 1))
+    GEMINI_TIMEOUT_P95_MULTIPLIER = float(os.environ.get('GEMINI_TIMEOUT_P95_MULTIPLIER', 2))
+    GEMINI_MAX_CONCURRENCY = int(os.environ.get('GEMINI_MAX_CONCURRENCY', 64))
+    
+    # Gemini circuit breaker: opens on a high error or slow-call rate, then probes after a cool-down
+    GEMINI_BREAKER_WINDOW_SECONDS = float(os.environ.get('GEMINI_BREAKER_WINDOW_SECONDS', 60))
+    GEMINI_BREAKER_MIN_CALLS = int(os.environ.get('GEMINI_BREAKER_MIN_CALLS', 10))
+    GEMINI_BREAKER_ERROR_RATE = float(os.environ.get('GEMINI_BREAKER_ERROR_RATE', 0.5))
+    GEMINI_BREAKER_SLOW_CALL_SECONDS = float(os.environ.get('GEMINI_BREAKER_SLOW_CALL_SECONDS', 5))
+    GEMINI_BREAKER_SLOW_CALL_RATE = float(os.environ.get('GEMINI_BREAKER_SLOW_CALL_RATE', 0.8))
+    GEMINI_BREAKER_OPEN_SECONDS = float(os.environ.get('GEMINI_BREAKER_OPEN_SECONDS', 30))
+    GEMINI_BREAKER_HALF_OPEN_CALLS = int(os.environ.get('GEMINI_BREAKER_HALF_OPEN_CALLS', 1))
+    
+    # Emergency fast path: the rule-based reply goes out at once, the AI explanation can be polled
+    EMERGENCY_AI_FOLLOWUP = os.environ.get('EMERGENCY_AI_FOLLOWUP', 'true').lower() == 'true'
+    FOLLOWUP_TTL_SECONDS = int(os.environ.get('FOLLOWUP_TTL_SECONDS', 300))
+    FOLLOWUP_MAX_ENTRIES = int(os.environ.get('FOLLOWUP_MAX_ENTRIES', 1000))
+    # A poll can reach any worker, so with more than one the results go to the SQLite database
+    FOLLOWUP_STORE = os.environ.get('FOLLOWUP_STORE') or (
+        'sqlite' if int(os.environ.get('WEB_WORKERS', 1)) > 1 else 'memory'
+    )
+    # A file of its own, so follow-up writes never wait on the conversation or cache writers
+    FOLLOWUP_DATABASE_URL = os.environ.get('FOLLOWUP_DATABASE_URL') or 'sqlite:///followups.db'
+    
+    # Gemini Response Cache
+    RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', 1000))
+    RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', 3600))
+    RESPONSE_CACHE_PERSIST = os.environ.get('RESPONSE_CACHE_PERSIST', 'false').lower() == 'true'
+    
+    # Conversation History ('memory' or 'sqlite', stored in DATABASE_URL)
+    # Memory is per process, so with more than one worker (WEB_WORKERS, set by serve.py) history goes to SQLite
+    CONVERSATION_STORE = os.environ.get('CONVERSATION_STORE') or (
+        'sqlite' if int(os.environ.get('WEB_WORKERS', 1)) > 1 else 'memory'
+    )
+    CONVERSATION_MAX_TURNS = int(os.environ.get('CONVERSATION_MAX_TURNS', 20))
+    CONVERSATION_MAX_SESSIONS = int(os.environ.get('CONVERSATION_MAX_SESSIONS', 10000))
+    # Message text kept by the memory store in each worker process (oldest sessions are dropped first)
+    CONVERSATION_MAX_CHARS = int(os.environ.get('CONVERSATION_MAX_CHARS', 20_000_000))
+    CONVERSATION_RETENTION_DAYS = int(os.environ.get('CONVERSATION_RETENTION_DAYS', 30))
+    
+    # Conversation context added to Gemini prompts (estimated tokens)
+    PROMPT_CONTEXT_TOKEN_BUDGET = int(os.environ.get('PROMPT_CONTEXT_TOKEN_BUDGET', 400))
+    PROMPT_CONTEXT_RECENT_TURNS = int(os.environ.get('PROMPT_CONTEXT_RECENT_TURNS', 2))
+    
+    # Semantic (paraphrase) Chat Cache; re-check the threshold with benchmarks/calibrate_semantic_cache.py
+    SEMANTIC_CACHE_ENABLED = os.environ.get('SEMANTIC_CACHE_ENABLED', 'true').lower() == 'true'
+    SEMANTIC_CACHE_SIZE = int(os.environ.get('SEMANTIC_CACHE_SIZE', 500))
+    SEMANTIC_CACHE_THRESHOLD = float(os.environ.get('SEMANTIC_CACHE_THRESHOLD', 0.85))
+    
+    # Translation Memory (SQLite table in DATABASE_URL, checked before Google Translate)
+    TRANSLATION_MEMORY_ENABLED = os.environ.get('TRANSLATION_MEMORY_ENABLED', 'true').lower() == 'true'
+    TRANSLATION_MEMORY_CACHE_SIZE = int(os.environ.get('TRANSLATION_MEMORY_CACHE_SIZE', 10000))
+    TRANSLATION_BATCH_SIZE = int(os.environ.get('TRANSLATION_BATCH_SIZE', 16))  # strings per translator call
+    TRANSLATION_MAX_CONCURRENCY = int(os.environ.get('TRANSLATION_MAX_CONCURRENCY', 8))
+    
+    # Batch Symptom Checks (/api/symptoms-check/batch)
+    SYMPTOMS_BATCH_CHUNK_SIZE = int(os.environ.get('SYMPTOMS_BATCH_CHUNK_SIZE', 256))
+    SYMPTOMS_BATCH_MAX_ITEMS = int(os.environ.get('SYMPTOMS_BATCH_MAX_ITEMS', 100000))
+    
     # Supported Languages for SIH 2025
     SUPPORTED_LANGUAGES = {
         'en': 'English',
@@ -48,4 +118,12 @@ class Config:
     # AI Model Configuration
     AI_MODEL_NAME = 'microsoft/DialoGPT-medium'
     MAX_RESPONSE_LENGTH = 512
-    CONFIDENCE_THRESHOLD = 0.3
\ No newline at end of file
+    CONFIDENCE_THRESHOLD = 0.3
+
+
+def sqlite_path(database_url):
+    """Return the file path from a sqlite:/// URL, or None for other databases"""
+    prefix = 'sqlite:///'
+    if database_url and database_url.startswith(prefix):
+        return database_url[len(prefix):]
+    return None
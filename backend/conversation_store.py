@@ -0,0 +1,300 @@
+# Bounded conversation history storage
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+
+logger = logging.getLogger(__name__)
+
+# Longest message text kept per turn; full responses are never stored
+MAX_MESSAGE_CHARS = 1000
+
+# How long a query waits for another worker's write on the shared file
+BUSY_TIMEOUT_MS = 5000
+
+
+def turn_chars(turn):
+    return len(turn['user_message']) + len(turn['bot_message'])
+
+
+def make_turn(user_message, response, language, timestamp):
+    """Compact record of one chat turn"""
+    return {
+        'user_message': user_message[:MAX_MESSAGE_CHARS],
+        'bot_message': (response.get('message') or '')[:MAX_MESSAGE_CHARS],
+        'response_type': response.get('type', 'general'),
+        'language': language,
+        'timestamp': timestamp
+    }
+
+
+class ConversationStore:
+    """Interface for conversation history backends"""
+
+    def append(self, session_id, turn):
+        raise NotImplementedError
+
+    def recent(self, session_id, limit=None):
+        raise NotImplementedError
+
+    def stats(self):
+        return {}
+
+    def after_fork(self):
+        """Recreate per-process resources in a forked worker"""
+        pass
+
+    def close(self):
+        pass
+
+
+class InMemoryConversationStore(ConversationStore):
+    """Per-session ring buffers with caps on sessions and total message text.
+
+    Each session keeps its last ``max_turns`` turns; when more than
+    ``max_sessions`` sessions exist, or the stored message text of all
+    sessions exceeds ``max_chars``, the least recently active sessions
+    are dropped, so each worker's memory use has a fixed upper bound.
+    """
+
+    def __init__(self, max_turns=20, max_sessions=10000, max_chars=20_000_000):
+        self.max_turns = max_turns
+        self.max_sessions = max_sessions
+        self.max_chars = max_chars
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._chars = 0
+        self.appended = 0
+        self.evicted_sessions = 0
+
+    def append(self, session_id, turn):
+        with self._lock:
+            turns = self._sessions.get(session_id)
+            if turns is None:
+                turns = self._sessions[session_id] = deque(maxlen=self.max_turns)
+            else:
+                self._sessions.move_to_end(session_id)
+            if len(turns) == turns.maxlen:
+                self._chars -= turn_chars(turns[0])
+            turns.append(turn)
+            self._chars += turn_chars(turn)
+            self.appended += 1
+            # The session just written is the newest, so it is only dropped if it alone is over budget
+            while len(self._sessions) > self.max_sessions or (self._chars > self.max_chars and len(self._sessions) > 1):
+                _, evicted = self._sessions.popitem(last=False)
+                self._chars -= sum(turn_chars(old) for old in evicted)
+                self.evicted_sessions += 1
+
+    def recent(self, session_id, limit=None):
+        with self._lock:
+            turns = list(self._sessions.get(session_id, ()))
+        return turns[-limit:] if limit else turns
+
+    def stats(self):
+        with self._lock:
+            return {
+                'backend': 'memory',
+                'sessions': len(self._sessions),
+                'turns_in_memory': sum(len(turns) for turns in self._sessions.values()),
+                'max_turns_per_session': self.max_turns,
+                'max_sessions': self.max_sessions,
+                'stored_chars': self._chars,
+                'max_chars': self.max_chars,
+                'appended': self.appended,
+                'evicted_sessions': self.evicted_sessions
+            }
+
+
+class SQLiteConversationStore(ConversationStore):
+    """Append-only SQLite (WAL) log shared by every worker process.
+
+    Request threads only push onto a bounded queue; a background writer
+    thread inserts turns in batches and periodically deletes rows older
+    than the retention window. History is always read from the database,
+    so a turn written by another worker is seen here; this process's own
+    turns that are still queued are merged in so they are never missing.
+    """
+
+    def __init__(self, db_path, max_turns=20, retention_days=30,
+                 batch_size=200, flush_interval=1.0, compact_interval=3600, max_pending=10000):
+        self.db_path = db_path
+        self.max_turns = max_turns
+        self.retention_seconds = retention_days * 86400
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.compact_interval = compact_interval
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._unwritten = {}  # session_id -> [(created_at, turn)] queued but not yet committed
+        self._unwritten_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._read_lock = threading.Lock()
+        self.appended = 0
+        self.reads = 0
+        self.written = 0
+        self.dropped = 0
+        self.compacted = 0
+        self.last_compaction = None
+
+        self._read_db = self._connect()
+        self._read_db.execute(
+            'CREATE TABLE IF NOT EXISTS conversations ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL, created_at REAL NOT NULL, '
+            'timestamp TEXT, language TEXT, user_message TEXT, bot_message TEXT, response_type TEXT)'
+        )
+        self._read_db.execute(
+            'CREATE INDEX IF NOT EXISTS idx_conversations_session ON conversations (session_id, id)'
+        )
+        self._read_db.execute('CREATE INDEX IF NOT EXISTS idx_conversations_created ON conversations (created_at)')
+        self._read_db.commit()
+
+        self._start_writer()
+        atexit.register(self.close)
+
+    def _start_writer(self):
+        self._writer = threading.Thread(target=self._write_loop, name='conversation-writer', daemon=True)
+        self._writer.start()
+
+    def after_fork(self):
+        # The parent's writer thread and connections are not usable in the child
+        self._pending = queue.Queue(maxsize=self._pending.maxsize)
+        self._unwritten = {}
+        self._unwritten_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._read_lock = threading.Lock()
+        self._read_db = self._connect()
+        self._start_writer()
+
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, check_same_thread=False)
+        db.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    def append(self, session_id, turn):
+        entry = (time.time(), turn)
+        with self._unwritten_lock:
+            self._unwritten.setdefault(session_id, []).append(entry)
+            self.appended += 1
+        try:
+            self._pending.put_nowait((session_id,) + entry)
+        except queue.Full:
+            # Never block a request on disk; the turn is lost from history
+            self._forget_unwritten([(session_id,) + entry])
+            self.dropped += 1
+
+    def recent(self, session_id, limit=None):
+        limit = min(limit or self.max_turns, self.max_turns)
+        # Snapshot the queued turns first: one committed in between shows up in both and is skipped below
+        with self._unwritten_lock:
+            unwritten = list(self._unwritten.get(session_id, ()))
+        with self._read_lock:
+            rows = self._read_db.execute(
+                'SELECT created_at, user_message, bot_message, response_type, language, timestamp '
+                'FROM conversations WHERE session_id = ? ORDER BY id DESC LIMIT ?',
+                (session_id, limit)
+            ).fetchall()
+            self.reads += 1
+        written = {row[0] for row in rows}
+        turns = [
+            {'user_message': row[1], 'bot_message': row[2], 'response_type': row[3],
+             'language': row[4], 'timestamp': row[5]}
+            for row in reversed(rows)
+        ]
+        turns.extend(turn for created_at, turn in unwritten if created_at not in written)
+        return turns[-limit:]
+
+    def _forget_unwritten(self, batch):
+        with self._unwritten_lock:
+            for session_id, created_at, turn in batch:
+                entries = self._unwritten.get(session_id)
+                if not entries:
+                    continue
+                entries[:] = [entry for entry in entries if entry[1] is not turn]
+                if not entries:
+                    del self._unwritten[session_id]
+
+    def _write_loop(self):
+        db = self._connect()
+        next_compaction = time.time()
+        while not (self._stop.is_set() and self._pending.empty()):
+            batch = []
+            try:
+                batch.append(self._pending.get(timeout=self.flush_interval))
+                while len(batch) < self.batch_size:
+                    batch.append(self._pending.get_nowait())
+            except queue.Empty:
+                pass
+
+            if batch:
+                self._write_batch(db, batch)
+            if time.time() >= next_compaction:
+                self._compact(db)
+                next_compaction = time.time() + self.compact_interval
+        db.close()
+
+    def _write_batch(self, db, batch):
+        try:
+            db.executemany(
+                'INSERT INTO conversations (session_id, created_at, timestamp, language, user_message, '
+                'bot_message, response_type) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(session_id, created_at, turn['timestamp'], turn['language'], turn['user_message'],
+                  turn['bot_message'], turn['response_type'])
+                 for session_id, created_at, turn in batch]
+            )
+            db.commit()
+            self.written += len(batch)
+        except sqlite3.Error as e:
+            self.dropped += len(batch)
+            logger.error(f"Failed to write {len(batch)} conversation turns: {e}")
+        self._forget_unwritten(batch)
+
+    def _compact(self, db):
+        """Delete turns older than the retention window"""
+        try:
+            cursor = db.execute('DELETE FROM conversations WHERE created_at < ?',
+                                (time.time() - self.retention_seconds,))
+            db.commit()
+            self.compacted += cursor.rowcount
+            self.last_compaction = time.time()
+            db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        except sqlite3.Error as e:
+            logger.error(f"Conversation compaction failed: {e}")
+
+    def stats(self):
+        with self._unwritten_lock:
+            unwritten_sessions = len(self._unwritten)
+        return {
+            'backend': 'sqlite',
+            'max_turns_per_session': self.max_turns,
+            'appended': self.appended,
+            'reads': self.reads,
+            'pending_writes': self._pending.qsize(),
+            'unwritten_sessions': unwritten_sessions,
+            'written': self.written,
+            'dropped': self.dropped,
+            'compacted': self.compacted,
+            'retention_days': self.retention_seconds / 86400
+        }
+
+    def close(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._writer.join(timeout=10)
+        with self._read_lock:
+            self._read_db.close()
+
+
+def create_conversation_store(backend='memory', db_path=None, **options):
+    """Build the conversation store selected in Config"""
+    if backend == 'sqlite' and db_path:
+        # Sessions live in the database, so there is no per-process session cap
+        options.pop('max_sessions', None)
+        options.pop('max_chars', None)
+        return SQLiteConversationStore(db_path, **options)
+    options.pop('retention_days', None)
+    return InMemoryConversationStore(**options)
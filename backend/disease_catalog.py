@@ -0,0 +1,246 @@
+# Compact, memory-mappable disease catalog
+#
+# Compile with:  python backend/disease_catalog.py data/diseases.json out.catalog
+import json
+import mmap
+import os
+from collections.abc import Mapping
+
+import numpy as np
+
+MAGIC = b'DCATv1\n'
+ALIGNMENT = 8
+MISSING = np.iinfo(np.uint32).max
+
+# Per-disease fields stored as string ids / CSR lists; anything else goes into a JSON "extra" string
+TEXT_FIELDS = ('name', 'description')
+LIST_FIELDS = ('symptoms', 'causes', 'prevention', 'treatment', 'emergency_signs')
+
+
+class StringTable:
+    """Interns strings while compiling a catalog"""
+
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def intern(self, text):
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def to_arrays(self):
+        encoded = [text.encode('utf-8') for text in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+        np.cumsum([len(data) for data in encoded], out=offsets[1:])
+        blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return offsets, blob
+
+
+class DiseaseCatalog(Mapping):
+    """Read-only {disease key: info dict} mapping backed by flat arrays.
+
+    Every string is stored once in a UTF-8 blob and referenced by an
+    integer id; list fields such as symptoms are CSR arrays (indptr +
+    string ids per disease). A catalog saved with ``save`` is opened by
+    ``load`` with mmap, so forked workers share the same physical pages.
+    Info dicts are materialized on access and are safe to mutate.
+    """
+
+    def __init__(self, arrays, version=None, path=None):
+        self.arrays = arrays
+        self.version = version
+        self.path = path
+        self._offsets = arrays['string_offsets']
+        self._blob = arrays['string_blob']
+        self._keys = arrays['keys']
+        self._ordinals = None
+
+    @classmethod
+    def from_dict(cls, disease_data, version=None):
+        """Compile a catalog in memory from the JSON-style nested dicts"""
+        strings = StringTable()
+        count = len(disease_data)
+        arrays = {
+            'keys': np.empty(count, dtype=np.uint32),
+            'extra': np.full(count, MISSING, dtype=np.uint32),
+            'present': np.zeros(count, dtype=np.uint8)
+        }
+        for field in TEXT_FIELDS:
+            arrays[field] = np.full(count, MISSING, dtype=np.uint32)
+        lists = {field: ([0], []) for field in LIST_FIELDS}
+
+        for ordinal, (key, info) in enumerate(disease_data.items()):
+            arrays['keys'][ordinal] = strings.intern(key)
+            for field in TEXT_FIELDS:
+                if field in info:
+                    arrays[field][ordinal] = strings.intern(info[field])
+            for bit, field in enumerate(LIST_FIELDS):
+                indptr, indices = lists[field]
+                if field in info:
+                    arrays['present'][ordinal] |= 1 << bit
+                    indices.extend(strings.intern(item) for item in info[field])
+                indptr.append(len(indices))
+            extra = {name: value for name, value in info.items() if name not in TEXT_FIELDS + LIST_FIELDS}
+            if extra:
+                arrays['extra'][ordinal] = strings.intern(json.dumps(extra, ensure_ascii=False))
+
+        for field, (indptr, indices) in lists.items():
+            arrays[f'{field}_indptr'] = np.asarray(indptr, dtype=np.uint32)
+            arrays[f'{field}_indices'] = np.asarray(indices, dtype=np.uint32)
+        arrays['string_offsets'], arrays['string_blob'] = strings.to_arrays()
+        return cls(arrays, version=version)
+
+    def save(self, path):
+        """Write the catalog atomically (temp file + rename) in the mmap-able format"""
+        layout = {}
+        offset = 0
+        for name, array in self.arrays.items():
+            offset = -(-offset // ALIGNMENT) * ALIGNMENT
+            layout[name] = [offset, array.dtype.str, len(array)]
+            offset += array.nbytes
+        header = json.dumps({'version': self.version, 'arrays': layout}).encode('utf-8')
+        data_start = -(-(len(MAGIC) + 4 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(4, 'little'))
+            f.write(header)
+            for name, array in self.arrays.items():
+                f.seek(data_start + layout[name][0])
+                f.write(np.ascontiguousarray(array).tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Open a saved catalog read-only via mmap"""
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'{path} is not a disease catalog')
+        header_size = int.from_bytes(buffer[len(MAGIC):len(MAGIC) + 4], 'little')
+        header = json.loads(buffer[len(MAGIC) + 4:len(MAGIC) + 4 + header_size])
+        data_start = -(-(len(MAGIC) + 4 + header_size) // ALIGNMENT) * ALIGNMENT
+        arrays = {
+            name: np.frombuffer(buffer, dtype=np.dtype(dtype), count=count, offset=data_start + offset)
+            for name, (offset, dtype, count) in header['arrays'].items()
+        }
+        return cls(arrays, version=header['version'], path=path)
+
+    def string(self, string_id):
+        start, end = int(self._offsets[string_id]), int(self._offsets[string_id + 1])
+        return self._blob[start:end].tobytes().decode('utf-8')
+
+    def key(self, ordinal):
+        return self.string(self._keys[ordinal])
+
+    def name(self, ordinal):
+        return self.string(self.arrays['name'][ordinal])
+
+    def list_ids(self, field, ordinal):
+        """String ids of one disease's list field (e.g. its symptoms)"""
+        indptr = self.arrays[f'{field}_indptr']
+        return self.arrays[f'{field}_indices'][indptr[ordinal]:indptr[ordinal + 1]]
+
+    def list_lengths(self, field):
+        return np.diff(self.arrays[f'{field}_indptr'])
+
+    def ordinal(self, key):
+        """Position of a disease key, or None"""
+        if self._ordinals is None:
+            self._ordinals = {self.key(ordinal): ordinal for ordinal in range(len(self))}
+        return self._ordinals.get(key)
+
+    def info(self, ordinal):
+        """Materialize one disease as the original nested dict"""
+        info = {}
+        for field in TEXT_FIELDS:
+            string_id = self.arrays[field][ordinal]
+            if string_id != MISSING:
+                info[field] = self.string(string_id)
+        present = int(self.arrays['present'][ordinal])
+        for bit, field in enumerate(LIST_FIELDS):
+            if present & (1 << bit):
+                info[field] = [self.string(string_id) for string_id in self.list_ids(field, ordinal)]
+        info.update(self.extra(ordinal))
+        return info
+
+    def extra(self, ordinal):
+        """Fields outside the fixed schema (e.g. aliases) for one disease"""
+        extra_id = self.arrays['extra'][ordinal]
+        return json.loads(self.string(extra_id)) if extra_id != MISSING else {}
+
+    def summaries(self):
+        """(key, name, symptom count) per disease without materializing full entries"""
+        counts = self.list_lengths('symptoms')
+        for ordinal in range(len(self)):
+            yield self.key(ordinal), self.name(ordinal), int(counts[ordinal])
+
+    def __getitem__(self, key):
+        ordinal = self.ordinal(key)
+        if ordinal is None:
+            raise KeyError(key)
+        return self.info(ordinal)
+
+    def __iter__(self):
+        for ordinal in range(len(self)):
+            yield self.key(ordinal)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def stats(self):
+        return {
+            'diseases': len(self),
+            'strings': len(self._offsets) - 1,
+            'bytes': sum(array.nbytes for array in self.arrays.values()),
+            'mmapped': self.path is not None
+        }
+
+
+def catalog_path(cache_dir, name, version):
+    return os.path.join(cache_dir, f'{name}.{version}.catalog')
+
+
+def open_catalog(disease_data, version, cache_dir=None, name='diseases'):
+    """Return a catalog for this data version, compiling and caching it under cache_dir.
+
+    Workers that reload the same version map the same file instead of
+    each building a private copy. Falls back to an in-memory catalog if
+    the cache directory is not writable.
+    """
+    if not cache_dir:
+        return DiseaseCatalog.from_dict(disease_data, version=version)
+    path = catalog_path(cache_dir, name, version)
+    try:
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, exist_ok=True)
+            DiseaseCatalog.from_dict(disease_data, version=version).save(path)
+        return DiseaseCatalog.load(path)
+    except (OSError, ValueError):
+        return DiseaseCatalog.from_dict(disease_data, version=version)
+
+
+def prune_catalogs(cache_dir, keep_version, name='diseases'):
+    """Delete compiled catalogs for other versions (mapped files stay valid until unmapped)"""
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return
+    keep = os.path.basename(catalog_path(cache_dir, name, keep_version))
+    for filename in os.listdir(cache_dir):
+        if filename.startswith(f'{name}.') and filename.endswith('.catalog') and filename != keep:
+            try:
+                os.remove(os.path.join(cache_dir, filename))
+            except OSError:
+                pass
+
+
+if __name__ == '__main__':
+    import sys
+    source, target = sys.argv[1], sys.argv[2]
+    with open(source, encoding='utf-8') as f:
+        catalog = DiseaseCatalog.from_dict(json.load(f))
+    catalog.save(target)
+    print(f"Wrote {target}: {DiseaseCatalog.load(target).stats()}")
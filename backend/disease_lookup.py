@@ -0,0 +1,88 @@
+# Constant-time disease lookup and prefix autocomplete
+import bisect
+import re
+import unicodedata
+
+
+def normalize_term(text):
+    """Case- and width-insensitive form used for lookups (underscores count as spaces)"""
+    text = unicodedata.normalize('NFKC', text).casefold().replace('_', ' ')
+    return ' '.join(text.split())
+
+
+def name_variants(name):
+    """A display name plus its parts, e.g. 'Tuberculosis (TB)' -> the name, 'Tuberculosis', 'TB'"""
+    variants = [name]
+    match = re.match(r'^(.*?)\s*\(([^)]+)\)\s*$', name)
+    if match:
+        variants.extend(part for part in match.groups() if part)
+    return variants
+
+
+class DiseaseLookup:
+    """Resolves keys, display names, aliases and regional terms to catalog ordinals.
+
+    ``find`` is a single dict lookup. ``complete`` bisects a sorted list
+    of every term, so a prefix query costs O(log n + results) no matter
+    how large the catalog is.
+    """
+
+    def __init__(self, catalog, regional_terms=None):
+        self.catalog = catalog
+        self._exact = {}
+        self._sources = {}  # term -> 'key' | 'name' | 'alias' | language code
+
+        for ordinal in range(len(catalog)):
+            self._add(catalog.key(ordinal), ordinal, 'key')
+            for variant in name_variants(catalog.name(ordinal)):
+                self._add(variant, ordinal, 'name')
+        # Aliases are an optional per-disease list in the data file
+        for ordinal in range(len(catalog)):
+            for alias in catalog.extra(ordinal).get('aliases', []):
+                self._add(alias, ordinal, 'alias')
+        # Regional-language names for English terms that resolve to a disease
+        for language, terms in (regional_terms or {}).items():
+            for english, regional in terms.items():
+                ordinal = self._exact.get(normalize_term(english))
+                if ordinal is not None:
+                    self._add(regional, ordinal, language)
+
+        self._sorted_terms = sorted(self._exact)
+
+    def _add(self, term, ordinal, source):
+        term = normalize_term(term)
+        # The first writer wins so a key or display name is never shadowed by an alias
+        if term and term not in self._exact:
+            self._exact[term] = ordinal
+            self._sources[term] = source
+
+    def find(self, name):
+        """Catalog ordinal for a key, name, alias or regional term, or None"""
+        return self._exact.get(normalize_term(name))
+
+    def complete(self, prefix, limit=10):
+        """Up to ``limit`` diseases with a term starting with ``prefix``, in term order"""
+        prefix = normalize_term(prefix)
+        if not prefix:
+            return []
+        suggestions = []
+        seen = set()
+        position = bisect.bisect_left(self._sorted_terms, prefix)
+        while position < len(self._sorted_terms) and len(suggestions) < limit:
+            term = self._sorted_terms[position]
+            if not term.startswith(prefix):
+                break
+            ordinal = self._exact[term]
+            if ordinal not in seen:
+                seen.add(ordinal)
+                suggestions.append({
+                    'id': self.catalog.key(ordinal),
+                    'name': self.catalog.name(ordinal),
+                    'match': term,
+                    'match_type': self._sources[term]
+                })
+            position += 1
+        return suggestions
+
+    def __len__(self):
+        return len(self._exact)
@@ -0,0 +1,240 @@
+# Background AI follow-ups for responses that are sent before the model answers
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# How long a write waits for another worker's transaction on the shared file
+BUSY_TIMEOUT_MS = 5000
+
+# An id is the creation time in milliseconds (12 hex digits) followed by a random uuid4
+ID_TIME_DIGITS = 12
+ID_LENGTH = ID_TIME_DIGITS + 32
+
+
+def new_followup_id(created_at):
+    return f'{int(created_at * 1000):0{ID_TIME_DIGITS}x}{uuid.uuid4().hex}'
+
+
+def followup_created_at(followup_id):
+    """Creation time encoded in a follow-up id, or None if the id is malformed"""
+    if len(followup_id) != ID_LENGTH:
+        return None
+    try:
+        int(followup_id, 16)
+    except ValueError:
+        return None
+    return int(followup_id[:ID_TIME_DIGITS], 16) / 1000
+
+
+class FollowupStore:
+    """Runs slow work (a Gemini explanation) in the background and keeps the result for polling.
+
+    ``submit`` returns an id right away; ``get`` reports the job as
+    pending, done or failed. Results live for ``ttl_seconds`` and at most
+    ``max_entries`` jobs are kept, oldest dropped first.
+
+    With ``db_path`` every job's status and result are also written to a
+    SQLite table, so a poll that lands on another worker process than the
+    one running the job still finds it. Request threads only queue those
+    writes; a background writer thread commits them in order and clears
+    expired rows. A recent id whose row is not written yet reads as pending.
+    """
+
+    def __init__(self, max_entries=1000, ttl_seconds=300, db_path=None,
+                 flush_interval=0.5, max_pending_writes=10000):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self._jobs = OrderedDict()  # id -> (future, created_at)
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._writes = queue.Queue(maxsize=max_pending_writes)
+        self._stop = threading.Event()
+        self._writer = None
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.evicted = 0
+        self.dropped_writes = 0
+
+        if db_path:
+            self._db = self._connect()
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS followups ('
+                'id TEXT PRIMARY KEY, status TEXT NOT NULL, result TEXT, created_at REAL NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS idx_followups_created ON followups (created_at)')
+            self._db.commit()
+            self._start_writer()
+            atexit.register(self.close)
+
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, check_same_thread=False)
+        db.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    def _start_writer(self):
+        self._writer = threading.Thread(target=self._write_loop, name='followup-writer', daemon=True)
+        self._writer.start()
+
+    def after_fork(self):
+        """Drop the parent's jobs and restart the SQLite writer in a forked worker"""
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._writes = queue.Queue(maxsize=self._writes.maxsize)
+        self._stop = threading.Event()
+        if self._db is not None:
+            self._db = self._connect()
+            self._start_writer()
+
+    def submit(self, executor, fn, *args):
+        """Start fn(*args) on the executor and return the follow-up id"""
+        created_at = time.time()
+        followup_id = new_followup_id(created_at)
+        # Queued before the job starts, so the row always exists when its result is written
+        self._queue_write(
+            'INSERT OR REPLACE INTO followups (id, status, result, created_at) VALUES (?, ?, NULL, ?)',
+            (followup_id, 'pending', created_at)
+        )
+        future = executor.submit(fn, *args)
+        future.add_done_callback(lambda done: self._record(followup_id, done))
+        with self._lock:
+            self._jobs[followup_id] = (future, created_at)
+            self.submitted += 1
+            self._prune()
+        return followup_id
+
+    def _record(self, followup_id, future):
+        failed = future.cancelled() or future.exception() is not None
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.completed += 1
+        self._queue_write(
+            'UPDATE followups SET status = ?, result = ? WHERE id = ?',
+            ('failed', None, followup_id) if failed else ('done', future.result(), followup_id)
+        )
+
+    def _queue_write(self, sql, params):
+        if self._db is None:
+            return
+        try:
+            self._writes.put_nowait((sql, params))
+        except queue.Full:
+            # Never block a request on disk; other workers see the job as pending until it expires
+            with self._lock:
+                self.dropped_writes += 1
+
+    def _write_loop(self):
+        db = self._connect()
+        next_prune = time.time()
+        while not (self._stop.is_set() and self._writes.empty()):
+            batch = []
+            try:
+                batch.append(self._writes.get(timeout=self.flush_interval))
+                while True:
+                    batch.append(self._writes.get_nowait())
+            except queue.Empty:
+                pass
+
+            now = time.time()
+            if now >= next_prune:
+                # Expired rows are cleared a few times per TTL
+                next_prune = now + self.ttl_seconds / 10
+                batch.append(('DELETE FROM followups WHERE created_at < ?', (now - self.ttl_seconds,)))
+            if batch:
+                self._write_batch(db, batch)
+        db.close()
+
+    def _write_batch(self, db, batch):
+        """Run [(sql, params)] in one transaction"""
+        try:
+            with db:
+                for sql, params in batch:
+                    db.execute(sql, params)
+        except sqlite3.Error as e:
+            with self._lock:
+                self.dropped_writes += len(batch)
+            logger.warning(f"Follow-up write of {len(batch)} statements failed: {e}")
+
+    def _prune(self):
+        cutoff = time.time() - self.ttl_seconds
+        while self._jobs:
+            followup_id, (future, created_at) = next(iter(self._jobs.items()))
+            if created_at >= cutoff and len(self._jobs) <= self.max_entries:
+                break
+            del self._jobs[followup_id]
+            self.evicted += 1
+
+    def get(self, followup_id):
+        """{'status': 'pending' | 'done' | 'failed', ...}, or None for an unknown or expired id"""
+        with self._lock:
+            self._prune()
+            job = self._jobs.get(followup_id)
+        if job is None:
+            return self._get_shared(followup_id)
+        future = job[0]
+        if not future.done():
+            return {'status': 'pending'}
+        if future.cancelled() or future.exception() is not None:
+            return {'status': 'failed'}
+        return {'status': 'done', 'result': future.result()}
+
+    def _get_shared(self, followup_id):
+        """A job started by another worker, read from SQLite"""
+        if self._db is None:
+            return None
+        created_at = followup_created_at(followup_id)
+        now = time.time()
+        # Malformed, expired or not yet issued ids are never looked up
+        if created_at is None or not now - self.ttl_seconds <= created_at <= now + 1:
+            return None
+        with self._db_lock:
+            try:
+                row = self._db.execute(
+                    'SELECT status, result FROM followups WHERE id = ?', (followup_id,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Follow-up read failed: {e}")
+                row = None
+        if row is None:
+            # The worker that issued the id may not have written its row yet
+            return {'status': 'pending'}
+        status, result = row
+        return {'status': status, 'result': result} if status == 'done' else {'status': status}
+
+    def stats(self):
+        with self._lock:
+            return {
+                'backend': 'sqlite' if self._db is not None else 'memory',
+                'tracked': len(self._jobs),
+                'pending': sum(1 for future, _ in self._jobs.values() if not future.done()),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'evicted': self.evicted,
+                'pending_writes': self._writes.qsize(),
+                'dropped_writes': self.dropped_writes
+            }
+
+    def close(self):
+        """Flush queued writes and stop the writer thread"""
+        if self._writer is None or self._stop.is_set():
+            return
+        self._stop.set()
+        self._writer.join(timeout=10)
+        with self._db_lock:
+            self._db.close()
@@ -1,12 +1,33 @@
-from flask import Flask, request, jsonify, render_template_string, send_from_directory
+from flask import Flask, Response, request, jsonify, render_template_string, send_from_directory, stream_with_context
 from flask_cors import CORS
+import asyncio
 import json
 import os
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import time
+import uuid
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from canned_responses import canned_text
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from config import Config, sqlite_path
+from conversation_store import create_conversation_store, make_turn
+from followup_store import FollowupStore
+from knowledge_base import DEFAULT_CATALOG_DIR, DEFAULT_DATA_FILE, KnowledgeBase
+from language_detector import detect_language
+from multilingual import MEDICAL_TERMS
+from prompt_assembler import PromptAssembler
+from response_cache import ResponseCache
+from response_registry import ResponseRegistry
+from semantic_cache import SemanticCache
+from single_flight import SingleFlight
+from static_assets import StaticAssets
+from symptom_lexicon import build_lexicon
+from translation_memory import create_translation_memory
+
 # Load environment variables
 load_dotenv()
 
@@ -19,17 +40,117 @@ CORS(app)
 
 class MedicalChatbot:
     def __init__(self):
-        self.disease_data = self.load_disease_data()
-        self.conversation_history = []
+        symptom_lexicon = build_lexicon(MEDICAL_TERMS, Config.SYMPTOM_LEXICON_FILE)
+        self.knowledge = KnowledgeBase(
+            Config.KNOWLEDGE_BASE_FILE or DEFAULT_DATA_FILE,
+            default_data=self.get_default_disease_data(),
+            poll_interval=Config.KNOWLEDGE_BASE_POLL_SECONDS,
+            catalog_dir=Config.KNOWLEDGE_BASE_CATALOG_DIR or DEFAULT_CATALOG_DIR,
+            regional_terms=MEDICAL_TERMS,
+            symptom_engine=Config.SYMPTOM_ENGINE,
+            symptom_lexicon=symptom_lexicon
+        )
+        self.conversation_store = create_conversation_store(
+            Config.CONVERSATION_STORE,
+            db_path=sqlite_path(Config.DATABASE_URL),
+            max_turns=Config.CONVERSATION_MAX_TURNS,
+            max_sessions=Config.CONVERSATION_MAX_SESSIONS,
+            max_chars=Config.CONVERSATION_MAX_CHARS,
+            retention_days=Config.CONVERSATION_RETENTION_DAYS
+        )
+        self.response_cache = ResponseCache(
+            max_entries=Config.RESPONSE_CACHE_SIZE,
+            ttl_seconds=Config.RESPONSE_CACHE_TTL,
+            db_path=sqlite_path(Config.DATABASE_URL) if Config.RESPONSE_CACHE_PERSIST else None
+        )
+        self.prompt_assembler = PromptAssembler(
+            token_budget=Config.PROMPT_CONTEXT_TOKEN_BUDGET,
+            recent_turns=Config.PROMPT_CONTEXT_RECENT_TURNS
+        )
+        self.semantic_cache = SemanticCache(
+            max_entries=Config.SEMANTIC_CACHE_SIZE,
+            threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+            lexicon=symptom_lexicon
+        ) if Config.SEMANTIC_CACHE_ENABLED else None
+        self.followups = FollowupStore(
+            max_entries=Config.FOLLOWUP_MAX_ENTRIES,
+            ttl_seconds=Config.FOLLOWUP_TTL_SECONDS,
+            db_path=sqlite_path(Config.FOLLOWUP_DATABASE_URL) if Config.FOLLOWUP_STORE == 'sqlite' else None
+        )
+        self.gemini_breaker = CircuitBreaker(
+            window_seconds=Config.GEMINI_BREAKER_WINDOW_SECONDS,
+            min_calls=Config.GEMINI_BREAKER_MIN_CALLS,
+            error_rate_threshold=Config.GEMINI_BREAKER_ERROR_RATE,
+            slow_call_seconds=Config.GEMINI_BREAKER_SLOW_CALL_SECONDS,
+            slow_call_rate_threshold=Config.GEMINI_BREAKER_SLOW_CALL_RATE,
+            open_seconds=Config.GEMINI_BREAKER_OPEN_SECONDS,
+            half_open_calls=Config.GEMINI_BREAKER_HALF_OPEN_CALLS,
+            min_timeout=Config.GEMINI_TIMEOUT_MIN,
+            max_timeout=Config.GEMINI_TIMEOUT,
+            timeout_multiplier=Config.GEMINI_TIMEOUT_P95_MULTIPLIER
+        )
+        self.gemini_flights = SingleFlight()
+        # Shared SQLite translation memory. Nothing here translates, so /api/metrics reports
+        # how much is stored rather than lookup hit rates
+        self.translation_memory = create_translation_memory()
+        self.create_executors()
         self.setup_gemini()
         
+    def create_executors(self):
+        # Only call_gemini runs on the Gemini pool, so its threads never wait on a shared
+        # in-flight call; follow-up jobs, which may, get a pool of their own
+        self.gemini_executor = ThreadPoolExecutor(max_workers=Config.GEMINI_MAX_CONCURRENCY,
+                                                  thread_name_prefix='gemini')
+        self.followup_executor = ThreadPoolExecutor(max_workers=Config.GEMINI_MAX_CONCURRENCY,
+                                                    thread_name_prefix='followup')
+    
+    # Read through the active knowledge snapshot so a reload is picked up atomically
+    @property
+    def disease_data(self):
+        return self.knowledge.current.disease_data
+    
+    @property
+    def symptom_index(self):
+        return self.knowledge.current.symptom_index
+    
+    @property
+    def keyword_router(self):
+        return self.knowledge.current.keyword_router
+    
+    @property
+    def data_version(self):
+        return self.knowledge.current.version
+    
+    def after_fork(self):
+        """Re-create threads and database handles in a forked server worker"""
+        self.create_executors()
+        self.knowledge.after_fork()
+        self.response_cache.after_fork()
+        self.conversation_store.after_fork()
+        self.followups.after_fork()
+        if self.translation_memory is not None:
+            self.translation_memory.after_fork()
+    
+    def shutdown(self):
+        """Flush pending writes and stop background threads"""
+        self.knowledge.stop()
+        self.conversation_store.close()
+        self.followups.close()
+        self.gemini_executor.shutdown(wait=False, cancel_futures=True)
+        self.followup_executor.shutdown(wait=False, cancel_futures=True)
+    
     def setup_gemini(self):
         """Initialize Gemini AI model"""
         try:
             # Configure Gemini API
             api_key = os.getenv('GEMINI_API_KEY')
             if api_key and api_key != 'your_gemini_api_key_here':
-                genai.configure(api_key=api_key)
+                if Config.GEMINI_API_ENDPOINT:
+                    # Custom endpoint (proxy or local test server) over REST
+                    genai.configure(api_key=api_key, transport='rest',
+                                    client_options={'api_endpoint': Config.GEMINI_API_ENDPOINT})
+                else:
+                    genai.configure(api_key=api_key)
                 self.gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
                 self.gemini_enabled = True
                 logger.info("Gemini 2.0 Flash model initialized successfully")
@@ -40,7 +161,7 @@ class MedicalChatbot:
             self.gemini_enabled = False
             logger.error(f"Failed to initialize Gemini: {e}")
     
-    def get_medical_prompt(self, user_message):
+    def get_medical_prompt(self, user_message, context=''):
         """Create specialized medical prompt for Gemini"""
         
         # Check if it's a greeting or general chat
@@ -63,7 +184,8 @@ Respond: "I'm a medical assistant focused on health-related questions. For math
 
 Keep it under 50 words."""
         
-        # For medical queries
+        # For medical queries, with earlier turns of this session if any
+        context_block = f"CONVERSATION SO FAR:\n{context}\n\n" if context else ''
         prompt = f"""You are an AI medical assistant. Provide VERY SHORT, focused medical information.
 
 STRICT RULES:
@@ -73,7 +195,7 @@ STRICT RULES:
 - Brief advice only
 - Always end with "Consult a doctor"
 
-USER: {user_message}
+{context_block}USER: {user_message}
 
 Format (use these exact HTML colors):
 <span style="color: #3498db; font-weight: bold;">🔍 Possible causes:</span>
@@ -94,20 +216,6 @@ Consult a doctor for proper diagnosis."""
         
         return prompt
         
-    def load_disease_data(self):
-        """Load disease information from JSON file"""
-        try:
-            # Try relative path first, then absolute path
-            data_file = '../data/diseases.json'
-            if not os.path.exists(data_file):
-                data_file = '/workspaces/AI_Medical_chatbot/data/diseases.json'
-            
-            with open(data_file, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.warning("Disease data file not found, using default data")
-            return self.get_default_disease_data()
-    
     def get_default_disease_data(self):
         """Default disease data for demo purposes"""
         return {
@@ -122,117 +230,304 @@ Consult a doctor for proper diagnosis."""
             }
         }
     
-    def analyze_symptoms(self, symptoms_text):
+    def analyze_symptoms(self, symptoms_text, matches=None):
         """Analyze symptoms and suggest possible conditions"""
-        symptoms_text = symptoms_text.lower()
-        possible_diseases = []
-        
-        for disease, info in self.disease_data.items():
-            symptom_matches = 0
-            for symptom in info['symptoms']:
-                if symptom.lower() in symptoms_text:
-                    symptom_matches += 1
-            
-            if symptom_matches > 0:
-                confidence = (symptom_matches / len(info['symptoms'])) * 100
-                possible_diseases.append({
-                    'disease': info['name'],
-                    'confidence': round(confidence, 2),
-                    'matched_symptoms': symptom_matches
-                })
-        
-        # Sort by confidence
-        possible_diseases.sort(key=lambda x: x['confidence'], reverse=True)
-        return possible_diseases[:3]  # Return top 3 matches
+        snapshot = self.knowledge.current
+        # Native-language symptom words are glossed with their English keywords from the lexicon
+        symptoms_text = snapshot.keyword_router.gloss(symptoms_text, matches)
+        # Top 3 matches from the precomputed symptom engine (BM25 or phrase index)
+        return snapshot.symptom_index.score(symptoms_text, limit=3)
+    
+    def analyze_symptoms_batch(self, symptom_texts, limit=3, snapshot=None):
+        """Score many symptom texts at once (vectorized); one result list per text"""
+        # A streamed batch passes its snapshot so every chunk uses the same dataset version
+        snapshot = snapshot or self.knowledge.current
+        symptom_texts = [snapshot.keyword_router.gloss(text) for text in symptom_texts]
+        return snapshot.symptom_index.score_batch(symptom_texts, limit=limit)
     
     def get_disease_info(self, disease_name):
         """Get detailed information about a specific disease"""
-        disease_name = disease_name.lower()
-        for key, info in self.disease_data.items():
-            if key.lower() == disease_name or info['name'].lower() == disease_name:
-                return info
-        return None
+        snapshot = self.knowledge.current
+        # Keys, display names, aliases and regional names in one dict lookup
+        ordinal = snapshot.lookup.find(disease_name)
+        return snapshot.disease_data.info(ordinal) if ordinal is not None else None
     
-    def generate_response(self, user_input, language='en'):
+    def generate_response(self, user_input, language='en', context=''):
         """Generate chatbot response using Gemini AI with rule-based fallback"""
         
+        # Classify the message against all keyword classes in one pass
+        matches = self.keyword_router.classify(user_input)
+        
+        # Emergencies get the ambulance number before any cache lookup or model call
+        if matches.has('emergency'):
+            return self.emergency_response(user_input, language, matches, context)
+        
+        # Serve paraphrases of already answered questions locally (never emergencies)
+        cached_response = self.lookup_semantic_cache(user_input, language, matches, context)
+        if cached_response:
+            return cached_response
+        
         # Try Gemini AI first if available
         if self.gemini_enabled:
             try:
-                gemini_response = self.get_gemini_response(user_input)
+                gemini_response = self.get_gemini_response(user_input, matches, context)
                 if gemini_response:
+                    self.remember_response(user_input, gemini_response, language, matches, context)
                     return gemini_response
             except Exception as e:
                 logger.warning(f"Gemini API failed, falling back to rule-based system: {e}")
         
         # Fallback to rule-based system
-        return self.get_rule_based_response(user_input, language)
+        return self.get_rule_based_response(user_input, language, matches)
+    
+    async def generate_response_async(self, user_input, language='en', context=''):
+        """Non-blocking generate_response: awaits Gemini with a timeout, hedged by the rule-based answer"""
+        matches = self.keyword_router.classify(user_input)
+        
+        if matches.has('emergency'):
+            return self.emergency_response(user_input, language, matches, context)
+        
+        cached_response = self.lookup_semantic_cache(user_input, language, matches, context)
+        if cached_response:
+            return cached_response
+        
+        if not self.gemini_enabled:
+            return self.get_rule_based_response(user_input, language, matches)
+        
+        # Start the Gemini call, then build the rule-based answer while it is in flight
+        gemini_task = asyncio.ensure_future(
+            self.get_gemini_completion_async(self.get_medical_prompt(user_input, context))
+        )
+        fallback_response = self.get_rule_based_response(user_input, language, matches)
+        
+        # Policy: the Gemini answer wins if it arrives within the timeout
+        try:
+            ai_text = await gemini_task
+        except CircuitOpenError:
+            return fallback_response
+        except Exception as e:
+            logger.warning(f"Gemini API failed or timed out, using rule-based response: {e!r}")
+            return fallback_response
+        
+        gemini_response = self.format_gemini_response(ai_text, matches)
+        self.remember_response(user_input, gemini_response, language, matches, context)
+        return gemini_response
+    
+    def emergency_response(self, user_input, language, matches, context=''):
+        """Rule-based emergency payload, returned without waiting for the model.
+
+        When Gemini is available its explanation is generated in the
+        background and can be polled at the returned ``ai_followup`` URL.
+        """
+        response = self.get_rule_based_response(user_input, language, matches)
+        if self.gemini_enabled and Config.EMERGENCY_AI_FOLLOWUP:
+            followup_id = self.followups.submit(
+                self.followup_executor, self.get_gemini_completion, self.get_medical_prompt(user_input, context)
+            )
+            response['ai_followup'] = {'id': followup_id, 'url': f'/api/chat/followup/{followup_id}'}
+        return response
+    
+    def stream_response(self, user_input, language='en', context=''):
+        """Yield (event, data) pairs: the emergency classification first, then Gemini text chunks, then the final response"""
+        matches = self.keyword_router.classify(user_input)
+        
+        # Classification goes out before any model text so the emergency banner renders immediately
+        classification = {'is_emergency': matches.has('emergency'), 'labels': matches.labels()}
+        if classification['is_emergency']:
+            classification['emergency'] = self.get_rule_based_response(user_input, language, matches)
+        yield 'classification', classification
+        
+        cached_response = self.lookup_semantic_cache(user_input, language, matches, context)
+        if cached_response:
+            yield 'done', cached_response
+            return
+        
+        if self.gemini_enabled:
+            try:
+                chunks = []
+                for chunk in self.stream_gemini_completion(self.get_medical_prompt(user_input, context)):
+                    chunks.append(chunk)
+                    yield 'delta', {'text': chunk}
+                gemini_response = self.format_gemini_response(''.join(chunks), matches)
+                self.remember_response(user_input, gemini_response, language, matches, context)
+                yield 'done', gemini_response
+                return
+            except CircuitOpenError:
+                pass
+            except Exception as e:
+                logger.warning(f"Gemini streaming failed, falling back to rule-based system: {e}")
+        
+        yield 'done', self.get_rule_based_response(user_input, language, matches)
+    
+    def build_conversation_context(self, session_id):
+        """Summarize the session's earlier turns within the prompt token budget"""
+        turns = self.conversation_store.recent(session_id)
+        return self.prompt_assembler.assemble(turns)
+    
+    def lookup_semantic_cache(self, user_input, language, matches, context=''):
+        """Return a cached answer for a paraphrased question, or None"""
+        # Follow-ups depend on earlier turns, so only stand-alone questions are shared
+        if self.semantic_cache is None or matches.has('emergency') or context:
+            return None
+        cached = self.semantic_cache.lookup(user_input, language)
+        if not cached:
+            return None
+        response, similarity = cached
+        response['semantic_cache_similarity'] = round(similarity, 3)
+        return response
+    
+    def remember_response(self, user_input, response, language, matches, context=''):
+        """Add a fresh Gemini answer to the semantic cache"""
+        if self.semantic_cache is None or matches.has('emergency') or context:
+            return
+        if response['type'] == 'ai_analysis':
+            self.semantic_cache.add(user_input, response, language)
     
-    def get_gemini_response(self, user_input):
+    def get_gemini_response(self, user_input, matches=None, context=''):
         """Get response from Gemini AI"""
         try:
-            prompt = self.get_medical_prompt(user_input)
-            response = self.gemini_model.generate_content(prompt)
+            prompt = self.get_medical_prompt(user_input, context)
+            ai_text = self.get_gemini_completion(prompt)
             
             # Analyze for emergency keywords to ensure safety
-            emergency_keywords = ['emergency', 'urgent', 'chest pain', 'difficulty breathing', 
-                                'unconscious', 'severe pain', 'heart attack', 'stroke', 
-                                'suicide', 'self harm', 'blood in vomit', 'severe bleeding',
-                                'cannot breathe', 'choking', 'severe allergic reaction']
-            
-            is_emergency = any(keyword in user_input.lower() for keyword in emergency_keywords)
-            
-            if is_emergency:
-                return {
-                    'type': 'emergency',
-                    'message': '⚠️ MEDICAL EMERGENCY DETECTED ⚠️\n\nThis seems like a medical emergency. Please call emergency services immediately!',
-                    'ai_response': response.text,
-                    'emergency_contacts': {
-                        'ambulance': '108',
-                        'police': '100',
-                        'fire': '101',
-                        'national_helpline': '1800-180-1104',
-                        'mental_health': '08046110007'
-                    },
-                    'immediate_advice': 'If this is a life-threatening emergency, call 108 immediately. Do not delay seeking professional medical help.',
-                    'powered_by': 'Gemini 2.0 Flash + Emergency Detection'
-                }
-            else:
-                return {
-                    'type': 'ai_analysis',
-                    'message': response.text,
-                    'disclaimer': '⚠️ This AI-generated response is for informational purposes only. Always consult healthcare professionals for medical advice.',
-                    'powered_by': 'Google Gemini 2.0 Flash',
-                    'confidence': 'AI-powered analysis'
-                }
-                
+            if matches is None:
+                matches = self.keyword_router.classify(user_input)
+            return self.format_gemini_response(ai_text, matches)
+        
+        except CircuitOpenError:
+            # Gemini is failing; answer from the rules without waiting
+            return None
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
             return None
     
-    def get_rule_based_response(self, user_input, language='en'):
+    def format_gemini_response(self, ai_text, matches):
+        """Wrap Gemini's text in the chat response payload"""
+        if matches.has('emergency'):
+            return {
+                'type': 'emergency',
+                'message': '⚠️ MEDICAL EMERGENCY DETECTED ⚠️\n\nThis seems like a medical emergency. Please call emergency services immediately!',
+                'ai_response': ai_text,
+                'emergency_contacts': {
+                    'ambulance': '108',
+                    'police': '100',
+                    'fire': '101',
+                    'national_helpline': '1800-180-1104',
+                    'mental_health': '08046110007'
+                },
+                'immediate_advice': 'If this is a life-threatening emergency, call 108 immediately. Do not delay seeking professional medical help.',
+                'powered_by': 'Gemini 2.0 Flash + Emergency Detection'
+            }
+        else:
+            return {
+                'type': 'ai_analysis',
+                'message': ai_text,
+                'disclaimer': '⚠️ This AI-generated response is for informational purposes only. Always consult healthcare professionals for medical advice.',
+                'powered_by': 'Google Gemini 2.0 Flash',
+                'confidence': 'AI-powered analysis'
+            }
+    
+    def get_gemini_completion(self, prompt):
+        """Return Gemini's text for a prompt, served from the response cache when possible"""
+        cache_key = self.response_cache.make_key(prompt)
+        ai_text = self.response_cache.get(cache_key)
+        if ai_text is None:
+            def fetch():
+                # Runs for the leader only, so the cache is written once per upstream call
+                text = self.generate_gemini_text(prompt)
+                self.response_cache.put(cache_key, text)
+                return text
+            
+            # Identical prompts already in flight share that call instead of starting another.
+            # Followers wait as long as it takes: the call is bounded by its own request timeout
+            ai_text = self.gemini_flights.do(cache_key, fetch)
+        return ai_text
+    
+    async def get_gemini_completion_async(self, prompt):
+        """Awaitable get_gemini_completion; the blocking SDK call runs on the Gemini thread pool"""
+        cache_key = self.response_cache.make_key(prompt)
+        ai_text = self.response_cache.get(cache_key)
+        if ai_text is None:
+            def fetch(timeout):
+                text = self.call_gemini(prompt, timeout)
+                self.response_cache.put(cache_key, text)
+                return text
+            
+            def start():
+                # Rejected here while the circuit is open, before a thread is taken
+                timeout = self.gemini_breaker.acquire()
+                future = self.gemini_executor.submit(fetch, timeout)
+                future.gemini_timeout = timeout
+                return future
+            
+            future = self.gemini_flights.submit(cache_key, start)
+            # Every caller waits the leader's timeout from its own arrival, so no follower gives up
+            # before the leader would; a leader on the sync path runs inline with at most the
+            # breaker's longest timeout. Shielded so one caller's timeout does not cancel the shared call
+            ai_text = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                timeout=getattr(future, 'gemini_timeout', self.gemini_breaker.max_timeout)
+            )
+        return ai_text
+    
+    def stream_gemini_completion(self, prompt):
+        """Yield Gemini's text chunks as they arrive (one chunk on a response cache hit)"""
+        cache_key = self.response_cache.make_key(prompt)
+        ai_text = self.response_cache.get(cache_key)
+        if ai_text is not None:
+            yield ai_text
+            return
+        
+        chunks = []
+        timeout = self.gemini_breaker.acquire()
+        started = time.perf_counter()
+        try:
+            response = self.gemini_model.generate_content(prompt, stream=True, request_options={'timeout': timeout})
+            for chunk in response:
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+        except Exception:
+            self.gemini_breaker.record_failure(time.perf_counter() - started)
+            raise
+        except BaseException:
+            # GeneratorExit when the SSE client disconnects: Gemini was answering, so
+            # count it as healthy, and never leave a half-open probe slot taken
+            if chunks:
+                self.gemini_breaker.record_success(time.perf_counter() - started)
+            else:
+                self.gemini_breaker.release()
+            raise
+        self.gemini_breaker.record_success(time.perf_counter() - started)
+        self.response_cache.put(cache_key, ''.join(chunks))
+    
+    def generate_gemini_text(self, prompt):
+        """Call the Gemini model unless the circuit breaker is open"""
+        return self.call_gemini(prompt, self.gemini_breaker.acquire())
+    
+    def call_gemini(self, prompt, timeout):
+        """One generate_content call with the breaker's adaptive timeout; the outcome feeds the breaker"""
+        started = time.perf_counter()
+        try:
+            ai_text = self.gemini_model.generate_content(prompt, request_options={'timeout': timeout}).text
+        except Exception:
+            self.gemini_breaker.record_failure(time.perf_counter() - started)
+            raise
+        self.gemini_breaker.record_success(time.perf_counter() - started)
+        return ai_text
+    
+    def get_rule_based_response(self, user_input, language='en', matches=None):
         """Original rule-based response system"""
         user_input = user_input.lower()
         
-        # Enhanced health emergency keywords
-        emergency_keywords = ['emergency', 'urgent', 'chest pain', 'difficulty breathing', 
-                            'unconscious', 'severe pain', 'heart attack', 'stroke', 
-                            'suicide', 'self harm', 'blood in vomit', 'severe bleeding',
-                            'cannot breathe', 'choking', 'severe allergic reaction']
-        
-        # Mental health keywords
-        mental_health_keywords = ['depression', 'anxiety', 'panic', 'stress', 'mental health',
-                                'feeling sad', 'worried', 'anxious', 'panic attack']
+        # Emergency, mental health, symptom and disease keywords in one pass
+        if matches is None:
+            matches = self.keyword_router.classify(user_input)
         
-        # General symptom keywords
-        symptom_keywords = ['symptom', 'feel', 'pain', 'fever', 'headache', 'cough', 'ache',
-                          'hurt', 'sick', 'unwell', 'tired', 'fatigue', 'nausea', 'vomit',
-                          'dizzy', 'swelling', 'rash', 'itching', 'burning']
-        
-        if any(keyword in user_input for keyword in emergency_keywords):
+        if matches.has('emergency'):
             response = {
                 'type': 'emergency',
-                'message': 'This seems like a medical emergency. Please call emergency services immediately or visit the nearest hospital.',
+                'message': canned_text('emergency'),
                 'emergency_contacts': {
                     'ambulance': '108',
                     'police': '100',
@@ -240,62 +535,60 @@ Consult a doctor for proper diagnosis."""
                     'national_helpline': '1800-180-1104',
                     'mental_health': '08046110007'
                 },
-                'immediate_advice': 'If this is a life-threatening emergency, call 108 immediately. Do not delay seeking professional medical help.',
+                'immediate_advice': canned_text('emergency_advice'),
                 'powered_by': 'Rule-based Emergency Detection'
             }
-        elif any(keyword in user_input for keyword in mental_health_keywords):
+        elif matches.has('mental_health'):
             response = {
                 'type': 'mental_health',
-                'message': 'Mental health is just as important as physical health. Here are some resources that might help:',
+                'message': canned_text('mental_health'),
                 'advice': [
-                    'Talk to a trusted friend, family member, or counselor',
-                    'Practice relaxation techniques like deep breathing',
-                    'Maintain a regular sleep schedule',
-                    'Engage in physical activity',
-                    'Consider professional counseling or therapy'
+                    canned_text('mental_health_talk'),
+                    canned_text('mental_health_relax'),
+                    canned_text('mental_health_sleep'),
+                    canned_text('mental_health_activity'),
+                    canned_text('mental_health_counseling')
                 ],
                 'helplines': {
                     'mental_health_helpline': '08046110007',
                     'national_helpline': '1800-180-1104',
                     'youth_helpline': '1800-233-3330'
                 },
-                'disclaimer': 'If you are having thoughts of self-harm, please seek immediate professional help or call emergency services.',
+                'disclaimer': canned_text('mental_health_disclaimer'),
                 'powered_by': 'Rule-based Mental Health Support'
             }
-        elif any(keyword in user_input for keyword in symptom_keywords):
+        elif matches.has('symptom'):
             # Enhanced symptom analysis
-            possible_diseases = self.analyze_symptoms(user_input)
+            possible_diseases = self.analyze_symptoms(user_input, matches)
             if possible_diseases:
                 response = {
                     'type': 'symptom_analysis',
-                    'message': 'Based on your symptoms, here are some possible conditions:',
+                    'message': canned_text('symptom_analysis'),
                     'possible_diseases': possible_diseases,
-                    'disclaimer': 'This is not a medical diagnosis. Please consult a healthcare professional for proper diagnosis and treatment.',
+                    'disclaimer': canned_text('symptom_disclaimer'),
                     'powered_by': 'Rule-based Symptom Analysis'
                 }
             else:
                 response = {
                     'type': 'general',
-                    'message': 'I couldn\'t identify specific conditions based on your symptoms. Please provide more details or consult a healthcare professional.',
+                    'message': canned_text('symptom_no_match'),
                     'powered_by': 'Rule-based System'
                 }
-        elif any(disease in user_input for disease in self.disease_data.keys()):
-            # Disease information request
-            for disease_key in self.disease_data.keys():
-                if disease_key in user_input:
-                    disease_info = self.disease_data[disease_key]
-                    response = {
-                        'type': 'disease_info',
-                        'disease': disease_info,
-                        'message': f'Here\'s information about {disease_info["name"]}:',
-                        'powered_by': 'Medical Knowledge Database'
-                    }
-                    break
+        elif matches.has('disease') and matches.best('disease')['value'] in self.disease_data:
+            # Disease information request (the key is re-checked in case the dataset was reloaded since classify)
+            disease_key = matches.best('disease')['value']
+            disease_info = self.disease_data[disease_key]
+            response = {
+                'type': 'disease_info',
+                'disease': disease_info,
+                'message': f'Here\'s information about {disease_info["name"]}:',
+                'powered_by': 'Medical Knowledge Database'
+            }
         else:
             # General health query
             response = {
                 'type': 'general',
-                'message': 'I\'m here to help with health information. You can ask me about symptoms, diseases, or general health advice. How can I assist you today?',
+                'message': canned_text('general'),
                 'powered_by': 'Rule-based System'
             }
         
@@ -304,14 +597,43 @@ Consult a doctor for proper diagnosis."""
 # Initialize chatbot
 chatbot = MedicalChatbot()
 
+# Built frontend bundle (python static_assets.py), served from memory when present
+static_assets = StaticAssets()
+
+def serve_bundled(filename):
+    """Serve a fingerprinted/precompressed bundle file, or None if not bundled"""
+    if not static_assets.enabled:
+        return None
+    result = static_assets.lookup(filename, request.headers.get('Accept-Encoding'),
+                                  request.headers.get('If-None-Match'))
+    if result is None:
+        return None
+    status, body, headers = result
+    return Response(body, status=status, headers=headers)
+
+# Read-only API payloads, serialized once and answered without running the view
+response_registry = ResponseRegistry(dumps=app.json.dumps)
+
+@app.before_request
+def serve_registered_response():
+    """Answer GETs for pre-serialized endpoints (including 304s) from memory"""
+    if request.method != 'GET' or request.path not in response_registry:
+        return None
+    result = response_registry.lookup(request.path, request.headers.get('Accept-Encoding'),
+                                      request.headers.get('If-None-Match'))
+    if result is None:
+        return None
+    status, body, headers = result
+    return Response(body, status=status, headers=headers)
+
 # Serve frontend files
 @app.route('/')
 def index():
-    return send_from_directory('../frontend', 'index.html')
+    return serve_bundled('index.html') or send_from_directory('../frontend', 'index.html')
 
 @app.route('/<path:filename>')
 def serve_static(filename):
-    return send_from_directory('../frontend', filename)
+    return serve_bundled(filename) or send_from_directory('../frontend', filename)
 
 # API routes
 @app.route('/api')
@@ -321,13 +643,18 @@ def api_info():
         'version': '2.0',
         'endpoints': {
             '/api/chat': 'POST - Chat with the AI medical assistant',
+            '/api/chat/stream': 'POST - Chat with streamed (Server-Sent Events) responses',
+            '/api/chat/followup/<id>': 'GET - Poll the AI explanation that follows an emergency reply',
             '/api/diseases': 'GET - List all diseases in database',
             '/api/disease/<name>': 'GET - Get detailed disease information',
+            '/api/diseases/search?q=<prefix>': 'GET - Autocomplete disease names, aliases and regional names',
             '/api/emergency': 'GET - Emergency contacts and helplines',
             '/api/symptoms-check': 'POST - Analyze symptoms for possible conditions',
+            '/api/symptoms-check/batch': 'POST - Analyze a JSON array or NDJSON stream of symptom texts (NDJSON results)',
             '/api/health-tips': 'GET - Daily wellness and preventive care tips',
             '/api/first-aid': 'GET - Basic first aid guidelines',
-            '/api/nutrition': 'GET - Nutrition and dietary information'
+            '/api/nutrition': 'GET - Nutrition and dietary information',
+            '/api/metrics': 'GET - Cache and runtime metrics'
         },
         'features': [
             'Symptom analysis with AI',
@@ -340,52 +667,140 @@ def api_info():
         ]
     })
 
+def get_session_id(data):
+    """Session ID from the request body, or a new one for a new conversation"""
+    session_id = str(data.get('session_id') or '').strip()[:64]
+    return session_id or uuid.uuid4().hex
+
+def build_chat_reply(user_message, response, language, session_id, prompt_stats=None):
+    """Store the conversation turn and build the /api/chat reply body"""
+    chatbot.conversation_store.append(
+        session_id, make_turn(user_message, response, language, datetime.now().isoformat())
+    )
+    
+    return {
+        'success': True,
+        'response': response,
+        'language': language,
+        'session_id': session_id,
+        'prompt_stats': prompt_stats,
+        'data_version': chatbot.data_version,
+        'timestamp': datetime.now().isoformat()
+    }
+
 @app.route('/api/chat', methods=['POST'])
 def chat():
     try:
         data = request.get_json()
         user_message = data.get('message', '')
-        language = data.get('language', 'en')
+        session_id = get_session_id(data)
         
         if not user_message:
             return jsonify({'error': 'Message is required'}), 400
         
-        # Generate response
-        response = chatbot.generate_response(user_message, language)
+        # Detected locally when the client does not say
+        language = data.get('language') or detect_language(user_message)
         
-        # Store conversation
-        chatbot.conversation_history.append({
-            'user_message': user_message,
-            'bot_response': response,
-            'timestamp': datetime.now().isoformat(),
-            'language': language
-        })
+        # Generate response with this session's earlier turns as context
+        context, prompt_stats = chatbot.build_conversation_context(session_id)
+        response = chatbot.generate_response(user_message, language, context)
         
-        return jsonify({
-            'success': True,
-            'response': response,
-            'timestamp': datetime.now().isoformat()
-        })
+        return jsonify(build_chat_reply(user_message, response, language, session_id, prompt_stats))
         
     except Exception as e:
         logger.error(f"Error in chat endpoint: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
-@app.route('/api/diseases', methods=['GET'])
-def list_diseases():
+@app.route('/api/chat/followup/<followup_id>', methods=['GET'])
+def chat_followup(followup_id):
+    """Poll the AI explanation that follows an immediate emergency reply"""
+    followup = chatbot.followups.get(followup_id)
+    if followup is None:
+        return jsonify({'error': 'Unknown or expired follow-up'}), 404
+    if followup['status'] == 'pending':
+        return jsonify({'success': True, 'status': 'pending'}), 202
+    if followup['status'] == 'failed':
+        return jsonify({'success': False, 'status': 'failed'})
+    return jsonify({'success': True, 'status': 'done', 'ai_response': followup['result']})
+
+@app.route('/api/chat/stream', methods=['POST'])
+def chat_stream():
+    """Chat over Server-Sent Events: classification, then model text as it arrives, then the full reply"""
+    data = request.get_json(silent=True) or {}
+    user_message = data.get('message', '')
+    session_id = get_session_id(data)
+    
+    if not user_message:
+        return jsonify({'error': 'Message is required'}), 400
+    language = data.get('language') or detect_language(user_message)
+    
+    def events():
+        try:
+            context, prompt_stats = chatbot.build_conversation_context(session_id)
+            for event, payload in chatbot.stream_response(user_message, language, context):
+                if event == 'done':
+                    payload = build_chat_reply(user_message, payload, language, session_id, prompt_stats)
+                yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        except Exception as e:
+            logger.error(f"Error in chat stream: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'error': 'Internal server error'})}\n\n"
+    
+    return Response(stream_with_context(events()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Get runtime counters for caches and upstream calls"""
+    return jsonify({
+        'success': True,
+        'response_cache': chatbot.response_cache.stats(),
+        'semantic_cache': chatbot.semantic_cache.stats() if chatbot.semantic_cache else None,
+        'conversation_store': chatbot.conversation_store.stats(),
+        'prompt_context': chatbot.prompt_assembler.stats(),
+        'knowledge_base': chatbot.knowledge.stats(),
+        'response_registry': response_registry.stats(),
+        'followups': chatbot.followups.stats(),
+        'gemini_breaker': chatbot.gemini_breaker.stats(),
+        'gemini_single_flight': chatbot.gemini_flights.stats(),
+        'translation_memory': chatbot.translation_memory.coverage() if chatbot.translation_memory else None
+    })
+
+def list_diseases_payload():
     """Get list of all available diseases"""
+    snapshot = chatbot.knowledge.current
     diseases = []
-    for key, info in chatbot.disease_data.items():
+    for key, name, symptoms_count in snapshot.disease_data.summaries():
         diseases.append({
             'id': key,
-            'name': info['name'],
-            'symptoms_count': len(info['symptoms'])
+            'name': name,
+            'symptoms_count': symptoms_count
         })
     
-    return jsonify({
+    return {
         'success': True,
         'diseases': diseases,
-        'total': len(diseases)
+        'total': len(diseases),
+        'data_version': snapshot.version
+    }
+
+@app.route('/api/diseases', methods=['GET'])
+def list_diseases():
+    """Get list of all available diseases"""
+    return jsonify(list_diseases_payload())
+
+@app.route('/api/diseases/search', methods=['GET'])
+def search_diseases():
+    """Autocomplete disease names, keys, aliases and regional names by prefix"""
+    query = request.args.get('q', '')
+    limit = min(request.args.get('limit', 10, type=int) or 10, 50)
+    snapshot = chatbot.knowledge.current
+    return jsonify({
+        'success': True,
+        'query': query,
+        'suggestions': snapshot.lookup.complete(query, limit),
+        'data_version': snapshot.version
     })
 
 @app.route('/api/disease/<disease_name>', methods=['GET'])
@@ -396,7 +811,8 @@ def get_disease(disease_name):
     if disease_info:
         return jsonify({
             'success': True,
-            'disease': disease_info
+            'disease': disease_info,
+            'data_version': chatbot.data_version
         })
     else:
         return jsonify({
@@ -404,10 +820,9 @@ def get_disease(disease_name):
             'error': 'Disease not found'
         }), 404
 
-@app.route('/api/emergency', methods=['GET'])
-def emergency_contacts():
+def emergency_contacts_payload():
     """Get emergency contact information"""
-    return jsonify({
+    return {
         'success': True,
         'emergency_contacts': {
             'ambulance': '108',
@@ -422,7 +837,12 @@ def emergency_contacts():
             'covid_helpline': '1075',
             'mental_health_helpline': '08046110007'
         }
-    })
+    }
+
+@app.route('/api/emergency', methods=['GET'])
+def emergency_contacts():
+    """Get emergency contact information"""
+    return jsonify(emergency_contacts_payload())
 
 @app.route('/api/symptoms-check', methods=['POST'])
 def symptoms_check():
@@ -440,6 +860,7 @@ def symptoms_check():
             'success': True,
             'symptoms': symptoms,
             'possible_conditions': possible_diseases,
+            'data_version': chatbot.data_version,
             'disclaimer': 'This is not a medical diagnosis. Please consult a healthcare professional.',
             'recommendation': 'If symptoms persist or worsen, please seek immediate medical attention.'
         })
@@ -448,8 +869,83 @@ def symptoms_check():
         logger.error(f"Error in symptoms check: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
-@app.route('/api/health-tips', methods=['GET'])
-def health_tips():
+def split_symptom_item(item):
+    """A batch item is either a symptoms string or {"id": ..., "symptoms": ...}"""
+    if isinstance(item, dict):
+        return item.get('id'), item.get('symptoms', '')
+    return None, item
+
+def iter_symptom_items():
+    """Yield (id, symptoms) pairs from a JSON body or, line by line, from an NDJSON stream"""
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+        for line in request.stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError:
+                item = {'symptoms': ''}
+            yield split_symptom_item(item)
+        return
+
+    data = request.get_json(silent=True)
+    items = data.get('items', data.get('symptoms', [])) if isinstance(data, dict) else data
+    for item in items if isinstance(items, list) else []:
+        yield split_symptom_item(item)
+
+@app.route('/api/symptoms-check/batch', methods=['POST'])
+def symptoms_check_batch():
+    """Check many symptom texts in one request; results stream back as NDJSON, one line per item"""
+    # One snapshot for the whole batch so every item is scored against the same dataset version
+    snapshot = chatbot.knowledge.current
+    chunk_size = Config.SYMPTOMS_BATCH_CHUNK_SIZE
+    max_items = Config.SYMPTOMS_BATCH_MAX_ITEMS
+
+    def score_chunk(chunk):
+        valid = [(index, item_id, symptoms) for index, item_id, symptoms in chunk
+                 if isinstance(symptoms, str) and symptoms.strip()]
+        scored = iter(chatbot.analyze_symptoms_batch([symptoms for _, _, symptoms in valid], snapshot=snapshot))
+        valid_indexes = {index for index, _, _ in valid}
+        for index, item_id, symptoms in chunk:
+            result = {'index': index, 'id': item_id, 'symptoms': symptoms}
+            if index in valid_indexes:
+                result['possible_conditions'] = next(scored)
+            else:
+                result['error'] = 'Symptoms are required'
+            yield json.dumps(result) + '\n'
+
+    def results():
+        chunk = []
+        count = 0
+        try:
+            for index, (item_id, symptoms) in enumerate(iter_symptom_items()):
+                if index >= max_items:
+                    yield json.dumps({'error': f'Batch limit of {max_items} items reached', 'index': index}) + '\n'
+                    break
+                chunk.append((index, item_id, symptoms))
+                count += 1
+                if len(chunk) == chunk_size:
+                    yield from score_chunk(chunk)
+                    chunk = []
+            if chunk:
+                yield from score_chunk(chunk)
+        except Exception as e:
+            logger.error(f"Error in batch symptoms check: {str(e)}")
+            yield json.dumps({'error': 'Internal server error'}) + '\n'
+            return
+        yield json.dumps({
+            'done': True,
+            'count': count,
+            'data_version': snapshot.version,
+            'disclaimer': 'This is not a medical diagnosis. Please consult a healthcare professional.'
+        }) + '\n'
+
+    return Response(stream_with_context(results()), mimetype='application/x-ndjson', headers={
+        'X-Accel-Buffering': 'no'
+    })
+
+def health_tips_payload():
     """Get general health and wellness tips"""
     tips = {
         'daily_wellness': [
@@ -484,14 +980,18 @@ def health_tips():
         ]
     }
     
-    return jsonify({
+    return {
         'success': True,
         'health_tips': tips,
         'message': 'Remember: These are general wellness tips. Always consult healthcare professionals for personalized advice.'
-    })
+    }
 
-@app.route('/api/first-aid', methods=['GET'])
-def first_aid():
+@app.route('/api/health-tips', methods=['GET'])
+def health_tips():
+    """Get general health and wellness tips"""
+    return jsonify(health_tips_payload())
+
+def first_aid_payload():
     """Get basic first aid information"""
     first_aid_info = {
         'common_situations': {
@@ -531,13 +1031,17 @@ def first_aid():
         'emergency_disclaimer': 'These are basic first aid guidelines. For serious injuries or emergencies, call 108 immediately.'
     }
     
-    return jsonify({
+    return {
         'success': True,
         'first_aid': first_aid_info
-    })
+    }
 
-@app.route('/api/nutrition', methods=['GET'])
-def nutrition():
+@app.route('/api/first-aid', methods=['GET'])
+def first_aid():
+    """Get basic first aid information"""
+    return jsonify(first_aid_payload())
+
+def nutrition_payload():
     """Get nutrition and dietary information"""
     nutrition_info = {
         'balanced_diet': {
@@ -585,15 +1089,34 @@ def nutrition():
         }
     }
     
-    return jsonify({
+    return {
         'success': True,
         'nutrition': nutrition_info,
         'message': 'Consult a registered dietitian for personalized nutrition advice.'
+    }
+
+@app.route('/api/nutrition', methods=['GET'])
+def nutrition():
+    """Get nutrition and dietary information"""
+    return jsonify(nutrition_payload())
+
+def refresh_static_responses():
+    """Re-serialize the read-only endpoints; call again whenever their data changes"""
+    response_registry.register_all({
+        '/api/diseases': list_diseases_payload(),
+        '/api/emergency': emergency_contacts_payload(),
+        '/api/health-tips': health_tips_payload(),
+        '/api/first-aid': first_aid_payload(),
+        '/api/nutrition': nutrition_payload()
     })
 
+refresh_static_responses()
+chatbot.knowledge.on_reload(lambda snapshot: refresh_static_responses())
+
 if __name__ == '__main__':
     print("🏥 AI Medical Chatbot Server Starting...")
     print("🌐 Frontend and API available at: http://localhost:5000")
     print("📱 In codespace, check the 'Ports' tab for the public URL")
     print("🔧 API endpoints available at: /api/*")
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    print("🚀 For production use: python serve.py")
+    app.run(debug=Config.DEBUG, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,142 @@
+# Single-pass keyword classification for chat routing
+import unicodedata
+
+from phrase_matcher import PhraseMatcher
+
+# Health emergency keywords
+EMERGENCY_KEYWORDS = ['emergency', 'urgent', 'chest pain', 'difficulty breathing',
+                      'unconscious', 'severe pain', 'heart attack', 'stroke',
+                      'suicide', 'self harm', 'blood in vomit', 'severe bleeding',
+                      'cannot breathe', 'choking', 'severe allergic reaction']
+
+# Mental health keywords
+MENTAL_HEALTH_KEYWORDS = ['depression', 'anxiety', 'panic', 'stress', 'mental health',
+                          'feeling sad', 'worried', 'anxious', 'panic attack']
+
+# General symptom keywords
+SYMPTOM_KEYWORDS = ['symptom', 'feel', 'pain', 'fever', 'headache', 'cough', 'ache',
+                    'hurt', 'sick', 'unwell', 'tired', 'fatigue', 'nausea', 'vomit',
+                    'dizzy', 'swelling', 'rash', 'itching', 'burning']
+
+DEFAULT_KEYWORD_CLASSES = {
+    'emergency': EMERGENCY_KEYWORDS,
+    'mental_health': MENTAL_HEALTH_KEYWORDS,
+    'symptom': SYMPTOM_KEYWORDS
+}
+
+
+class KeywordMatches:
+    """Keyword hits for one message, grouped by class label"""
+
+    def __init__(self, hits):
+        self.hits = hits
+        self.by_label = {}
+        for hit in hits:
+            self.by_label.setdefault(hit['label'], []).append(hit)
+
+    def has(self, label):
+        return label in self.by_label
+
+    def get(self, label):
+        return self.by_label.get(label, [])
+
+    def best(self, label):
+        """Return the hit registered first for this label (lowest priority)"""
+        hits = self.by_label.get(label)
+        if not hits:
+            return None
+        return min(hits, key=lambda hit: (hit['priority'], hit['start']))
+
+    def labels(self):
+        return list(self.by_label.keys())
+    
+    def english_terms(self, labels=('symptom', 'emergency')):
+        """English keywords behind the native-language hits, in message order"""
+        terms = []
+        for hit in self.hits:
+            if hit['language'] and hit['label'] in labels and hit['value'] not in terms:
+                terms.append(hit['value'])
+        return terms
+
+    def to_dict(self):
+        return {label: [hit['keyword'] for hit in hits] for label, hits in self.by_label.items()}
+
+
+class KeywordRouter:
+    """Classify a message against every keyword class and disease name at once.
+
+    All keywords are compiled into one Aho-Corasick automaton at startup,
+    so a message is scanned once no matter how many classes or synonyms
+    are registered. Native-language keywords from a symptom lexicon
+    ({language: {label: {native: english}}}) share the same automaton and
+    report their English keyword as the hit value.
+    """
+
+    def __init__(self, keyword_classes=None, disease_keys=(), lexicon=None):
+        self.matcher = PhraseMatcher()
+        self.entries = []  # phrase id -> list of (label, priority, value, language)
+        self._counts = {}
+
+        for label, keywords in (keyword_classes or DEFAULT_KEYWORD_CLASSES).items():
+            self.add_keywords(label, keywords)
+        self.add_keywords('disease', disease_keys)
+        for language, classes in (lexicon or {}).items():
+            for label, terms in classes.items():
+                self.add_translations(label, terms, language)
+        self.matcher.build()
+
+    def add_keywords(self, label, keywords):
+        """Register keywords under a class label; call build() afterwards"""
+        for value in keywords:
+            self._add(label, value.lower(), value)
+
+    def add_translations(self, label, terms, language):
+        """Register {native keyword: English keyword} under a class label; call build() afterwards"""
+        for native, english in terms.items():
+            self._add(label, unicodedata.normalize('NFC', native).lower(), english, language)
+
+    def _add(self, label, keyword, value, language=None):
+        if not keyword:
+            return
+        phrase_id = self.matcher.add(keyword)
+        if phrase_id == len(self.entries):
+            self.entries.append([])
+        priority = self._counts.get(label, 0)
+        self._counts[label] = priority + 1
+        self.entries[phrase_id].append((label, priority, value, language))
+
+    def build(self):
+        self.matcher.build()
+        return self
+
+    def classify(self, text):
+        """Return a KeywordMatches with every hit and its offsets in text"""
+        hits = []
+        for start, end, phrase_id in self.matcher.iter_matches(self.normalize(text)):
+            keyword = self.matcher.phrases[phrase_id]
+            for label, priority, value, language in self.entries[phrase_id]:
+                hits.append({
+                    'label': label,
+                    'keyword': keyword,
+                    'value': value,
+                    'language': language,
+                    'priority': priority,
+                    'start': start,
+                    'end': end
+                })
+        return KeywordMatches(hits)
+
+    @staticmethod
+    def normalize(text):
+        # Indic text may arrive decomposed (e.g. nukta as a separate mark)
+        text = text.lower()
+        return text if text.isascii() else unicodedata.normalize('NFC', text)
+
+    def gloss(self, text, matches=None):
+        """text followed by the English keywords of its native-language hits, for the English symptom engines"""
+        if text.isascii():
+            return text
+        if matches is None:
+            matches = self.classify(text)
+        terms = matches.english_terms()
+        return f"{text} {' '.join(terms)}" if terms else text
@@ -0,0 +1,203 @@
+# Versioned, hot-reloadable disease knowledge base
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+from disease_catalog import LIST_FIELDS, TEXT_FIELDS, DiseaseCatalog, catalog_path, open_catalog, prune_catalogs
+from disease_lookup import DiseaseLookup
+from keyword_router import KeywordRouter
+from symptom_index import SymptomIndex
+from symptom_search import SymptomSearch
+
+# analyze_symptoms backends: BM25 ranked retrieval or exact symptom phrase matching
+SYMPTOM_ENGINES = {'bm25': SymptomSearch, 'phrase': SymptomIndex}
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATA_FILE = os.path.join(os.path.dirname(BACKEND_DIR), 'data', 'diseases.json')
+DEFAULT_CATALOG_DIR = os.path.join(os.path.dirname(BACKEND_DIR), 'data', '.catalog')
+
+
+class KnowledgeSnapshot:
+    """One immutable dataset version together with the indexes built from it"""
+
+    def __init__(self, catalog, version, source, regional_terms=None, symptom_engine='phrase', symptom_lexicon=None):
+        self.disease_data = catalog
+        self.version = version
+        self.source = source
+        self.loaded_at = datetime.now().isoformat()
+        self.symptom_index = SYMPTOM_ENGINES.get(symptom_engine, SymptomIndex)(catalog)
+        self.keyword_router = KeywordRouter(disease_keys=catalog.keys(), lexicon=symptom_lexicon)
+        self.lookup = DiseaseLookup(catalog, regional_terms)
+
+
+def validate_disease_data(disease_data):
+    """Raise ValueError unless every entry has the fields the indexes rely on, with the types they expect"""
+    if not isinstance(disease_data, dict) or not disease_data:
+        raise ValueError('disease data must be a non-empty object')
+    for key, info in disease_data.items():
+        if not isinstance(info, dict) or 'name' not in info or not isinstance(info.get('symptoms'), list):
+            raise ValueError(f"disease '{key}' needs a name and a list of symptoms")
+        for field in TEXT_FIELDS:
+            if field in info and not isinstance(info[field], str):
+                raise ValueError(f"disease '{key}' field '{field}' must be a string")
+        for field in LIST_FIELDS:
+            if field not in info:
+                continue
+            if not isinstance(info[field], list):
+                raise ValueError(f"disease '{key}' field '{field}' must be a list of strings")
+            for item in info[field]:
+                if not isinstance(item, str):
+                    raise ValueError(f"disease '{key}' field '{field}' has a non-string item: {item!r}")
+
+
+class KnowledgeBase:
+    """Holds the active KnowledgeSnapshot and swaps in new versions.
+
+    A reload reads and validates the file and builds every index off to
+    the side, then replaces ``current`` with a single assignment. Readers
+    take ``current`` once per request and never block or see a partly
+    built state; a bad file is logged and the previous version stays live.
+    With ``catalog_dir`` set, each version is compiled once to a
+    memory-mapped DiseaseCatalog that all worker processes share.
+    """
+
+    def __init__(self, data_file=DEFAULT_DATA_FILE, default_data=None, poll_interval=0, catalog_dir=None,
+                 regional_terms=None, symptom_engine='phrase', symptom_lexicon=None):
+        self.data_file = data_file
+        self.regional_terms = regional_terms
+        self.symptom_engine = symptom_engine
+        self.symptom_lexicon = symptom_lexicon
+        self.default_data = default_data
+        self.poll_interval = poll_interval
+        self.catalog_dir = catalog_dir
+        self.catalog_name = os.path.splitext(os.path.basename(data_file))[0]
+        self._listeners = []
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+        self._file_state = None
+        self.reloads = 0
+        self.failed_reloads = 0
+        self.last_error = None
+
+        self.current = self._load_initial()
+        self.start_watching()
+
+    def _read_file(self):
+        with open(self.data_file, 'rb') as f:
+            raw = f.read()
+        version = hashlib.sha256(raw).hexdigest()[:12]
+        if self.catalog_dir:
+            compiled = catalog_path(self.catalog_dir, self.catalog_name, version)
+            if os.path.exists(compiled):
+                # Another worker (or an earlier run) already compiled this version
+                return DiseaseCatalog.load(compiled), version
+        disease_data = json.loads(raw)
+        validate_disease_data(disease_data)
+        return open_catalog(disease_data, version, self.catalog_dir, self.catalog_name), version
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.data_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_initial(self):
+        self._file_state = self._stat()
+        try:
+            catalog, version = self._read_file()
+            logger.info(f"Loaded {len(catalog)} diseases from {self.data_file} (version {version})")
+            prune_catalogs(self.catalog_dir, version, self.catalog_name)
+            return KnowledgeSnapshot(catalog, version, self.data_file, self.regional_terms, self.symptom_engine,
+                                     self.symptom_lexicon)
+        except Exception as e:
+            if self.default_data is None:
+                raise
+            logger.warning(f"Disease data file not usable ({e!r}), using default data")
+            self.failed_reloads += 1
+            self.last_error = repr(e)
+            return KnowledgeSnapshot(DiseaseCatalog.from_dict(self.default_data, 'default'), 'default', 'builtin',
+                                     self.regional_terms, self.symptom_engine, self.symptom_lexicon)
+
+    def on_reload(self, callback):
+        """Call ``callback(snapshot)`` after each successful swap"""
+        self._listeners.append(callback)
+
+    def reload(self, force=False):
+        """Rebuild from the data file if it changed; return True when a new version went live"""
+        with self._reload_lock:
+            file_state = self._stat()
+            if file_state is None or (file_state == self._file_state and not force):
+                return False
+            self._file_state = file_state
+            try:
+                catalog, version = self._read_file()
+                if version == self.current.version and not force:
+                    return False
+                snapshot = KnowledgeSnapshot(catalog, version, self.data_file, self.regional_terms,
+                                             self.symptom_engine, self.symptom_lexicon)
+            except Exception as e:
+                # Any bad edit, not only a parse error, must leave the live version in place
+                self.failed_reloads += 1
+                self.last_error = repr(e)
+                logger.error(f"Keeping knowledge base version {self.current.version}; reload failed: {e!r}")
+                return False
+
+            previous = self.current.version
+            self.current = snapshot
+            self.reloads += 1
+            self.last_error = None
+            logger.info(f"Knowledge base {previous} -> {snapshot.version} ({len(catalog)} diseases)")
+            prune_catalogs(self.catalog_dir, version, self.catalog_name)
+
+        for callback in self._listeners:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error(f"Knowledge base reload listener failed: {e}")
+        return True
+
+    def start_watching(self):
+        if self.poll_interval <= 0:
+            return
+        self._stop = threading.Event()
+        self._watcher = threading.Thread(target=self._watch_loop, name='knowledge-watcher', daemon=True)
+        self._watcher.start()
+
+    def _watch_loop(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception:
+                # Keep polling; a dead watcher would silently end hot reload until restart
+                logger.exception('Knowledge base watcher iteration failed')
+
+    def after_fork(self):
+        # The parent's watcher thread does not exist in the child
+        self._reload_lock = threading.Lock()
+        self.start_watching()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self):
+        snapshot = self.current
+        return {
+            'version': snapshot.version,
+            'source': snapshot.source,
+            'loaded_at': snapshot.loaded_at,
+            'diseases': len(snapshot.disease_data),
+            'catalog': snapshot.disease_data.stats(),
+            'lookup_terms': len(snapshot.lookup),
+            'symptom_engine': type(snapshot.symptom_index).__name__,
+            'reloads': self.reloads,
+            'failed_reloads': self.failed_reloads,
+            'last_error': self.last_error,
+            'poll_interval': self.poll_interval
+        }
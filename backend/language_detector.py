@@ -0,0 +1,161 @@
+# Offline language detection for incoming messages
+import math
+from collections import Counter
+
+from canned_responses import CANNED_RESPONSES
+
+DEFAULT_LANGUAGE = 'en'
+
+# Only the start of a long message is inspected
+MAX_CHARS = 256
+
+# Indic scripts occupy consecutive 128-code-point blocks from U+0900
+INDIC_BLOCK_START = 0x0900
+INDIC_BLOCK_END = 0x0D80
+INDIC_SCRIPTS = ('devanagari', 'bengali', 'gurmukhi', 'gujarati', 'oriya', 'tamil', 'telugu', 'kannada', 'malayalam')
+
+# Arabic, Arabic Supplement and the presentation forms
+ARABIC_RANGES = ((0x0600, 0x0700), (0x0750, 0x0780), (0xFB50, 0xFE00), (0xFE70, 0xFF00))
+
+# Supported languages written in each script; the n-gram model decides between several
+SCRIPT_LANGUAGES = {
+    'devanagari': ('hi', 'mr'),
+    'bengali': ('bn',),
+    'gurmukhi': ('pa',),
+    'gujarati': ('gu',),
+    'oriya': ('or',),
+    'tamil': ('ta',),
+    'telugu': ('te',),
+    'kannada': ('kn',),
+    'malayalam': ('ml',),
+    'arabic': ('ur',),
+    'latin': ('en',)
+}
+
+# Everyday health phrases that complement the canned responses as n-gram training text
+SEED_PHRASES = {
+    'hi': [
+        'मुझे बुखार है और सिर में दर्द हो रहा है',
+        'मेरे पेट में दर्द है',
+        'मुझे खांसी और जुकाम है',
+        'क्या मुझे डॉक्टर के पास जाना चाहिए',
+        'मेरे बच्चे को दस्त हो रहे हैं',
+        'सांस लेने में तकलीफ हो रही है',
+        'मुझे चक्कर आ रहे हैं और उल्टी हो रही है',
+        'डेंगू के लक्षण क्या हैं',
+        'यह दवा कब लेनी चाहिए',
+        'मैं बहुत थका हुआ महसूस कर रहा हूं'
+    ],
+    'mr': [
+        'मला ताप आहे आणि डोके दुखत आहे',
+        'माझे पोट दुखत आहे',
+        'मला खोकला आणि सर्दी झाली आहे',
+        'मी डॉक्टरांकडे जावे का',
+        'माझ्या मुलाला जुलाब होत आहेत',
+        'श्वास घ्यायला त्रास होत आहे',
+        'मला चक्कर येत आहे आणि उलट्या होत आहेत',
+        'डेंग्यूची लक्षणे काय आहेत',
+        'हे औषध केव्हा घ्यावे',
+        'मला खूप थकवा जाणवत आहे'
+    ]
+}
+
+
+def script_counts(text):
+    """Letters per script in the first MAX_CHARS characters"""
+    counts = Counter()
+    for code_point in map(ord, text[:MAX_CHARS]):
+        if code_point < 0x80:
+            if 0x41 <= code_point <= 0x5A or 0x61 <= code_point <= 0x7A:
+                counts['latin'] += 1
+        elif INDIC_BLOCK_START <= code_point < INDIC_BLOCK_END:
+            counts[INDIC_SCRIPTS[(code_point - INDIC_BLOCK_START) >> 7]] += 1
+        elif any(start <= code_point < end for start, end in ARABIC_RANGES):
+            counts['arabic'] += 1
+    return counts
+
+
+def char_ngrams(text, n):
+    padded = f" {' '.join(text.lower().split())} "
+    return [padded[index:index + n] for index in range(len(padded) - n + 1)]
+
+
+class NgramModel:
+    """Character n-gram language model with add-one smoothing.
+
+    Each language keeps log-probabilities of its n-grams plus one
+    log-probability for unseen n-grams, so scoring a message is one
+    dict lookup per n-gram and language.
+    """
+
+    def __init__(self, corpus, n=3):
+        self.n = n
+        self.log_probs = {}
+        self.unseen = {}
+        vocabulary = {gram for texts in corpus.values() for text in texts for gram in char_ngrams(text, n)}
+        for language, texts in corpus.items():
+            counts = Counter(gram for text in texts for gram in char_ngrams(text, n))
+            total = sum(counts.values()) + len(vocabulary) + 1
+            self.log_probs[language] = {gram: math.log((count + 1) / total) for gram, count in counts.items()}
+            self.unseen[language] = math.log(1 / total)
+
+    def scores(self, text, languages):
+        grams = char_ngrams(text[:MAX_CHARS], self.n)
+        return {
+            language: sum(self.log_probs[language].get(gram, self.unseen[language]) for gram in grams)
+            for language in languages
+        }
+
+    def best(self, text, languages):
+        scores = self.scores(text, languages)
+        return max(languages, key=scores.get)
+
+
+def default_corpus():
+    """Training text per language: every canned response plus the seed phrases"""
+    corpus = {}
+    for translations in CANNED_RESPONSES.values():
+        for language, text in translations.items():
+            corpus.setdefault(language, []).append(text)
+    for language, phrases in SEED_PHRASES.items():
+        corpus.setdefault(language, []).extend(phrases)
+    return corpus
+
+
+class LanguageDetector:
+    """Script blocks first, then the n-gram model for scripts shared by several languages"""
+
+    def __init__(self, corpus=None, default=DEFAULT_LANGUAGE):
+        self.default = default
+        corpus = corpus or default_corpus()
+        self.model = NgramModel({
+            language: corpus[language]
+            for languages in SCRIPT_LANGUAGES.values() if len(languages) > 1
+            for language in languages
+        })
+
+    def detect(self, text):
+        """Language code of a message, or the default when it has no letters in a known script"""
+        if not text:
+            return self.default
+        counts = script_counts(text)
+        if not counts:
+            return self.default
+        # English words are common in Indic messages, so any native script outranks Latin
+        native = {script: count for script, count in counts.items() if script != 'latin'}
+        script = max(native, key=native.get) if native else 'latin'
+        languages = SCRIPT_LANGUAGES[script]
+        if len(languages) == 1:
+            return languages[0]
+        return self.model.best(text, languages)
+
+
+_detector = None
+
+
+def detect_language(text):
+    """Detect with a shared, lazily built LanguageDetector"""
+    global _detector
+    if _detector is None:
+        _detector = LanguageDetector()
+    return _detector.detect(text)
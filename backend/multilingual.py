@@ -1,11 +1,80 @@
 # Translation utilities for multilingual support
-from googletrans import Translator
+try:
+    from googletrans import Translator
+except ImportError:  # only MultilingualSupport needs googletrans; the term tables do not
+    Translator = None
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from canned_responses import CannedResponses
+from config import Config
+from language_detector import detect_language
+from translation_memory import create_translation_memory
+
+# Pre-translated common medical terms
+MEDICAL_TERMS = {
+    'en': {
+        'fever': 'fever',
+        'headache': 'headache',
+        'cough': 'cough',
+        'pain': 'pain',
+        'doctor': 'doctor',
+        'medicine': 'medicine',
+        'hospital': 'hospital',
+        'emergency': 'emergency'
+    },
+    'hi': {
+        'fever': 'बुखार',
+        'headache': 'सिरदर्द',
+        'cough': 'खांसी',
+        'pain': 'दर्द',
+        'doctor': 'डॉक्टर',
+        'medicine': 'दवा',
+        'hospital': 'अस्पताल',
+        'emergency': 'आपातकाल'
+    },
+    'te': {
+        'fever': 'జ్వరం',
+        'headache': 'తలనొప్పి',
+        'cough': 'దగ్గు',
+        'pain': 'నొప్పి',
+        'doctor': 'వైద్యుడు',
+        'medicine': 'మందు',
+        'hospital': 'ఆసుపత్రి',
+        'emergency': 'అత్యవసరం'
+    },
+    'ta': {
+        'fever': 'காய்ச்சல்',
+        'headache': 'தலைவலி',
+        'cough': 'இருமல்',
+        'pain': 'வலி',
+        'doctor': 'மருத்துவர்',
+        'medicine': 'மருந்து',
+        'hospital': 'மருத்துவமனை',
+        'emergency': 'அவசரநிலை'
+    },
+    'bn': {
+        'fever': 'জ্বর',
+        'headache': 'মাথাব্যথা',
+        'cough': 'কাশি',
+        'pain': 'ব্যথা',
+        'doctor': 'ডাক্তার',
+        'medicine': 'ওষুধ',
+        'hospital': 'হাসপাতাল',
+        'emergency': 'জরুরি'
+    }
+}
+
 
 class MultilingualSupport:
-    def __init__(self):
-        self.translator = Translator()
+    def __init__(self, translation_memory=None):
+        self.translator = Translator() if Translator else None
+        # Checked before any remote call; None disables it
+        self.translation_memory = translation_memory or create_translation_memory()
+        self.batch_size = Config.TRANSLATION_BATCH_SIZE
+        self.max_concurrency = Config.TRANSLATION_MAX_CONCURRENCY
+        self._executor = None
         self.supported_languages = {
             'en': 'english',
             'hi': 'hindi',
@@ -21,81 +90,10 @@ class MultilingualSupport:
             'ur': 'urdu'
         }
         
-        # Pre-translated common medical terms
-        self.medical_terms = {
-            'en': {
-                'fever': 'fever',
-                'headache': 'headache',
-                'cough': 'cough',
-                'pain': 'pain',
-                'doctor': 'doctor',
-                'medicine': 'medicine',
-                'hospital': 'hospital',
-                'emergency': 'emergency'
-            },
-            'hi': {
-                'fever': 'बुखार',
-                'headache': 'सिरदर्द',
-                'cough': 'खांसी',
-                'pain': 'दर्द',
-                'doctor': 'डॉक्टर',
-                'medicine': 'दवा',
-                'hospital': 'अस्पताल',
-                'emergency': 'आपातकाल'
-            },
-            'te': {
-                'fever': 'జ్వరం',
-                'headache': 'తలనొప్పి',
-                'cough': 'దగ్గు',
-                'pain': 'నొప్పి',
-                'doctor': 'వైద్యుడు',
-                'medicine': 'మందు',
-                'hospital': 'ఆసుపత్రి',
-                'emergency': 'అత్యవసరం'
-            },
-            'ta': {
-                'fever': 'காய்ச்சல்',
-                'headache': 'தலைவலி',
-                'cough': 'இருமல்',
-                'pain': 'வலி',
-                'doctor': 'மருத்துவர்',
-                'medicine': 'மருந்து',
-                'hospital': 'மருத்துவமனை',
-                'emergency': 'அவசரநிலை'
-            },
-            'bn': {
-                'fever': 'জ্বর',
-                'headache': 'মাথাব্যথা',
-                'cough': 'কাশি',
-                'pain': 'ব্যথা',
-                'doctor': 'ডাক্তার',
-                'medicine': 'ওষুধ',
-                'hospital': 'হাসপাতাল',
-                'emergency': 'জরুরি'
-            }
-        }
+        self.medical_terms = MEDICAL_TERMS
         
-        # Pre-translated common responses
-        self.common_responses = {
-            'en': {
-                'greeting': 'Hello! How can I help you with your health concerns today?',
-                'emergency_warning': 'This seems like a medical emergency. Please seek immediate medical attention.',
-                'disclaimer': 'This is for informational purposes only. Please consult a healthcare professional.',
-                'no_match': 'I couldn\'t find specific information. Please provide more details.'
-            },
-            'hi': {
-                'greeting': 'नमस्ते! आज मैं आपकी स्वास्थ्य समस्याओं में कैसे मदद कर सकता हूं?',
-                'emergency_warning': 'यह एक मेडिकल इमरजेंसी लगती है। कृपया तुरंत चिकित्सा सहायता लें।',
-                'disclaimer': 'यह केवल जानकारी के लिए है। कृपया किसी स्वास्थ्य पेशेवर से सलाह लें।',
-                'no_match': 'मुझे विशिष्ट जानकारी नहीं मिली। कृपया अधिक विवरण दें।'
-            },
-            'te': {
-                'greeting': 'నమస్కారం! ఈ రోజు మీ ఆరోగ్య సమస్యలతో నేను ఎలా సహాయం చేయగలను?',
-                'emergency_warning': 'ఇది వైద్య అత్యవసర పరిస్థితిలా కనిపిస్తోంది। దయచేసి వెంటనే వైద్య సహాయం తీసుకోండి।',
-                'disclaimer': 'ఇది కేవలం సమాచార ప్రయోజనాల కోసం మాత్రమే. దయచేసి ఆరోగ్య నిపుణుడిని సంప్రదించండి।',
-                'no_match': 'నాకు నిర్దిష్ట సమాచారం కనుగొనలేకపోయింది. దయచేసి మరిన్ని వివరాలు ఇవ్వండి।'
-            }
-        }
+        # Pre-translated canned messages, found by exact text in O(1)
+        self.canned_responses = CannedResponses()
     
     def translate_text(self, text, target_language, source_language='en'):
         """Translate text to target language"""
@@ -103,26 +101,37 @@ class MultilingualSupport:
             return text
             
         try:
-            # Check if we have a pre-translated version
-            if source_language == 'en' and target_language in self.common_responses:
-                for key, value in self.common_responses['en'].items():
-                    if text.lower() in value.lower():
-                        return self.common_responses[target_language].get(key, text)
+            # Canned chatbot messages are translated by hand
+            canned = self.canned_responses.lookup(text, target_language, source_language)
+            if canned is not None:
+                return canned
+            
+            # Translations seen before (or warmed offline) never leave the process
+            if self.translation_memory is not None:
+                remembered = self.translation_memory.get(text, target_language, source_language)
+                if remembered is not None:
+                    return remembered
             
             # Use Google Translate for other text
+            return self.translate_remote(text, target_language, source_language)
+        except Exception as e:
+            print(f"Translation error: {e}")
+            return text
+    
+    def translate_remote(self, text, target_language, source_language='en'):
+        """Call Google Translate and store the result in the translation memory"""
+        try:
             result = self.translator.translate(text, dest=target_language, src=source_language)
-            return result.text
         except Exception as e:
             print(f"Translation error: {e}")
             return text
+        if self.translation_memory is not None:
+            self.translation_memory.put(text, result.text, target_language, source_language)
+        return result.text
     
     def detect_language(self, text):
-        """Detect the language of input text"""
-        try:
-            result = self.translator.detect(text)
-            return result.lang
-        except:
-            return 'en'  # Default to English
+        """Detect the language of input text (offline, from its script and character n-grams)"""
+        return detect_language(text)
     
     def get_medical_term(self, term, language):
         """Get translated medical term"""
@@ -130,21 +139,95 @@ class MultilingualSupport:
             return self.medical_terms[language][term.lower()]
         return term
     
+    def translate_many(self, texts, target_language, source_language='en'):
+        """Translate many strings at once; returns {text: translation} for every input.
+
+        Duplicates are dropped, canned messages come from the built-in
+        table, the translation memory is read in one query, and only the
+        remaining strings go to the translator, in chunks of
+        ``batch_size`` with up to ``max_concurrency`` chunks in flight.
+        Strings that fail to translate map to themselves.
+        """
+        unique = list(dict.fromkeys(text for text in texts if isinstance(text, str) and text.strip()))
+        if target_language == source_language or not unique:
+            return {text: text for text in texts if isinstance(text, str)}
+        
+        translated = {}
+        for text in unique:
+            canned = self.canned_responses.lookup(text, target_language, source_language)
+            if canned is not None:
+                translated[text] = canned
+        if self.translation_memory is not None and len(translated) < len(unique):
+            translated.update(self.translation_memory.get_many(
+                [text for text in unique if text not in translated], target_language, source_language
+            ))
+        missing = [text for text in unique if text not in translated]
+        
+        chunks = [missing[start:start + self.batch_size] for start in range(0, len(missing), self.batch_size)]
+        if len(chunks) == 1:
+            results = [self.translate_chunk(chunks[0], target_language, source_language)]
+        elif chunks:
+            results = self.executor().map(
+                lambda chunk: self.translate_chunk(chunk, target_language, source_language), chunks
+            )
+        else:
+            results = []
+        for chunk_result in results:
+            translated.update(chunk_result)
+        
+        return {text: translated.get(text, text) for text in texts if isinstance(text, str)}
+    
+    def translate_chunk(self, texts, target_language, source_language='en'):
+        """One bulk call to the translator; results are written to the translation memory"""
+        if self.translator is None:
+            return {}
+        try:
+            results = self.translator.translate(texts, dest=target_language, src=source_language)
+        except Exception as e:
+            print(f"Translation error: {e}")
+            return {}
+        translated = {text: result.text for text, result in zip(texts, results)}
+        if self.translation_memory is not None:
+            self.translation_memory.put_many(list(translated.items()), target_language, source_language)
+        return translated
+    
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='translate')
+        return self._executor
+    
     def translate_disease_info(self, disease_info, target_language):
         """Translate disease information to target language"""
+        return self.translate_disease_records([disease_info], target_language)[0]
+    
+    def translate_disease_records(self, disease_records, target_language):
+        """Translate several disease records with one batched, deduplicated pass over their strings"""
         if target_language == 'en':
-            return disease_info
+            return disease_records
+        
+        strings = []
+        for disease_info in disease_records:
+            for value in disease_info.values():
+                if isinstance(value, str):
+                    strings.append(value)
+                elif isinstance(value, list):
+                    strings.extend(item for item in value if isinstance(item, str))
+        translated = self.translate_many(strings, target_language)
         
-        translated_info = {}
-        for key, value in disease_info.items():
-            if isinstance(value, str):
-                translated_info[key] = self.translate_text(value, target_language)
-            elif isinstance(value, list):
-                translated_info[key] = [self.translate_text(item, target_language) for item in value]
-            else:
-                translated_info[key] = value
+        translated_records = []
+        for disease_info in disease_records:
+            translated_info = {}
+            for key, value in disease_info.items():
+                if isinstance(value, str):
+                    translated_info[key] = translated.get(value, value)
+                elif isinstance(value, list):
+                    translated_info[key] = [translated.get(item, item) if isinstance(item, str) else item
+                                            for item in value]
+                else:
+                    translated_info[key] = value
+            translated_records.append(translated_info)
         
-        return translated_info
+        return translated_records
     
     def get_language_name(self, language_code):
         """Get language name from code"""
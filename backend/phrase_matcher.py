@@ -0,0 +1,98 @@
+# Multi-phrase text matching (Aho-Corasick automaton)
+from collections import deque
+
+
+def normalize_text(text):
+    """Lowercase text and collapse runs of whitespace"""
+    return ' '.join(text.lower().split())
+
+
+class PhraseMatcher:
+    """Find every occurrence of many phrases in a single pass over the text.
+
+    Phrases are added with ``add`` and the automaton is compiled with
+    ``build``. Matching cost depends on the length of the input and the
+    number of hits, not on how many phrases were added.
+    """
+
+    def __init__(self):
+        self.phrases = []
+        self._phrase_ids = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._built = False
+
+    def add(self, phrase):
+        """Add a phrase and return its id (duplicate phrases share one id)"""
+        if phrase in self._phrase_ids:
+            return self._phrase_ids[phrase]
+        if not phrase:
+            raise ValueError('Cannot add an empty phrase')
+
+        phrase_id = len(self.phrases)
+        self.phrases.append(phrase)
+        self._phrase_ids[phrase] = phrase_id
+
+        state = 0
+        for char in phrase:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(phrase_id)
+        self._built = False
+        return phrase_id
+
+    def get_id(self, phrase):
+        """Return the id of a previously added phrase, or None"""
+        return self._phrase_ids.get(phrase)
+
+    def build(self):
+        """Compute failure links so the automaton can be matched"""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # Inherit matches that end at the failure state (suffix phrases)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        self._built = True
+        return self
+
+    def iter_matches(self, text):
+        """Yield (start, end, phrase_id) for every phrase occurrence in text"""
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        phrases = self.phrases
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for phrase_id in output[state]:
+                yield index + 1 - len(phrases[phrase_id]), index + 1, phrase_id
+
+    def match_ids(self, text):
+        """Return the set of phrase ids that occur anywhere in text"""
+        return {phrase_id for _, _, phrase_id in self.iter_matches(text)}
+
+    def __len__(self):
+        return len(self.phrases)
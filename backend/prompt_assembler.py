@@ -0,0 +1,98 @@
+# Token-budgeted conversation context for Gemini prompts
+import re
+import threading
+
+HTML_TAG = re.compile(r'<[^>]+>')
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) without loading a tokenizer"""
+    return (len(text) + 3) // 4 if text else 0
+
+
+def clean_text(text, max_chars):
+    """Strip HTML formatting and collapse whitespace, truncating long texts"""
+    text = ' '.join(HTML_TAG.sub('', text or '').split())
+    return text if len(text) <= max_chars else text[:max_chars].rstrip() + '...'
+
+
+class PromptAssembler:
+    """Fit a session's history into a fixed token budget.
+
+    The newest turns are kept (lightly trimmed) as dialogue; older turns
+    are summarized down to short notes about what the patient reported;
+    anything that still does not fit is dropped.
+    """
+
+    def __init__(self, token_budget=400, recent_turns=2, max_reply_chars=400, max_note_chars=100):
+        self.token_budget = token_budget
+        self.recent_turns = recent_turns
+        self.max_reply_chars = max_reply_chars
+        self.max_note_chars = max_note_chars
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.tokens_saved = 0
+
+    def assemble(self, turns):
+        """Return (context text, stats) for turns ordered oldest to newest"""
+        full_tokens = sum(estimate_tokens(self.format_full_turn(turn)) for turn in turns)
+        used = 0
+        dialogue = []
+        notes = []
+
+        # Newest turns verbatim, as long as they fit
+        newest_first = list(reversed(turns))
+        verbatim_count = 0
+        for turn in newest_first[:self.recent_turns]:
+            line = (f"Patient: {clean_text(turn['user_message'], self.max_reply_chars)}\n"
+                    f"Assistant: {clean_text(turn['bot_message'], self.max_reply_chars)}")
+            cost = estimate_tokens(line)
+            if used + cost > self.token_budget:
+                break
+            dialogue.append(line)
+            used += cost
+            verbatim_count += 1
+
+        # Older turns shrink to notes about what the patient said
+        for turn in newest_first[verbatim_count:]:
+            note = clean_text(turn['user_message'], self.max_note_chars)
+            cost = estimate_tokens(note) + 1
+            if used + cost > self.token_budget:
+                break
+            notes.append(note)
+            used += cost
+
+        sections = []
+        if notes:
+            sections.append('Earlier the patient mentioned: ' + '; '.join(reversed(notes)))
+        sections.extend(reversed(dialogue))
+        context = '\n'.join(sections)
+
+        context_tokens = estimate_tokens(context)
+        stats = {
+            'history_turns': len(turns),
+            'verbatim_turns': len(dialogue),
+            'summarized_turns': len(notes),
+            'dropped_turns': len(turns) - len(dialogue) - len(notes),
+            'history_tokens': full_tokens,
+            'context_tokens': context_tokens,
+            'tokens_saved': max(0, full_tokens - context_tokens),
+            'token_budget': self.token_budget
+        }
+        with self._lock:
+            self.requests += 1
+            self.tokens_saved += stats['tokens_saved']
+        return context, stats
+
+    @staticmethod
+    def format_full_turn(turn):
+        return f"Patient: {turn['user_message']}\nAssistant: {turn['bot_message']}"
+
+    def stats(self):
+        with self._lock:
+            return {
+                'token_budget': self.token_budget,
+                'requests': self.requests,
+                'tokens_saved': self.tokens_saved,
+                'avg_tokens_saved': round(self.tokens_saved / self.requests, 1) if self.requests else 0.0
+            }
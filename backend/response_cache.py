@@ -0,0 +1,186 @@
+# Bounded LRU/TTL cache for Gemini completions
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from phrase_matcher import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# How long a write waits for another worker's transaction on the shared file
+BUSY_TIMEOUT_MS = 5000
+
+
+class ResponseCache:
+    """LRU cache with a time-to-live, keyed on normalized prompts.
+
+    Entries can optionally be persisted to a SQLite file so warm answers
+    survive restarts. The in-memory map is the source of truth while the
+    process runs; SQLite is written behind it and read back at startup.
+    Writes are queued under the cache lock and flushed in one transaction
+    outside it, so a slow or busy database never blocks cache lookups.
+    """
+
+    def __init__(self, max_entries=1000, ttl_seconds=3600, db_path=None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._entries = OrderedDict()  # key -> (value, created_at)
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._pending = []  # (sql, params) not yet written to SQLite
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if db_path:
+            self._open_db()
+
+    @staticmethod
+    def make_key(prompt):
+        """Hash the normalized prompt so equivalent prompts share an entry"""
+        return hashlib.sha256(normalize_text(prompt).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return the cached value or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, created_at = entry
+            expired = self._is_expired(created_at)
+            if expired:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if expired:
+            self._flush()
+            return None
+        return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries if full"""
+        created_at = time.time()
+        with self._lock:
+            self._entries[key] = (value, created_at)
+            self._entries.move_to_end(key)
+            self._queue(
+                'INSERT OR REPLACE INTO response_cache (key, value, created_at) VALUES (?, ?, ?)',
+                (key, value, created_at)
+            )
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+        self._flush()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._queue('DELETE FROM response_cache')
+        self._flush()
+
+    def stats(self):
+        """Counters for the metrics endpoint"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'persistent': self._db is not None
+            }
+
+    def after_fork(self):
+        """Reopen the SQLite connection in a forked worker process"""
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._pending = []
+        if self._db is not None:
+            self._db = self._connect()
+
+    def _is_expired(self, created_at):
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        self._queue('DELETE FROM response_cache WHERE key = ?', (key,))
+
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, check_same_thread=False)
+        db.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    def _open_db(self):
+        try:
+            self._db = self._connect()
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS response_cache '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)'
+            )
+            self._db.commit()
+            self._load_from_db()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache persistence disabled: {e}")
+            self._db = None
+
+    def _load_from_db(self):
+        """Warm the in-memory cache with the newest unexpired rows"""
+        if self.ttl_seconds is not None:
+            self._db.execute('DELETE FROM response_cache WHERE created_at < ?',
+                             (time.time() - self.ttl_seconds,))
+        rows = self._db.execute(
+            'SELECT key, value, created_at FROM response_cache ORDER BY created_at DESC LIMIT ?',
+            (self.max_entries,)
+        ).fetchall()
+        for key, value, created_at in reversed(rows):
+            self._entries[key] = (value, created_at)
+        self._db.execute(
+            'DELETE FROM response_cache WHERE key NOT IN '
+            '(SELECT key FROM response_cache ORDER BY created_at DESC LIMIT ?)',
+            (self.max_entries,)
+        )
+        self._db.commit()
+        logger.info(f"Loaded {len(rows)} cached responses from {self.db_path}")
+
+    def _queue(self, sql, params=()):
+        """Record a write for the next flush; called with the cache lock held"""
+        if self._db is not None:
+            self._pending.append((sql, params))
+
+    def _flush(self):
+        """Write queued changes to SQLite in one transaction per batch, without the cache lock.
+
+        Only one thread writes at a time; a thread that finds the writer
+        busy leaves its changes queued for it. The loop re-checks the queue
+        after releasing so nothing queued during the last batch is stranded.
+        """
+        while self._pending and self._db_lock.acquire(blocking=False):
+            try:
+                with self._lock:
+                    pending, self._pending = self._pending, []
+                try:
+                    with self._db:
+                        for sql, params in pending:
+                            self._db.execute(sql, params)
+                except sqlite3.Error as e:
+                    logger.warning(f"Response cache write failed: {e}")
+            finally:
+                self._db_lock.release()
@@ -0,0 +1,83 @@
+# Pre-serialized JSON responses for read-only API endpoints
+import gzip
+import hashlib
+import json
+
+from static_assets import accepted_encodings, accepts
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+
+class ResponseRegistry:
+    """Holds ready-to-send JSON bodies with strong ETags, keyed by URL path.
+
+    Each encoding of a body is a different representation, so the gzip
+    body gets its own ETag (the identity ETag with a ``-gz`` suffix).
+
+    Payloads are serialized once when registered (and again only when
+    they are re-registered because the underlying data changed), so a
+    request costs a dict lookup and, with If-None-Match, usually a 304.
+    """
+
+    def __init__(self, dumps=None, cache_control='no-cache'):
+        self.dumps = dumps or (lambda payload: json.dumps(payload, sort_keys=True))
+        self.cache_control = cache_control
+        self._entries = {}
+        self.hits = 0
+        self.not_modified = 0
+
+    def build_entry(self, payload):
+        body = self.dumps(payload).encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        entry = {'identity': (body, f'"{digest}"')}
+        if len(body) >= GZIP_MIN_BYTES:
+            entry['gzip'] = (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gz"')
+        return entry
+
+    def register(self, path, payload):
+        """Serialize a payload for a path, replacing any previous body"""
+        entries = dict(self._entries)
+        entries[path] = self.build_entry(payload)
+        # Swap the whole map so readers never see a partial update
+        self._entries = entries
+
+    def register_all(self, payloads):
+        """Serialize several {path: payload} entries and swap them in together"""
+        entries = dict(self._entries)
+        for path, payload in payloads.items():
+            entries[path] = self.build_entry(payload)
+        self._entries = entries
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def lookup(self, path, accept_encoding=None, if_none_match=None):
+        """Return (status, body, headers) for a registered path, or None"""
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+
+        self.hits += 1
+        encoding = 'gzip' if 'gzip' in entry and accepts(accepted_encodings(accept_encoding), 'gzip') else 'identity'
+        body, etag = entry[encoding]
+        headers = {
+            'Content-Type': 'application/json',
+            'Cache-Control': self.cache_control,
+            'ETag': etag,
+            'Vary': 'Accept-Encoding'
+        }
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(',')]:
+            self.not_modified += 1
+            return 304, b'', headers
+        return 200, body, headers
+
+    def stats(self):
+        return {
+            'paths': sorted(self._entries.keys()),
+            'hits': self.hits,
+            'not_modified': self.not_modified
+        }
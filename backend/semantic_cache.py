@@ -0,0 +1,275 @@
+# Near-duplicate query cache over medical concepts and character n-grams
+import copy
+import difflib
+import re
+import string
+import threading
+import unicodedata
+import zlib
+
+import numpy as np
+
+# Filler words that carry no meaning for matching symptom questions
+STOP_WORDS = {
+    'a', 'an', 'the', 'and', 'or', 'i', 'me', 'my', 'am', 'is', 'are', 'was', 'were', 'be', 'have', 'has',
+    'had', 'having', 'been', 'with', 'of', 'for', 'to', 'in', 'on', 'at', 'from', 'since', 'some', 'also',
+    'very', 'it', 'its', 'please', 'what', 'which', 'how', 'do', 'does', 'did', 'should', 'can', 'could',
+    'would', 'will', 'there', 'any', 'this', 'that', 'these', 'those', 'he', 'she', 'we', 'you', 'your',
+    'our', 'his', 'her', 'their', 'they', 'them', "i'm", 'im', "i've", 'ive', 'get', 'getting', 'got',
+    'feel', 'feeling', 'suffering', 'experiencing', 'keep', 'keeps', 'lot', 'bit', 'little', 'really',
+    'bad', 'about', 'by', 'so', 'just', 'ways', 'way', 'tips', 'take', 'tell', 'know', 'today',
+    'morning', 'evening', 'night', 'yesterday', 'now', 'again', 'like', 'kind', 'one', 'during', 'while', 'but',
+    # Hindi fillers
+    'मुझे', 'मेरा', 'मेरी', 'मेरे', 'है', 'हैं', 'हो', 'और', 'में', 'का', 'की', 'के', 'को', 'से',
+    'रहा', 'रही', 'रहे', 'क्या', 'कैसे', 'भी'
+}
+
+# Phrasings folded onto one concept before embedding, so "head pain" and "headache"
+# are the same feature. Symptoms, diseases, who is ill and what is being asked all
+# count; emergencies never reach the cache, so they are not listed.
+CONCEPTS = {
+    # Symptoms
+    'fever': ['fever', 'fevers', 'feverish', 'high temperature', 'temperature', 'high fever', 'pyrexia',
+              'febrile', 'running a temperature'],
+    'headache': ['headache', 'headaches', 'head ache', 'head pain', 'head hurts', 'head is hurting',
+                 'pain in head', 'pain in my head', 'pain in the head'],
+    'cough': ['cough', 'coughs', 'coughing'],
+    'sore throat': ['sore throat', 'throat pain', 'throat hurts', 'painful throat', 'scratchy throat',
+                    'throat ache', 'pain in throat', 'pain in my throat'],
+    'runny nose': ['runny nose', 'running nose', 'blocked nose', 'stuffy nose', 'nasal congestion'],
+    'sneezing': ['sneezing', 'sneeze', 'sneezes'],
+    'stomach pain': ['stomach ache', 'stomachache', 'stomach pain', 'tummy ache', 'tummy pain', 'belly ache',
+                     'belly pain', 'abdominal pain', 'stomach hurts', 'tummy hurts', 'stomach cramps',
+                     'abdominal cramps', 'pain in stomach', 'pain in my stomach', 'pain in the stomach'],
+    'diarrhea': ['diarrhea', 'diarrhoea', 'loose motion', 'loose motions', 'loose stool', 'loose stools',
+                 'watery stool', 'watery stools'],
+    'vomiting': ['vomiting', 'vomit', 'vomits', 'vomited', 'throwing up', 'throw up', 'threw up', 'puking'],
+    'nausea': ['nausea', 'nauseous', 'nauseated', 'queasy'],
+    'fatigue': ['fatigue', 'tired', 'tiredness', 'exhausted', 'exhaustion', 'weakness', 'weak', 'lethargic'],
+    'dizziness': ['dizziness', 'dizzy', 'lightheaded', 'light headed', 'giddy', 'giddiness', 'vertigo'],
+    'chills': ['chills', 'chill', 'shivering', 'shivers'],
+    'body ache': ['body ache', 'body aches', 'body pain', 'muscle pain', 'muscle pains', 'muscle ache',
+                  'muscle aches', 'aching muscles', 'myalgia'],
+    'joint pain': ['joint pain', 'joint pains', 'aching joints', 'joints hurt', 'painful joints'],
+    'rash': ['rash', 'rashes', 'skin rash', 'rash on skin', 'rash on my skin', 'red spots', 'spots on skin'],
+    'itching': ['itching', 'itchy', 'itch', 'itchy skin'],
+    'sweating': ['sweating', 'sweats', 'sweaty'],
+    'ear pain': ['ear pain', 'earache', 'ear ache'],
+    # Diseases
+    'dengue': ['dengue', 'dengue fever'],
+    'malaria': ['malaria'],
+    'typhoid': ['typhoid', 'typhoid fever', 'enteric fever'],
+    'cholera': ['cholera'],
+    'covid': ['covid', 'covid-19', 'covid19', 'coronavirus', 'corona'],
+    'flu': ['flu', 'influenza'],
+    'tuberculosis': ['tuberculosis', 'tb'],
+    'common cold': ['common cold', 'cold'],
+    # Who is ill
+    'child': ['child', 'children', 'kid', 'kids', 'son', 'daughter'],
+    'infant': ['baby', 'babies', 'infant', 'infants', 'newborn', 'toddler'],
+    'pregnancy': ['pregnant', 'pregnancy', 'expecting'],
+    # What is asked
+    'treatment': ['treat', 'treatment', 'treatments', 'treated', 'treating', 'cure', 'cured', 'remedy',
+                  'remedies', 'home remedy', 'home remedies', 'medicine', 'medicines', 'medication',
+                  'get rid of', 'relief', 'relieve', 'what to do', 'what should i do', 'what do i do'],
+    'symptoms': ['symptoms', 'symptom', 'signs', 'sign', 'signs and symptoms'],
+    'prevention': ['prevent', 'prevention', 'prevented', 'preventing', 'avoid', 'avoiding', 'protect',
+                   'protecting', 'protection', 'precautions', 'precaution'],
+    'spread': ['spread', 'spreads', 'spreading', 'transmitted', 'transmission', 'contagious', 'infectious'],
+    'cause': ['cause', 'causes', 'caused', 'reason', 'reasons'],
+    'vaccine': ['vaccine', 'vaccines', 'vaccination', 'vaccinated', 'immunization', 'immunisation'],
+}
+
+# Unknown words this close to a one-word concept (difflib ratio) are read as a misspelling of it
+TYPO_CUTOFF = 0.85
+TYPO_MIN_LENGTH = 5
+
+# Word-edge punctuation dropped when splitting a message into tokens
+EDGE_PUNCTUATION = string.punctuation + '।॥¿¡“”‘’…'
+
+# Words that flip a medical question's meaning ("pregnant" vs "not pregnant")
+NEGATION_PATTERN = re.compile(
+    r"\b(?:not|no|never|without|none|nor|cannot|neither)\b|n't\b|नहीं|नही|मत|नाही", re.IGNORECASE
+)
+
+# Numbers with an optional unit, so "500mg" and "5000 mg" stay different questions
+QUANTITY_PATTERN = re.compile(r'(\d+(?:[.,]\d+)?)\s*(mg|mcg|µg|g|kg|ml|l|iu|%|x|times|days?|hours?|weeks?)?\b')
+
+
+def tokenize(text):
+    """Lowercased words split on whitespace, keeping the marks that Indic scripts need"""
+    words = unicodedata.normalize('NFC', text).lower().replace('/', ' ').split()
+    return [token for token in (word.strip(EDGE_PUNCTUATION) for word in words) if token]
+
+
+def meaning_guard(text):
+    """Negation count and quantities of a message; a cache hit needs these to match exactly.
+
+    Concept and n-gram similarity barely moves when "not" or one digit is
+    added, so these are compared as tokens rather than left to the cosine.
+    """
+    lowered = text.lower()
+    negations = len(NEGATION_PATTERN.findall(lowered))
+    quantities = sorted((number.replace(',', '.'), unit.rstrip('s')) for number, unit in QUANTITY_PATTERN.findall(lowered))
+    return negations, tuple(quantities)
+
+
+class SemanticCache:
+    """Serve cached answers for paraphrased questions.
+
+    A message is first reduced to its content: known phrasings become one
+    concept (``CONCEPTS``, plus native-language symptom words from the
+    optional ``lexicon``) and filler words are dropped, so "fever with
+    head pain" and "headache and high temperature" both become
+    {fever, headache}. Each remaining term is embedded as a hashed term
+    feature plus its character n-grams, which keeps misspelled or inflected
+    words close; every term carries the same weight however long it is.
+    All cached vectors live in one NumPy matrix, so a lookup is a single
+    matrix-vector product. When the cache is full the oldest entry is
+    overwritten.
+
+    Entries whose negations or quantities differ from the query's (see
+    ``meaning_guard``) are never returned, however similar the vectors.
+    The default threshold is calibrated by benchmarks/calibrate_semantic_cache.py.
+    """
+
+    def __init__(self, max_entries=500, threshold=0.85, n_features=2048, ngram_range=(3, 4), lexicon=None):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self._phrases = {'': self._phrase_table(CONCEPTS)}
+        for language, labels in (lexicon or {}).items():
+            # Native symptom words map to their English keyword, then to its concept
+            native = {}
+            for terms in labels.values():
+                for phrase, english in terms.items():
+                    concept = self._phrases[''].get(tuple(tokenize(english)), english)
+                    native.setdefault(concept, []).append(phrase)
+            self._phrases[language] = self._phrase_table(native)
+        self._longest = max(len(phrase) for table in self._phrases.values() for phrase in table)
+        self._typo_targets = sorted(
+            phrase[0] for phrase in self._phrases[''] if len(phrase) == 1 and len(phrase[0]) >= TYPO_MIN_LENGTH
+        )
+        self._typos = {}
+        self._matrix = np.zeros((max_entries, n_features), dtype=np.float32)
+        self._languages = np.full(max_entries, -1, dtype=np.int32)
+        self._values = [None] * max_entries
+        self._guards = [None] * max_entries
+        self._language_ids = {}
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _phrase_table(concepts):
+        return {tuple(tokenize(phrase)): concept for concept, phrases in concepts.items() for phrase in phrases}
+
+    def terms(self, text, language='en'):
+        """Concepts and remaining content words of a message, longest phrase first"""
+        tokens = tokenize(text)
+        tables = [self._phrases.get(language, {}), self._phrases['']]
+        terms = set()
+        i = 0
+        while i < len(tokens):
+            for n in range(min(self._longest, len(tokens) - i), 0, -1):
+                phrase = tuple(tokens[i:i + n])
+                concept = next((table[phrase] for table in tables if phrase in table), None)
+                if concept is not None:
+                    terms.add(concept)
+                    i += n
+                    break
+            else:
+                if tokens[i] not in STOP_WORDS:
+                    terms.add(self._spelling(tokens[i]))
+                i += 1
+        return terms
+
+    def _spelling(self, token):
+        """The concept a misspelled word stands for ("feverr" -> fever), else the word itself"""
+        if len(token) < TYPO_MIN_LENGTH or not token.isalpha():
+            return token
+        concept = self._typos.get(token)
+        if concept is None:
+            close = difflib.get_close_matches(token, self._typo_targets, n=1, cutoff=TYPO_CUTOFF)
+            concept = self._phrases[''][(close[0],)] if close else token
+            if len(self._typos) < 10000:
+                self._typos[token] = concept
+        return concept
+
+    def embed(self, text, language='en'):
+        """Return the normalized term + char n-gram vector for a message"""
+        vector = np.zeros(self.n_features, dtype=np.float32)
+        for term in self.terms(text, language):
+            padded = f' {term} '
+            grams = {padded[i:i + n] for n in range(self.ngram_range[0], self.ngram_range[1] + 1)
+                     for i in range(max(1, len(padded) - n + 1))}
+            vector[zlib.crc32(f'w:{term}'.encode('utf-8')) % self.n_features] += 1.0
+            # The n-grams of one term weigh as much as its term feature together
+            weight = 1.0 / np.sqrt(len(grams))
+            for gram in grams:
+                vector[zlib.crc32(gram.encode('utf-8')) % self.n_features] += weight
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector
+
+    def similarity(self, first, second, language='en'):
+        """Cosine similarity of two messages, as a lookup would score them"""
+        return float(self.embed(first, language) @ self.embed(second, language))
+
+    def lookup(self, text, language='en'):
+        """Return (cached value, similarity) for the closest match, or None"""
+        vector = self.embed(text, language)
+        guard = meaning_guard(text)
+        with self._lock:
+            language_id = self._language_ids.get(language)
+            if not self._size or language_id is None:
+                self.misses += 1
+                return None
+
+            similarities = self._matrix[:self._size] @ vector
+            similarities[self._languages[:self._size] != language_id] = -1.0
+            for slot in np.flatnonzero(similarities >= self.threshold):
+                if self._guards[slot] != guard:
+                    similarities[slot] = -1.0
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return copy.deepcopy(self._values[best]), similarity
+
+    def add(self, text, value, language='en'):
+        """Cache a value for a message, overwriting the oldest entry when full"""
+        vector = self.embed(text, language)
+        with self._lock:
+            language_id = self._language_ids.setdefault(language, len(self._language_ids))
+            slot = self._next
+            if self._size == self.max_entries:
+                self.evictions += 1
+            else:
+                self._size += 1
+            self._matrix[slot] = vector
+            self._languages[slot] = language_id
+            self._values[slot] = copy.deepcopy(value)
+            self._guards[slot] = meaning_guard(text)
+            self._next = (slot + 1) % self.max_entries
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': self._size,
+                'max_entries': self.max_entries,
+                'threshold': self.threshold,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
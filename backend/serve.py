@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Production launcher for the AI Medical Chatbot
+
+Runs the integrated app (frontend + API) under gunicorn. The disease data
+and Gemini client are loaded once in the master process before workers
+are forked, so workers start instantly and share those pages.
+
+Usage:
+    python backend/serve.py              # gunicorn gthread workers (WSGI)
+    python backend/serve.py --asgi       # uvicorn workers with async /api/chat
+    python backend/serve.py --workers 4 --threads 8 --port 8000
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+
+from gunicorn.app.base import BaseApplication
+
+# The app resolves ../frontend and ../data relative to the backend directory
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+os.chdir(BACKEND_DIR)
+
+logger = logging.getLogger(__name__)
+
+
+def default_workers():
+    """gunicorn's recommended 2 x CPU + 1, overridable with WEB_WORKERS"""
+    return int(os.environ.get('WEB_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+
+def default_threads():
+    """Threads per worker; chat requests mostly wait on Gemini, so more than one helps"""
+    return int(os.environ.get('WEB_THREADS', 4))
+
+
+def post_fork(server, worker):
+    # Threads, SQLite handles and thread pools do not survive fork()
+    from integrated_app import chatbot
+    chatbot.after_fork()
+
+
+def worker_exit(server, worker):
+    # Flush pending conversation writes and stop upstream calls cleanly
+    from integrated_app import chatbot
+    chatbot.shutdown()
+
+
+class ChatbotServer(BaseApplication):
+    """Embedded gunicorn application with preloaded chatbot state"""
+
+    def __init__(self, options, asgi=False):
+        self.options = options
+        self.asgi = asgi
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            if key in self.cfg.settings and value is not None:
+                self.cfg.set(key, value)
+
+    def load(self):
+        if self.asgi:
+            from asgi import application
+            return application
+        from integrated_app import app
+        return app
+
+
+def build_options(args):
+    options = {
+        'bind': f'{args.host}:{args.port}',
+        'workers': args.workers,
+        'preload_app': True,
+        'graceful_timeout': args.graceful_timeout,
+        'timeout': args.timeout,
+        'keepalive': 5,
+        'accesslog': '-',
+        'errorlog': '-',
+        'loglevel': os.environ.get('LOG_LEVEL', 'info'),
+        'post_fork': post_fork,
+        'worker_exit': worker_exit
+    }
+    if args.asgi:
+        options['worker_class'] = 'uvicorn.workers.UvicornWorker'
+    else:
+        options['worker_class'] = 'gthread'
+        options['threads'] = args.threads
+    return options
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the AI Medical Chatbot under gunicorn')
+    parser.add_argument('--host', default=os.environ.get('HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 5000)))
+    parser.add_argument('--workers', type=int, default=default_workers())
+    parser.add_argument('--threads', type=int, default=default_threads())
+    parser.add_argument('--asgi', action='store_true', default=os.environ.get('WEB_ASGI', 'false').lower() == 'true',
+                        help='serve the ASGI app (non-blocking /api/chat) with uvicorn workers')
+    parser.add_argument('--timeout', type=int, default=int(os.environ.get('WEB_TIMEOUT', 60)),
+                        help='seconds before a silent worker is restarted')
+    parser.add_argument('--graceful-timeout', type=int, default=int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30)),
+                        help='seconds workers get to finish in-flight requests on shutdown')
+    args = parser.parse_args()
+
+    # Config reads this to pick stores that are shared between worker processes
+    os.environ['WEB_WORKERS'] = str(args.workers)
+
+    mode = 'ASGI (uvicorn workers)' if args.asgi else f'WSGI (gthread, {args.threads} threads/worker)'
+    print("🏥 AI Medical Chatbot Server Starting...")
+    print(f"🌐 Frontend and API available at: http://localhost:{args.port}")
+    print(f"⚙️  {args.workers} workers, {mode}")
+    ChatbotServer(build_options(args), asgi=args.asgi).run()
+
+
+if __name__ == '__main__':
+    main()
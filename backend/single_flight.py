@@ -0,0 +1,75 @@
+# Single-flight deduplication of identical in-flight upstream calls
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers with the same key.
+
+    The first caller for a key (the leader) starts the work; callers that
+    arrive while it is running are coalesced onto the leader's future and
+    get the same result or exception. Nothing is kept once the call
+    finishes, so this complements a result cache rather than replacing it.
+    """
+
+    def __init__(self):
+        self._futures = {}  # key -> Future of the in-flight call
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, *args):
+        """Run fn(*args) in this thread, or wait for the in-flight call with the same key"""
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = Future()
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            return future.result()
+
+        future.set_running_or_notify_cancel()
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            self._forget(key, future)
+            future.set_exception(e)
+            raise
+        self._forget(key, future)
+        future.set_result(result)
+        return result
+
+    def submit(self, key, start):
+        """Return the in-flight future for key, or register and return the future from start()
+
+        start() is only called for the leader, under the lock, so it must
+        merely schedule the work (e.g. executor.submit) and return.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future
+            future = self._futures[key] = start()
+            self.calls += 1
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def stats(self):
+        with self._lock:
+            total = self.calls + self.coalesced
+            return {
+                'in_flight': len(self._futures),
+                'upstream_calls': self.calls,
+                'coalesced': self.coalesced,
+                'coalesced_rate': round(self.coalesced / total, 4) if total else 0.0
+            }
@@ -0,0 +1,171 @@
+# Fingerprinted, precompressed frontend bundle
+#
+# Build with:  python backend/static_assets.py
+# The bundle is written to frontend/dist and served by nginx (see nginx.conf)
+# or, when no proxy is in front, by the Flask app from memory.
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always produced
+    brotli = None
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+FRONTEND_DIR = os.path.join(os.path.dirname(BACKEND_DIR), 'frontend')
+DIST_DIR = os.path.join(FRONTEND_DIR, 'dist')
+MANIFEST_NAME = 'manifest.json'
+
+# Assets referenced from index.html that get content hashes in their names
+FINGERPRINTED_ASSETS = ['script.js', 'styles.css']
+ENTRY_POINT = 'index.html'
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+
+def accepted_encodings(accept_encoding):
+    """{coding: q} from an Accept-Encoding header; q=0 means the coding is refused"""
+    accepted = {}
+    for token in (accept_encoding or '').lower().split(','):
+        coding, _, params = token.partition(';')
+        coding = coding.strip()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def accepts(accepted, coding):
+    """True when the parsed header allows coding, directly or through '*'"""
+    return accepted.get(coding, accepted.get('*', 0.0)) > 0
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def write_variants(dist_dir, name, data):
+    """Write a file plus its .gz (and .br when available) siblings"""
+    path = os.path.join(dist_dir, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    with open(path + '.gz', 'wb') as f:
+        # mtime=0 keeps the output byte-identical between builds
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+def build(frontend_dir=FRONTEND_DIR, dist_dir=DIST_DIR):
+    """Build the bundle and return the {original name: fingerprinted name} manifest"""
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    manifest = {}
+    for name in FINGERPRINTED_ASSETS:
+        with open(os.path.join(frontend_dir, name), 'rb') as f:
+            data = f.read()
+        stem, ext = os.path.splitext(name)
+        hashed_name = f'{stem}.{content_hash(data)}{ext}'
+        write_variants(dist_dir, hashed_name, data)
+        manifest[name] = hashed_name
+
+    with open(os.path.join(frontend_dir, ENTRY_POINT), encoding='utf-8') as f:
+        html = f.read()
+    for name, hashed_name in manifest.items():
+        html = re.sub(r'(\b(?:href|src)=")' + re.escape(name) + '"', r'\g<1>' + hashed_name + '"', html)
+    write_variants(dist_dir, ENTRY_POINT, html.encode('utf-8'))
+    manifest[ENTRY_POINT] = ENTRY_POINT
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+class StaticAssets:
+    """Serves a built bundle from memory with strong caching headers.
+
+    Every file and its precompressed variants are read once at startup.
+    Fingerprinted files are marked immutable for a year; index.html is
+    revalidated with its ETag, so repeat visits cost one 304 at most.
+    """
+
+    def __init__(self, dist_dir=DIST_DIR):
+        self.dist_dir = dist_dir
+        self.files = {}  # name -> {encoding: (body, etag)}
+        self.cache_control = {}
+        self.enabled = os.path.exists(os.path.join(dist_dir, MANIFEST_NAME))
+        if self.enabled:
+            self._load()
+
+    def _load(self):
+        with open(os.path.join(self.dist_dir, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+        for name in manifest.values():
+            variants = {}
+            for encoding, suffix in (('identity', ''), ('gzip', '.gz'), ('br', '.br')):
+                path = os.path.join(self.dist_dir, name + suffix)
+                if os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        body = f.read()
+                    variants[encoding] = (body, f'"{content_hash(body)}"')
+            self.files[name] = variants
+            self.cache_control[name] = REVALIDATE_CACHE if name == ENTRY_POINT else IMMUTABLE_CACHE
+
+    def __contains__(self, name):
+        return name in self.files
+
+    @staticmethod
+    def choose_encoding(variants, accept_encoding):
+        accepted = accepted_encodings(accept_encoding)
+        for encoding in ('br', 'gzip'):
+            if encoding in variants and accepts(accepted, encoding):
+                return encoding
+        return 'identity'
+
+    def lookup(self, name, accept_encoding, if_none_match=None):
+        """Return (status, body, headers) for a bundled file, or None if unknown"""
+        variants = self.files.get(name)
+        if variants is None:
+            return None
+
+        encoding = self.choose_encoding(variants, accept_encoding)
+        body, etag = variants[encoding]
+        content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        if content_type.startswith('text/'):
+            content_type += '; charset=utf-8'
+        headers = {
+            'Content-Type': content_type,
+            'Cache-Control': self.cache_control[name],
+            'ETag': etag,
+            'Vary': 'Accept-Encoding'
+        }
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(',')]:
+            return 304, b'', headers
+        return 200, body, headers
+
+
+if __name__ == '__main__':
+    built = build()
+    print(f"Built {len(built)} files into {DIST_DIR} (brotli: {'yes' if brotli else 'not installed'})")
+    for original, hashed in built.items():
+        print(f"  {original} -> {hashed}")
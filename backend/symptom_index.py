@@ -0,0 +1,126 @@
+# Precomputed symptom index for fast disease matching
+import heapq
+
+import numpy as np
+from scipy import sparse
+
+from disease_catalog import DiseaseCatalog
+from phrase_matcher import PhraseMatcher, normalize_text
+
+
+class SymptomIndex:
+    """Maps normalized symptom phrases to the diseases that list them.
+
+    Built once from the disease catalog. ``score`` walks the input text
+    once and only touches diseases that share at least one symptom with
+    it, so lookups stay cheap as the catalog grows.
+    """
+
+    def __init__(self, disease_data):
+        # Works on the compact catalog; plain nested dicts are compiled first
+        if not isinstance(disease_data, DiseaseCatalog):
+            disease_data = DiseaseCatalog.from_dict(disease_data)
+        self.catalog = disease_data
+        self.matcher = PhraseMatcher()
+        self.postings = []  # phrase id -> list of disease ordinals
+        self.symptom_counts = disease_data.list_lengths('symptoms')
+
+        phrase_ids = {}  # catalog string id -> phrase id (None for blank symptoms)
+        for ordinal in range(len(disease_data)):
+            for string_id in disease_data.list_ids('symptoms', ordinal).tolist():
+                if string_id not in phrase_ids:
+                    phrase = normalize_text(disease_data.string(string_id))
+                    phrase_ids[string_id] = self.matcher.add(phrase) if phrase else None
+                phrase_id = phrase_ids[string_id]
+                if phrase_id is None:
+                    continue
+                while phrase_id >= len(self.postings):
+                    self.postings.append([])
+                self.postings[phrase_id].append(ordinal)
+
+        self.matcher.build()
+        self._incidence = None
+
+    def match_counts(self, symptoms_text):
+        """Return {disease ordinal: number of matched symptoms} for the text"""
+        counts = {}
+        for phrase_id in self.matcher.match_ids(normalize_text(symptoms_text)):
+            for ordinal in self.postings[phrase_id]:
+                counts[ordinal] = counts.get(ordinal, 0) + 1
+        return counts
+
+    def score(self, symptoms_text, limit=3):
+        """Return the top matching diseases in the analyze_symptoms format"""
+        ranked = []
+        for ordinal, matches in self.match_counts(symptoms_text).items():
+            confidence = round((matches / int(self.symptom_counts[ordinal])) * 100, 2)
+            ranked.append((-confidence, ordinal, matches))
+
+        return [
+            {
+                'disease': self.catalog.name(ordinal),
+                'confidence': -neg_confidence,
+                'matched_symptoms': matches
+            }
+            for neg_confidence, ordinal, matches in heapq.nsmallest(limit, ranked)
+        ]
+
+    def incidence_matrix(self):
+        """Sparse phrase x disease matrix of symptom counts, built on first use"""
+        if self._incidence is None:
+            rows = [phrase_id for phrase_id, ordinals in enumerate(self.postings) for _ in ordinals]
+            cols = [ordinal for ordinals in self.postings for ordinal in ordinals]
+            self._incidence = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                shape=(len(self.postings), len(self.catalog))
+            )
+        return self._incidence
+
+    def score_batch(self, texts, limit=3):
+        """Score many texts at once; returns one ``score``-style list per text.
+
+        Builds a sparse message x phrase matrix and multiplies it by the
+        phrase x disease incidence matrix to get every match count in one
+        step. The top ``limit`` per message are then picked by sorting the
+        non-zero entries by (message, confidence), never densifying.
+        """
+        results = [[] for _ in texts]
+        disease_count = len(self.catalog)
+        if not texts or not disease_count or limit <= 0:
+            return results
+
+        rows, cols = [], []
+        for row, text in enumerate(texts):
+            phrase_ids = self.matcher.match_ids(normalize_text(text))
+            rows.extend([row] * len(phrase_ids))
+            cols.extend(phrase_ids)
+        messages = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(texts), len(self.postings))
+        )
+        counts = (messages @ self.incidence_matrix()).tocsr()
+        counts.eliminate_zeros()
+
+        message_rows = np.repeat(np.arange(len(texts)), np.diff(counts.indptr))
+        ordinals = counts.indices.astype(np.int64)
+        matches = counts.data
+        confidence = matches * 100.0 / self.symptom_counts[ordinals]
+        # Rank by rounded confidence, ties going to the earlier disease, as in ``score``
+        keys = np.rint(confidence * 100).astype(np.int64) * disease_count + (disease_count - 1 - ordinals)
+        order = np.lexsort((-keys, message_rows))
+        rank = np.arange(len(order)) - counts.indptr[message_rows[order]]
+        top = order[rank < limit]
+
+        names = {}
+        for row, ordinal, count in zip(message_rows[top].tolist(), ordinals[top].tolist(), matches[top].tolist()):
+            if ordinal not in names:
+                names[ordinal] = self.catalog.name(ordinal)
+            results[row].append({
+                'disease': names[ordinal],
+                'confidence': round((count / int(self.symptom_counts[ordinal])) * 100, 2),
+                'matched_symptoms': count
+            })
+        return results
+
+    def __len__(self):
+        return len(self.catalog)
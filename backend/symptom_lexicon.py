@@ -0,0 +1,320 @@
+# Native-language symptom and emergency keywords for the keyword router
+#
+# Extend without code changes by pointing SYMPTOM_LEXICON_FILE at a JSON
+# file in the NATIVE_KEYWORDS layout, e.g.
+#   {"symptom": {"fever": {"hi": ["ताप"]}}, "emergency": {"stroke": {"hi": ["लकवा"]}}}
+import json
+import logging
+import unicodedata
+
+from keyword_router import DEFAULT_KEYWORD_CLASSES
+
+logger = logging.getLogger(__name__)
+
+# label -> English keyword -> {language: [native phrases]}
+NATIVE_KEYWORDS = {
+    'symptom': {
+        'fever': {
+            'hi': ['बुखार', 'बुख़ार', 'ज्वर'],
+            'mr': ['ताप'],
+            'te': ['జ్వరం'],
+            'ta': ['காய்ச்சல்'],
+            'bn': ['জ্বর'],
+            'gu': ['તાવ'],
+            'kn': ['ಜ್ವರ'],
+            'ml': ['പനി'],
+            'or': ['ଜ୍ୱର'],
+            'pa': ['ਬੁਖਾਰ', 'ਬੁਖ਼ਾਰ'],
+            'ur': ['بخار']
+        },
+        'headache': {
+            'hi': ['सिरदर्द', 'सिर दर्द', 'सिर में दर्द'],
+            'mr': ['डोकेदुखी', 'डोके दुखत'],
+            'te': ['తలనొప్పి'],
+            'ta': ['தலைவலி'],
+            'bn': ['মাথাব্যথা', 'মাথা ব্যথা'],
+            'gu': ['માથાનો દુખાવો', 'માથું દુખે'],
+            'kn': ['ತಲೆನೋವು'],
+            'ml': ['തലവേദന'],
+            'or': ['ମୁଣ୍ଡବିନ୍ଧା'],
+            'pa': ['ਸਿਰਦਰਦ', 'ਸਿਰ ਦਰਦ'],
+            'ur': ['سر درد', 'سردرد']
+        },
+        'cough': {
+            'hi': ['खांसी', 'खाँसी'],
+            'mr': ['खोकला'],
+            'te': ['దగ్గు'],
+            'ta': ['இருமல்'],
+            'bn': ['কাশি'],
+            'gu': ['ઉધરસ', 'ખાંસી'],
+            'kn': ['ಕೆಮ್ಮು'],
+            'ml': ['ചുമ'],
+            'or': ['କାଶ'],
+            'pa': ['ਖੰਘ'],
+            'ur': ['کھانسی']
+        },
+        'pain': {
+            'hi': ['दर्द'],
+            'mr': ['दुखत', 'वेदना'],
+            'te': ['నొప్పి'],
+            'ta': ['வலி'],
+            'bn': ['ব্যথা'],
+            'gu': ['દુખાવો'],
+            'kn': ['ನೋವು'],
+            'ml': ['വേദന'],
+            'or': ['ଯନ୍ତ୍ରଣା', 'ବିନ୍ଧା'],
+            'pa': ['ਦਰਦ'],
+            'ur': ['درد']
+        },
+        'vomiting': {
+            'hi': ['उल्टी'],
+            'mr': ['उलटी', 'उलट्या'],
+            'te': ['వాంతులు', 'వాంతి'],
+            'ta': ['வாந்தி'],
+            'bn': ['বমি'],
+            'gu': ['ઉલટી'],
+            'kn': ['ವಾಂತಿ'],
+            'ml': ['ഛർദ്ദി'],
+            'or': ['ବାନ୍ତି'],
+            'pa': ['ਉਲਟੀ'],
+            'ur': ['الٹی']
+        },
+        'nausea': {
+            'hi': ['मतली', 'जी मिचला'],
+            'mr': ['मळमळ'],
+            'te': ['వికారం'],
+            'ta': ['குமட்டல்'],
+            'bn': ['বমি বমি ভাব'],
+            'gu': ['ઉબકા'],
+            'kn': ['ವಾಕರಿಕೆ'],
+            'ml': ['ഓക്കാനം'],
+            'or': ['ବାନ୍ତି ଭାବ'],
+            'pa': ['ਮਤਲੀ', 'ਜੀ ਕੱਚਾ'],
+            'ur': ['متلی']
+        },
+        'diarrhea': {
+            'hi': ['दस्त'],
+            'mr': ['जुलाब', 'अतिसार'],
+            'te': ['విరేచనాలు'],
+            'ta': ['வயிற்றுப்போக்கு'],
+            'bn': ['ডায়রিয়া', 'পাতলা পায়খানা'],
+            'gu': ['ઝાડા'],
+            'kn': ['ಅತಿಸಾರ', 'ಭೇದಿ'],
+            'ml': ['വയറിളക്കം'],
+            'or': ['ଝାଡ଼ା'],
+            'pa': ['ਦਸਤ'],
+            'ur': ['اسہال']
+        },
+        'fatigue': {
+            'hi': ['थकान'],
+            'mr': ['थकवा'],
+            'te': ['అలసట'],
+            'ta': ['சோர்வு'],
+            'bn': ['ক্লান্তি'],
+            'gu': ['થાક'],
+            'kn': ['ಆಯಾಸ'],
+            'ml': ['ക്ഷീണം'],
+            'or': ['କ୍ଲାନ୍ତି'],
+            'pa': ['ਥਕਾਵਟ'],
+            'ur': ['تھکاوٹ', 'تھکن']
+        },
+        'dizziness': {
+            'hi': ['चक्कर'],
+            'mr': ['चक्कर'],
+            'te': ['తల తిరగడం', 'కళ్లు తిరగడం'],
+            'ta': ['தலைச்சுற்றல்'],
+            'bn': ['মাথা ঘোরা'],
+            'gu': ['ચક્કર'],
+            'kn': ['ತಲೆತಿರುಗು', 'ತಲೆ ಸುತ್ತು'],
+            'ml': ['തലകറക്കം'],
+            'or': ['ମୁଣ୍ଡ ବୁଲାଇବା'],
+            'pa': ['ਚੱਕਰ'],
+            'ur': ['چکر']
+        },
+        'chills': {
+            'hi': ['कंपकंपी', 'ठंड लग'],
+            'mr': ['थंडी वाजून'],
+            'te': ['చలి'],
+            'ta': ['குளிர் நடுக்கம்'],
+            'bn': ['কাঁপুনি'],
+            'gu': ['ઠંડી લાગ'],
+            'kn': ['ಚಳಿ'],
+            'ml': ['കുളിര്'],
+            'or': ['ଥରିବା'],
+            'pa': ['ਕਾਂਬਾ'],
+            'ur': ['کپکپی']
+        },
+        'sore throat': {
+            'hi': ['गले में खराश', 'गला खराब'],
+            'mr': ['घसा खवखव', 'घसा दुखत'],
+            'te': ['గొంతు నొప్పి'],
+            'ta': ['தொண்டை வலி'],
+            'bn': ['গলা ব্যথা'],
+            'gu': ['ગળામાં દુખાવો'],
+            'kn': ['ಗಂಟಲು ನೋವು'],
+            'ml': ['തൊണ്ടവേദന'],
+            'or': ['ଗଳା ଯନ୍ତ୍ରଣା'],
+            'pa': ['ਗਲੇ ਵਿੱਚ ਖਰਾਸ਼', 'ਗਲਾ ਖਰਾਬ'],
+            'ur': ['گلے میں خراش', 'گلا خراب']
+        },
+        'rash': {
+            'hi': ['चकत्ते'],
+            'mr': ['पुरळ'],
+            'te': ['దద్దుర్లు'],
+            'ta': ['தடிப்பு'],
+            'bn': ['ফুসকুড়ি'],
+            'gu': ['ફોલ્લીઓ'],
+            'kn': ['ದದ್ದು'],
+            'ml': ['ചുണങ്ങ്'],
+            'or': ['ଫୁଟକୁଡ଼ି'],
+            'pa': ['ਧੱਫੜ'],
+            'ur': ['جلد پر دانے']
+        },
+        'shortness of breath': {
+            'hi': ['सांस फूल', 'साँस फूल'],
+            'mr': ['दम लाग', 'धाप लाग'],
+            'te': ['ఆయాసం'],
+            'ta': ['மூச்சு வாங்குதல்'],
+            'bn': ['হাঁপ ধরা'],
+            'gu': ['હાંફ ચડ'],
+            'kn': ['ಏದುಸಿರು'],
+            'ml': ['കിതപ്പ്'],
+            'or': ['ଧଇଁସଇଁ'],
+            'pa': ['ਸਾਹ ਚੜ੍ਹ'],
+            'ur': ['سانس پھول']
+        }
+    },
+    'emergency': {
+        'emergency': {
+            'hi': ['इमरजेंसी'],
+            'mr': ['आणीबाणी', 'आपत्कालीन'],
+            'gu': ['કટોકટી', 'ઇમરજન્સી'],
+            'kn': ['ತುರ್ತು'],
+            'ml': ['അടിയന്തര'],
+            'or': ['ଜରୁରୀକାଳୀନ'],
+            'pa': ['ਐਮਰਜੈਂਸੀ'],
+            'ur': ['ایمرجنسی']
+        },
+        'chest pain': {
+            'hi': ['सीने में दर्द', 'छाती में दर्द'],
+            'mr': ['छातीत दुखत', 'छातीत दुखणे'],
+            'te': ['ఛాతీ నొప్పి'],
+            'ta': ['நெஞ்சு வலி', 'நெஞ்சுவலி', 'மார்பு வலி'],
+            'bn': ['বুকে ব্যথা', 'বুক ব্যথা'],
+            'gu': ['છાતીમાં દુખાવો'],
+            'kn': ['ಎದೆ ನೋವು'],
+            'ml': ['നെഞ്ചുവേദന', 'നെഞ്ചു വേദന'],
+            'or': ['ଛାତି ଯନ୍ତ୍ରଣା'],
+            'pa': ['ਛਾਤੀ ਵਿੱਚ ਦਰਦ', 'ਛਾਤੀ ਦਰਦ'],
+            'ur': ['سینے میں درد', 'سینے کا درد']
+        },
+        'difficulty breathing': {
+            'hi': ['सांस लेने में तकलीफ', 'साँस लेने में तकलीफ', 'सांस लेने में दिक्कत'],
+            'mr': ['श्वास घ्यायला त्रास', 'श्वास घेण्यास त्रास'],
+            'te': ['శ్వాస తీసుకోవడంలో ఇబ్బంది', 'ఊపిరి ఆడటం లేదు'],
+            'ta': ['மூச்சுத் திணறல்', 'மூச்சு விட சிரமம்'],
+            'bn': ['শ্বাসকষ্ট', 'শ্বাস নিতে কষ্ট'],
+            'gu': ['શ્વાસ લેવામાં તકલીફ'],
+            'kn': ['ಉಸಿರಾಟದ ತೊಂದರೆ', 'ಉಸಿರಾಡಲು ಕಷ್ಟ'],
+            'ml': ['ശ്വാസംമുട്ടൽ', 'ശ്വാസതടസ്സം'],
+            'or': ['ଶ୍ୱାସ ନେବାରେ କଷ୍ଟ', 'ଶ୍ୱାସକଷ୍ଟ'],
+            'pa': ['ਸਾਹ ਲੈਣ ਵਿੱਚ ਤਕਲੀਫ਼', 'ਸਾਹ ਲੈਣ ਵਿੱਚ ਤਕਲੀਫ'],
+            'ur': ['سانس لینے میں دشواری', 'سانس لینے میں تکلیف']
+        },
+        'unconscious': {
+            'hi': ['बेहोश'],
+            'mr': ['बेशुद्ध'],
+            'te': ['స్పృహ కోల్పో', 'అపస్మారక'],
+            'ta': ['சுயநினைவு இழ', 'மயக்கமடைந்'],
+            'bn': ['অজ্ঞান'],
+            'gu': ['બેભાન'],
+            'kn': ['ಪ್ರಜ್ಞೆ ತಪ್ಪ', 'ಪ್ರಜ್ಞಾಹೀನ'],
+            'ml': ['ബോധം നഷ്ട', 'ബോധക്ഷയം'],
+            'or': ['ବେହୋସ', 'ଚେତାଶୂନ୍ୟ'],
+            'pa': ['ਬੇਹੋਸ਼'],
+            'ur': ['بے ہوش', 'بیہوش']
+        },
+        'heart attack': {
+            'hi': ['दिल का दौरा', 'हार्ट अटैक'],
+            'mr': ['हृदयविकाराचा झटका', 'हार्ट अटॅक'],
+            'te': ['గుండెపోటు'],
+            'ta': ['மாரடைப்பு'],
+            'bn': ['হার্ট অ্যাটাক'],
+            'gu': ['હાર્ટ એટેક', 'હૃદયરોગનો હુમલો'],
+            'kn': ['ಹೃದಯಾಘಾತ'],
+            'ml': ['ഹൃദയാഘാതം'],
+            'or': ['ହୃଦଘାତ'],
+            'pa': ['ਦਿਲ ਦਾ ਦੌਰਾ'],
+            'ur': ['دل کا دورہ', 'ہارٹ اٹیک']
+        },
+        'severe bleeding': {
+            'hi': ['बहुत खून बह', 'तेज़ खून बह'],
+            'mr': ['खूप रक्तस्त्राव'],
+            'te': ['తీవ్ర రక్తస్రావం'],
+            'ta': ['கடுமையான இரத்தப்போக்கு'],
+            'bn': ['প্রচুর রক্তপাত'],
+            'gu': ['ભારે રક્તસ્ત્રાવ'],
+            'kn': ['ತೀವ್ರ ರಕ್ತಸ್ರಾವ'],
+            'ml': ['കനത്ത രക്തസ്രാവം'],
+            'or': ['ଅଧିକ ରକ୍ତସ୍ରାବ'],
+            'pa': ['ਬਹੁਤ ਖੂਨ ਵਹਿ'],
+            'ur': ['بہت خون بہ']
+        },
+        'suicide': {
+            'hi': ['आत्महत्या', 'खुदकुशी'],
+            'mr': ['आत्महत्या'],
+            'te': ['ఆత్మహత్య'],
+            'ta': ['தற்கொலை'],
+            'bn': ['আত্মহত্যা'],
+            'gu': ['આત્મહત્યા'],
+            'kn': ['ಆತ್ಮಹತ್ಯೆ'],
+            'ml': ['ആത്മഹത്യ'],
+            'or': ['ଆତ୍ମହତ୍ୟା'],
+            'pa': ['ਖੁਦਕੁਸ਼ੀ', 'ਆਤਮ ਹੱਤਿਆ'],
+            'ur': ['خودکشی']
+        }
+    }
+}
+
+
+def normalize_native(term):
+    """NFC and lowercase, the form the keyword router matches against"""
+    return unicodedata.normalize('NFC', term).lower().strip()
+
+
+def merge_keywords(lexicon, keywords):
+    """Add a NATIVE_KEYWORDS-style mapping into {language: {label: {native: english}}}"""
+    for label, entries in keywords.items():
+        for english, by_language in entries.items():
+            for language, phrases in by_language.items():
+                terms = lexicon.setdefault(language, {}).setdefault(label, {})
+                for phrase in phrases:
+                    phrase = normalize_native(phrase)
+                    if phrase:
+                        terms.setdefault(phrase, english)
+    return lexicon
+
+
+def build_lexicon(medical_terms=None, extra_file=None):
+    """Native keyword -> English keyword per language and keyword class.
+
+    Seeded from the translated medical terms (any term that is also an
+    English router keyword), then the built-in NATIVE_KEYWORDS, then the
+    optional JSON file.
+    """
+    lexicon = {}
+    for language, terms in (medical_terms or {}).items():
+        if language == 'en':
+            continue
+        for english, native in terms.items():
+            for label, keywords in DEFAULT_KEYWORD_CLASSES.items():
+                if english in keywords:
+                    merge_keywords(lexicon, {label: {english: {language: [native]}}})
+    merge_keywords(lexicon, NATIVE_KEYWORDS)
+    if extra_file:
+        try:
+            with open(extra_file, encoding='utf-8') as f:
+                merge_keywords(lexicon, json.load(f))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring symptom lexicon file {extra_file}: {e}")
+    return lexicon
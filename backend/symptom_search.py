@@ -0,0 +1,216 @@
+# BM25 retrieval over disease symptoms, descriptions and causes
+import re
+
+import nltk
+import numpy as np
+from nltk.stem import PorterStemmer
+from scipy import sparse
+
+from semantic_cache import STOP_WORDS
+
+# Stems memoized per analyzer; beyond this, unseen query words are stemmed without caching
+MAX_CACHED_STEMS = 100000
+
+# Scores are rounded before ranking so summation order cannot reorder near-ties
+SCORE_DECIMALS = 9
+
+# Repeat counts per field: a symptom hit outweighs a mention in the description or causes
+DEFAULT_FIELD_WEIGHTS = {'symptoms': 3, 'description': 1, 'causes': 1}
+
+
+def load_stop_words():
+    """NLTK's English stopwords when downloaded, else the small built-in list"""
+    try:
+        from nltk.corpus import stopwords
+        return set(stopwords.words('english'))
+    except LookupError:
+        return set(STOP_WORDS)
+
+
+def load_tokenizer():
+    """nltk.word_tokenize when the punkt models are installed, else NLTK's regex tokenizer"""
+    try:
+        nltk.word_tokenize('probe')
+        return nltk.word_tokenize
+    except LookupError:
+        return nltk.wordpunct_tokenize
+
+
+class Analyzer:
+    """Tokenize, drop stopwords and Porter-stem text (stems are memoized)"""
+
+    def __init__(self):
+        self.tokenize = load_tokenizer()
+        self.stop_words = load_stop_words()
+        self.stemmer = PorterStemmer()
+        self._stems = {}
+
+    def words(self, text):
+        return [token for token in self.tokenize(text.lower())
+                if token.isalnum() and token not in self.stop_words]
+
+    def stem(self, word):
+        stem = self._stems.get(word)
+        if stem is None:
+            stem = self.stemmer.stem(word)
+            if len(self._stems) < MAX_CACHED_STEMS:
+                self._stems[word] = stem
+        return stem
+
+    def terms(self, text):
+        return [self.stem(word) for word in self.words(text)]
+
+    def query_terms(self, text):
+        """Query stems plus joined neighbours, so "head ache" also looks up "headache" """
+        words = self.words(text)
+        terms = [self.stem(word) for word in words]
+        terms.extend(self.stem(first + second) for first, second in zip(words, words[1:]))
+        return terms
+
+
+class SymptomSearch:
+    """Okapi BM25 index over the disease catalog.
+
+    Every term's postings hold precomputed BM25 weights (an impact
+    matrix), so a query only gathers the postings of its terms and sums
+    them with one ``bincount``; the top ``limit`` come from a
+    ``partition``. ``score`` and ``score_batch`` return the same
+    shape as SymptomIndex, so either engine can back analyze_symptoms,
+    except that the percentage is reported as ``relevance``: it is the
+    BM25 score relative to the best score the query terms could reach,
+    not the share of a disease's symptoms matched that ``confidence``
+    means for the phrase engine.
+    """
+
+    def __init__(self, catalog, k1=1.2, b=0.75, field_weights=None, min_relevance=5.0):
+        self.catalog = catalog
+        self.analyzer = Analyzer()
+        self.k1 = k1
+        self.min_relevance = min_relevance
+        self._symptom_terms = {}
+        field_weights = field_weights or DEFAULT_FIELD_WEIGHTS
+
+        vocabulary = {}
+        rows, cols, counts = [], [], []
+        lengths = np.zeros(len(catalog), dtype=np.float64)
+        for ordinal in range(len(catalog)):
+            info = catalog.info(ordinal)
+            tf = {}
+            for field, weight in field_weights.items():
+                value = info.get(field) or ''
+                text = ' '.join(value) if isinstance(value, list) else value
+                for term in self.analyzer.terms(text):
+                    tf[term] = tf.get(term, 0) + weight
+            for term, count in tf.items():
+                rows.append(vocabulary.setdefault(term, len(vocabulary)))
+                cols.append(ordinal)
+                counts.append(count)
+            lengths[ordinal] = sum(tf.values())
+
+        self.vocabulary = vocabulary
+        term_docs = sparse.csr_matrix((counts, (rows, cols)), shape=(len(vocabulary), len(catalog)),
+                                      dtype=np.float64)
+        document_frequency = np.diff(term_docs.indptr)
+        self.idf = np.log(1 + (len(catalog) - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        # BM25 term weight for every (term, disease) pair, computed once
+        average_length = lengths.mean() if len(catalog) else 0.0
+        tf_values = term_docs.data
+        norms = k1 * (1 - b + b * lengths[term_docs.indices] / (average_length or 1.0))
+        term_rows = np.repeat(np.arange(len(vocabulary)), document_frequency)
+        term_docs.data = self.idf[term_rows] * tf_values * (k1 + 1) / (tf_values + norms)
+        self.impacts = term_docs
+
+    def term_ids(self, text):
+        ids = {self.vocabulary.get(term) for term in self.analyzer.query_terms(text)}
+        ids.discard(None)
+        return sorted(ids)
+
+    def max_score(self, term_ids):
+        """Upper bound of a BM25 score for these terms, used to express relevance in percent"""
+        return float(self.idf[term_ids].sum()) * (self.k1 + 1)
+
+    def search(self, text, limit=3):
+        """Return [(disease ordinal, bm25 score)] best first"""
+        term_ids = self.term_ids(text)
+        if not term_ids or limit <= 0:
+            return [], term_ids
+        indptr = self.impacts.indptr
+        slices = [slice(indptr[term_id], indptr[term_id + 1]) for term_id in term_ids]
+        ordinals = np.concatenate([self.impacts.indices[part] for part in slices])
+        weights = np.concatenate([self.impacts.data[part] for part in slices])
+        scores = np.round(np.bincount(ordinals, weights=weights, minlength=len(self.catalog)), SCORE_DECIMALS)
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > limit:
+            # Keep everything tied with the limit-th best score so ties resolve by ordinal below
+            kth_best = -np.partition(-scores[candidates], limit - 1)[limit - 1]
+            candidates = candidates[scores[candidates] >= kth_best]
+        # Best score first, ties to the earlier disease
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))][:limit]
+        return [(int(ordinal), float(scores[ordinal])) for ordinal in candidates], term_ids
+
+    def symptom_terms(self, string_id):
+        """Stems of one catalog symptom string, ignoring parenthesised details (memoized)"""
+        terms = self._symptom_terms.get(string_id)
+        if terms is None:
+            text = re.sub(r'\([^)]*\)', ' ', self.catalog.string(string_id))
+            terms = self._symptom_terms[string_id] = frozenset(self.analyzer.terms(text))
+        return terms
+
+    def matched_symptoms(self, ordinal, query_terms):
+        """How many of a disease's symptoms have at least half their words in the query"""
+        matched = 0
+        for string_id in self.catalog.list_ids('symptoms', ordinal).tolist():
+            terms = self.symptom_terms(string_id)
+            if terms and len(terms & query_terms) * 2 >= len(terms):
+                matched += 1
+        return matched
+
+    def format_results(self, text, ranked, term_ids):
+        best = self.max_score(term_ids)
+        query_terms = set(self.analyzer.query_terms(text))
+        results = []
+        for ordinal, score in ranked:
+            relevance = round(score / best * 100, 2) if best else 0.0
+            if relevance < self.min_relevance:
+                continue
+            results.append({
+                'disease': self.catalog.name(ordinal),
+                'relevance': relevance,
+                'matched_symptoms': self.matched_symptoms(ordinal, query_terms)
+            })
+        return results
+
+    def score(self, symptoms_text, limit=3):
+        """Top matching diseases in the analyze_symptoms format"""
+        ranked, term_ids = self.search(symptoms_text, limit)
+        return self.format_results(symptoms_text, ranked, term_ids)
+
+    def score_batch(self, texts, limit=3):
+        """Score many texts with one sparse query x term by term x disease product"""
+        results = [[] for _ in texts]
+        if not texts or not len(self.catalog) or limit <= 0:
+            return results
+
+        query_ids = [self.term_ids(text) for text in texts]
+        rows = np.repeat(np.arange(len(texts)), [len(ids) for ids in query_ids])
+        cols = np.fromiter((term_id for ids in query_ids for term_id in ids), dtype=np.int64, count=len(rows))
+        queries = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(texts), len(self.vocabulary)))
+        scores = (queries @ self.impacts).tocsr()
+        scores.data = np.round(scores.data, SCORE_DECIMALS)
+        scores.eliminate_zeros()
+
+        score_rows = np.repeat(np.arange(len(texts)), np.diff(scores.indptr))
+        order = np.lexsort((scores.indices, -scores.data, score_rows))
+        rank = np.arange(len(order)) - scores.indptr[score_rows[order]]
+        top = order[rank < limit]
+
+        ranked = [[] for _ in texts]
+        for row, ordinal, score in zip(score_rows[top].tolist(), scores.indices[top].tolist(),
+                                       scores.data[top].tolist()):
+            ranked[row].append((ordinal, score))
+        return [self.format_results(text, ranked[row], query_ids[row]) for row, text in enumerate(texts)]
+
+    def __len__(self):
+        return len(self.catalog)
@@ -0,0 +1,238 @@
+# Persistent translation memory for MultilingualSupport
+#
+# Warm it offline for every supported language with:
+#   python backend/translation_memory.py --warm
+# or load translations produced elsewhere:
+#   python backend/translation_memory.py --import translations.jsonl
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from config import Config, sqlite_path
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATA_FILE = os.path.join(os.path.dirname(BACKEND_DIR), 'data', 'diseases.json')
+
+# SQLite allows 999 bound parameters per statement in older builds
+LOOKUP_BATCH = 500
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """(source, target, text hash) -> translation, stored in SQLite.
+
+    Checked before any remote translation call. Recently used entries
+    are also kept in a small in-process LRU so hot strings (disease
+    names, disclaimers) skip SQLite entirely.
+    """
+
+    def __init__(self, db_path, max_cached=10000):
+        self.db_path = db_path
+        self.max_cached = max_cached
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._db = self._connect()
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS translation_memory ('
+            'source TEXT NOT NULL, target TEXT NOT NULL, text_hash TEXT NOT NULL, '
+            'text TEXT NOT NULL, translation TEXT NOT NULL, created_at REAL NOT NULL, '
+            'PRIMARY KEY (source, target, text_hash))'
+        )
+        self._db.commit()
+
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    def after_fork(self):
+        """Reopen the SQLite connection in a forked worker process"""
+        self._lock = threading.Lock()
+        self._db = self._connect()
+
+    def _remember(self, key, translation):
+        self._cache[key] = translation
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+    def get(self, text, target, source='en'):
+        """Stored translation or None"""
+        return self.get_many([text], target, source).get(text)
+
+    def get_many(self, texts, target, source='en', record_stats=True):
+        """Return {text: translation} for the texts already in memory (one query per batch)"""
+        found = {}
+        pending = {}
+        with self._lock:
+            for text in set(texts):
+                key = (source, target, text_hash(text))
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[text] = self._cache[key]
+                else:
+                    pending[key[2]] = text
+
+            pending_hashes = list(pending)
+            for start in range(0, len(pending_hashes), LOOKUP_BATCH):
+                chunk = pending_hashes[start:start + LOOKUP_BATCH]
+                try:
+                    rows = self._db.execute(
+                        'SELECT text_hash, translation FROM translation_memory WHERE source = ? AND target = ? '
+                        f'AND text_hash IN ({",".join("?" * len(chunk))})',
+                        [source, target] + chunk
+                    ).fetchall()
+                except sqlite3.Error as e:
+                    logger.warning(f"Translation memory read failed: {e}")
+                    rows = []
+                for hash_value, translation in rows:
+                    found[pending[hash_value]] = translation
+                    self._remember((source, target, hash_value), translation)
+
+            if record_stats:
+                self.hits += len(found)
+                self.misses += len(set(texts)) - len(found)
+        return found
+
+    def put(self, text, translation, target, source='en'):
+        self.put_many([(text, translation)], target, source)
+
+    def put_many(self, pairs, target, source='en'):
+        """Store [(text, translation)] for one language pair"""
+        now = time.time()
+        rows = [(source, target, text_hash(text), text, translation, now) for text, translation in pairs]
+        with self._lock:
+            try:
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO translation_memory '
+                    '(source, target, text_hash, text, translation, created_at) VALUES (?, ?, ?, ?, ?, ?)',
+                    rows
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Translation memory write failed: {e}")
+                return
+            for source_, target_, hash_value, _, translation, _ in rows:
+                self._remember((source_, target_, hash_value), translation)
+
+    def coverage(self):
+        """Stored translations in total and per target language"""
+        with self._lock:
+            try:
+                by_language = dict(self._db.execute(
+                    'SELECT target, COUNT(*) FROM translation_memory GROUP BY target'
+                ).fetchall())
+            except sqlite3.Error:
+                by_language = {}
+        return {'entries': sum(by_language.values()), 'entries_by_language': by_language}
+
+    def stats(self):
+        """Coverage plus this instance's lookup counts"""
+        stats = self.coverage()
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats.update({
+                'cached_in_process': len(self._cache),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            })
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def create_translation_memory():
+    """TranslationMemory in the configured SQLite database, or None when disabled or not SQLite"""
+    db_path = sqlite_path(Config.DATABASE_URL)
+    if not Config.TRANSLATION_MEMORY_ENABLED or not db_path:
+        return None
+    try:
+        return TranslationMemory(db_path, max_cached=Config.TRANSLATION_MEMORY_CACHE_SIZE)
+    except sqlite3.Error as e:
+        logger.warning(f"Translation memory disabled: {e}")
+        return None
+
+
+def disease_strings(data_file=DEFAULT_DATA_FILE):
+    """Every translatable string in the disease catalog (names, descriptions, list items)"""
+    with open(data_file, encoding='utf-8') as f:
+        disease_data = json.load(f)
+    strings = set()
+    for info in disease_data.values():
+        for value in info.values():
+            if isinstance(value, str):
+                strings.add(value)
+            elif isinstance(value, list):
+                strings.update(item for item in value if isinstance(item, str))
+    return sorted(strings)
+
+
+def warm(multilingual, strings, languages):
+    """Translate whatever is missing from memory; returns {language: newly stored count}"""
+    memory = multilingual.translation_memory
+    added = {}
+    for language in languages:
+        known = memory.get_many(strings, language, record_stats=False)
+        missing = [text for text in strings if text not in known]
+        multilingual.translate_many(missing, language)
+        still_missing = len(missing) - len(memory.get_many(missing, language, record_stats=False))
+        added[language] = len(missing) - still_missing
+        logger.info(f"{language}: {added[language]} of {len(missing)} missing strings translated")
+    return added
+
+
+def import_jsonl(memory, path):
+    """Load {"source", "target", "text", "translation"} lines produced by another system"""
+    grouped = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                grouped.setdefault((row.get('source', 'en'), row['target']), []).append(
+                    (row['text'], row['translation'])
+                )
+    for (source, target), pairs in grouped.items():
+        memory.put_many(pairs, target, source)
+    return sum(len(pairs) for pairs in grouped.values())
+
+
+if __name__ == '__main__':
+    from multilingual import MultilingualSupport
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description='Warm or inspect the translation memory')
+    parser.add_argument('--warm', action='store_true', help='translate diseases.json into every supported language')
+    parser.add_argument('--data', default=DEFAULT_DATA_FILE)
+    parser.add_argument('--languages', nargs='+', default=[code for code in Config.SUPPORTED_LANGUAGES if code != 'en'])
+    parser.add_argument('--import', dest='import_path', help='JSONL file of pre-made translations')
+    args = parser.parse_args()
+
+    multilingual = MultilingualSupport()
+    memory = multilingual.translation_memory
+    if memory is None:
+        parser.error('translation memory is disabled or DATABASE_URL is not SQLite')
+    if args.import_path:
+        print(f"Imported {import_jsonl(memory, args.import_path)} translations")
+    if args.warm:
+        if multilingual.translator is None:
+            parser.error('--warm needs googletrans (pip install -r requirements.txt)')
+        added = warm(multilingual, disease_strings(args.data), args.languages)
+        print(f"Stored {sum(added.values())} new translations: {added}")
+    print(json.dumps(memory.stats(), indent=2, ensure_ascii=False))
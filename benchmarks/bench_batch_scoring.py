@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch symptom scoring: per-message SymptomIndex.score vs. vectorized score_batch
+
+Usage: python benchmarks/bench_batch_scoring.py [--messages 5000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(ROOT), 'backend'))
+sys.path.insert(0, ROOT)
+
+from bench_symptom_index import QUERIES, load_diseases, synthetic_catalog
+from symptom_index import SymptomIndex
+
+
+def transcripts(catalog, count, seed=7):
+    """Triage-style messages mixing 0-5 known symptoms with filler words"""
+    rng = random.Random(seed)
+    vocabulary = sorted({s for info in catalog.values() for s in info['symptoms']})
+    messages = list(QUERIES)
+    while len(messages) < count:
+        picked = rng.sample(vocabulary, rng.randint(0, 5))
+        messages.append('patient reports ' + ' and '.join(picked) + ' since yesterday')
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--messages', type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'diseases':>9} {'messages':>9} {'loop s':>8} {'batch s':>8} {'speedup':>8}")
+    print('-' * 46)
+    for size in (16, 1000, 10000):
+        catalog = synthetic_catalog(load_diseases(), size)
+        index = SymptomIndex(catalog)
+        messages = transcripts(catalog, args.messages)
+        index.score_batch(messages[:1])  # build the incidence matrix outside the timing
+
+        started = time.perf_counter()
+        expected = [index.score(message, limit=3) for message in messages]
+        loop_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        batched = index.score_batch(messages, limit=3)
+        batch_seconds = time.perf_counter() - started
+
+        assert batched == expected, 'score_batch disagrees with score'
+        print(f"{size:>9} {len(messages):>9} {loop_seconds:>8.3f} {batch_seconds:>8.3f} "
+              f"{loop_seconds / batch_seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark translating every disease record: one call per string vs batched, concurrent calls
+
+A stub translator stands in for the remote service and sleeps --latency
+seconds per call (a list of strings counts as one call), so the numbers
+show the effect of batching and concurrency rather than network noise.
+
+Usage: python benchmarks/bench_batch_translation.py [--latency 0.05] [--language hi]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(ROOT), 'backend'))
+
+from multilingual import MultilingualSupport
+
+
+class StubResult:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubTranslator:
+    """Fixed per-call latency, like a round trip to a translation API"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def translate(self, text, dest='en', src='auto'):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        if isinstance(text, list):
+            return [StubResult(f'[{dest}] {item}') for item in text]
+        return StubResult(f'[{dest}] {text}')
+
+
+def per_string(multilingual, records, language):
+    """The previous behaviour: one remote call per string"""
+    translated = []
+    for info in records:
+        translated.append({
+            key: multilingual.translate_remote(value, language) if isinstance(value, str)
+            else [multilingual.translate_remote(item, language) for item in value] if isinstance(value, list)
+            else value
+            for key, value in info.items()
+        })
+    return translated
+
+
+def run(label, fn, multilingual, records, language):
+    multilingual.translator = StubTranslator(multilingual.translator.latency)
+    started = time.perf_counter()
+    result = fn(multilingual, records, language)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22} {elapsed:8.2f} s  {multilingual.translator.calls:5d} calls")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds per translator call')
+    parser.add_argument('--language', default='hi')
+    args = parser.parse_args()
+
+    with open(os.path.join(os.path.dirname(ROOT), 'data', 'diseases.json')) as f:
+        records = list(json.load(f).values())
+    strings = sum(len(value) if isinstance(value, list) else 1 for info in records for value in info.values())
+
+    # No translation memory, so every run pays for every string
+    multilingual = MultilingualSupport()
+    multilingual.translation_memory = None
+    multilingual.translator = StubTranslator(args.latency)
+    print(f"{len(records)} records, {strings} strings, {args.latency * 1000:.0f} ms per call, "
+          f"batch size {multilingual.batch_size}, concurrency {multilingual.max_concurrency}")
+
+    serial = run('per string', per_string, multilingual, records, args.language)
+    batched = run('batched + concurrent', lambda m, r, l: m.translate_disease_records(r, l),
+                  multilingual, records, args.language)
+    assert serial == batched, 'batched translation differs from per-string translation'
+
+
+if __name__ == '__main__':
+    main()
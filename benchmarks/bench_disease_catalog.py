@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory footprint: nested disease dicts vs. the compact DiseaseCatalog
+
+Usage: python benchmarks/bench_disease_catalog.py [--sizes 1000 10000 50000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'backend'))
+
+from disease_catalog import DiseaseCatalog
+
+
+def synthetic_catalog(size, seed=42):
+    """Diseases with realistic overlap: symptoms and advice drawn from shared vocabularies"""
+    with open(os.path.join(ROOT, 'data', 'diseases.json')) as f:
+        base = json.load(f)
+    rng = random.Random(seed)
+    pools = {
+        field: sorted({item for info in base.values() for item in info.get(field, [])})
+        for field in ('symptoms', 'causes', 'prevention', 'treatment', 'emergency_signs')
+    }
+    catalog = {}
+    for n in range(size):
+        entry = {'name': f"Condition {n}", 'description': f"Synthetic condition number {n} used for benchmarking"}
+        for field, pool in pools.items():
+            entry[field] = rng.sample(pool, min(len(pool), 6))
+        catalog[f"condition_{n}"] = entry
+    return catalog
+
+
+def measure(build):
+    """Return (result, bytes still allocated after build)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'diseases':>9} {'dicts MB':>9} {'catalog MB':>11} {'mmap heap MB':>13} {'load ms':>8}")
+    print('-' * 54)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            raw = json.dumps(synthetic_catalog(size))
+            nested, dict_bytes = measure(lambda: json.loads(raw))
+            catalog, catalog_bytes = measure(lambda: DiseaseCatalog.from_dict(nested))
+            path = os.path.join(tmp, f'{size}.catalog')
+            catalog.save(path)
+
+            started = time.perf_counter()
+            mapped, heap_bytes = measure(lambda: DiseaseCatalog.load(path))
+            load_ms = (time.perf_counter() - started) * 1000
+            assert mapped[f'condition_{size - 1}'] == nested[f'condition_{size - 1}']
+
+            print(f"{size:>9} {dict_bytes / 1e6:>9.1f} {catalog_bytes / 1e6:>11.1f} "
+                  f"{heap_bytes / 1e6:>13.3f} {load_ms:>8.1f}")
+            del nested, catalog, mapped
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline language detection: accuracy on held-out messages and per-message latency
+
+None of these messages appear in the detector's training text.
+
+Usage: python benchmarks/bench_language_detection.py [--rounds 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(ROOT), 'backend'))
+
+from language_detector import LanguageDetector
+
+SAMPLES = [
+    ('en', 'I have had a high fever and body ache since two days'),
+    ('en', 'what are the symptoms of malaria?'),
+    ('en', 'my child is vomiting, what should I do'),
+    ('en', 'chest pain'),
+    ('en', '108'),
+    ('hi', 'मुझे तीन दिन से तेज बुखार है'),
+    ('hi', 'मलेरिया के लक्षण क्या होते हैं?'),
+    ('hi', 'मेरे सीने में दर्द हो रहा है'),
+    ('hi', 'बच्चे को उल्टी हो रही है, क्या करें'),
+    ('hi', 'मुझे रात को नींद नहीं आती'),
+    ('mr', 'मला तीन दिवसांपासून खूप ताप आहे'),
+    ('mr', 'मलेरियाची लक्षणे कोणती आहेत?'),
+    ('mr', 'माझ्या छातीत दुखत आहे'),
+    ('mr', 'मुलाला उलट्या होत आहेत, काय करावे'),
+    ('mr', 'मला रात्री झोप येत नाही'),
+    ('te', 'నాకు మూడు రోజులుగా జ్వరం ఉంది'),
+    ('te', 'మలేరియా లక్షణాలు ఏమిటి?'),
+    ('ta', 'எனக்கு மூன்று நாட்களாக காய்ச்சல் இருக்கிறது'),
+    ('ta', 'மலேரியாவின் அறிகுறிகள் என்ன?'),
+    ('bn', 'আমার তিন দিন ধরে জ্বর'),
+    ('bn', 'ম্যালেরিয়ার লক্ষণ কী?'),
+    ('gu', 'મને ત્રણ દિવસથી તાવ છે'),
+    ('gu', 'મેલેરિયાના લક્ષણો શું છે?'),
+    ('pa', 'ਮੈਨੂੰ ਤਿੰਨ ਦਿਨਾਂ ਤੋਂ ਬੁਖਾਰ ਹੈ'),
+    ('pa', 'ਮਲੇਰੀਆ ਦੇ ਲੱਛਣ ਕੀ ਹਨ?'),
+    ('or', 'ମୋତେ ତିନି ଦିନ ହେଲା ଜ୍ୱର ହେଉଛି'),
+    ('or', 'ମ୍ୟାଲେରିଆର ଲକ୍ଷଣ କଣ?'),
+    ('kn', 'ನನಗೆ ಮೂರು ದಿನಗಳಿಂದ ಜ್ವರ ಇದೆ'),
+    ('kn', 'ಮಲೇರಿಯಾದ ಲಕ್ಷಣಗಳು ಯಾವುವು?'),
+    ('ml', 'എനിക്ക് മൂന്ന് ദിവസമായി പനിയുണ്ട്'),
+    ('ml', 'മലേറിയയുടെ ലക്ഷണങ്ങൾ എന്തൊക്കെയാണ്?'),
+    ('ur', 'مجھے تین دن سے بخار ہے'),
+    ('ur', 'ملیریا کی علامات کیا ہیں؟'),
+    ('hi', 'मुझे fever और headache है'),
+    ('te', 'నాకు fever ఉంది'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=2000, help='timed passes over the samples')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    detector = LanguageDetector()
+    print(f"Model built in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    correct = Counter()
+    total = Counter()
+    for expected, text in SAMPLES:
+        detected = detector.detect(text)
+        total[expected] += 1
+        if detected == expected:
+            correct[expected] += 1
+        else:
+            print(f"  miss: expected {expected}, got {detected}: {text}")
+    for language in sorted(total):
+        print(f"{language}: {correct[language]}/{total[language]}")
+    print(f"Accuracy: {sum(correct.values())}/{len(SAMPLES)} "
+          f"({sum(correct.values()) / len(SAMPLES) * 100:.1f}%)")
+
+    timings = []
+    for _ in range(args.rounds):
+        for _, text in SAMPLES:
+            started = time.perf_counter()
+            detector.detect(text)
+            timings.append(time.perf_counter() - started)
+    timings.sort()
+    print(f"Latency over {len(timings)} detections: "
+          f"mean {sum(timings) / len(timings) * 1e6:.1f} us, "
+          f"p50 {timings[len(timings) // 2] * 1e6:.1f} us, "
+          f"p99 {timings[int(len(timings) * 0.99)] * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
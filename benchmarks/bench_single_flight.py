@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: upstream Gemini calls for a burst of identical /api/chat questions
+
+Replaces the Gemini model with a stub that takes --model-latency seconds
+per call, then fires --burst concurrent requests for each of --questions
+outbreak-style questions at /api/chat (threads) and at
+generate_response_async (one event loop). With single-flight
+deduplication each distinct question should reach the model once.
+Finally a sync caller and an async caller share one in-flight prompt,
+each way round.
+
+Usage: python benchmarks/bench_single_flight.py [--burst 50] [--questions 3] [--model-latency 0.3]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(ROOT), 'backend'))
+os.chdir(os.path.join(os.path.dirname(ROOT), 'backend'))
+
+logging.disable(logging.ERROR)
+import integrated_app  # noqa: E402
+from single_flight import SingleFlight  # noqa: E402
+
+QUESTIONS = [
+    'What are the symptoms of dengue fever?',
+    'How does cholera spread in a flood?',
+    'Is there a vaccine for Japanese encephalitis?',
+    'How do I protect my children from malaria?',
+]
+
+
+class SlowModel:
+    """Stands in for GenerativeModel: counts calls, each blocks for a fixed time"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return type('Response', (), {'text': 'Stub outbreak answer'})()
+
+
+def reset(chatbot, latency):
+    chatbot.gemini_model = SlowModel(latency)
+    chatbot.gemini_flights = SingleFlight()
+    chatbot.response_cache.clear()
+    return chatbot.gemini_model
+
+
+def run_threads(app, questions, burst):
+    def ask(index):
+        client = app.test_client()
+        reply = client.post('/api/chat', json={
+            'message': questions[index % len(questions)],
+            'session_id': f'burst-{index}'
+        }).get_json()
+        return reply['response']['type']
+
+    with ThreadPoolExecutor(max_workers=burst * len(questions)) as pool:
+        return list(pool.map(ask, range(burst * len(questions))))
+
+
+async def run_async(chatbot, questions, burst):
+    requests = [questions[index % len(questions)] for index in range(burst * len(questions))]
+    replies = await asyncio.gather(*(chatbot.generate_response_async(question) for question in requests))
+    return [reply['type'] for reply in replies]
+
+
+def run_mixed(chatbot, prompt, sync_leader):
+    """One sync and one async caller for the same prompt; returns both answers"""
+    sync_call = lambda: chatbot.get_gemini_completion(prompt)
+    async_call = lambda: asyncio.run(chatbot.get_gemini_completion_async(prompt))
+    leader, follower = (sync_call, async_call) if sync_leader else (async_call, sync_call)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leading = pool.submit(leader)
+        while chatbot.gemini_flights.stats()['in_flight'] == 0:
+            time.sleep(0.001)
+        following = follower()
+        return [leading.result(), following]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--burst', type=int, default=50, help='concurrent requests per question')
+    parser.add_argument('--questions', type=int, default=3, help='distinct questions in the burst')
+    parser.add_argument('--model-latency', type=float, default=0.3, help='seconds per stubbed model call')
+    args = parser.parse_args()
+
+    chatbot = integrated_app.chatbot
+    chatbot.gemini_enabled = True
+    # Paraphrase hits would hide the upstream calls being measured
+    chatbot.semantic_cache = None
+    questions = QUESTIONS[:args.questions]
+    total = args.burst * len(questions)
+
+    failed = False
+    for label, run in (
+        ('/api/chat threads', lambda: run_threads(integrated_app.app, questions, args.burst)),
+        ('generate_response_async', lambda: asyncio.run(run_async(chatbot, questions, args.burst))),
+    ):
+        model = reset(chatbot, args.model_latency)
+        started = time.perf_counter()
+        types = run()
+        elapsed = time.perf_counter() - started
+        stats = chatbot.gemini_flights.stats()
+        ai_answers = sum(1 for reply_type in types if reply_type == 'ai_analysis')
+        print(f"{label:24s} {total} requests, {len(questions)} questions: {model.calls} model calls, "
+              f"{stats['coalesced']} coalesced, {ai_answers} AI answers in {elapsed:.2f}s")
+        if model.calls != len(questions) or ai_answers != total:
+            failed = True
+
+    for label, sync_leader in (('sync leader, async one', True), ('async leader, sync one', False)):
+        model = reset(chatbot, args.model_latency)
+        try:
+            answers = run_mixed(chatbot, questions[0], sync_leader)
+        except Exception as e:
+            answers = [repr(e)]
+        stats = chatbot.gemini_flights.stats()
+        print(f"{label:24s} 2 requests: {model.calls} model calls, {stats['coalesced']} coalesced, answers {answers}")
+        if model.calls != 1 or stats['coalesced'] != 1 or answers != ['Stub outbreak answer'] * 2:
+            failed = True
+
+    chatbot.shutdown()
+    if failed:
+        print('FAIL: expected one model call per distinct question and an answer for every request')
+        sys.exit(1)
+    print('PASS')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark analyze_symptoms: linear catalog scan vs. precomputed SymptomIndex
+
+Usage: python benchmarks/bench_symptom_index.py
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'backend'))
+
+from symptom_index import SymptomIndex
+
+QUERIES = [
+    "I have fever and headache",
+    "fever, cough, body ache",
+    "chest pain and shortness of breath since morning",
+    "feeling tired with frequent urination and excessive thirst",
+    "runny nose, sneezing and sore throat for two days",
+    "severe joint pain, rash and high fever after mosquito bites",
+]
+
+
+def load_diseases():
+    with open(os.path.join(ROOT, 'data', 'diseases.json')) as f:
+        return json.load(f)
+
+
+def synthetic_catalog(base, size, seed=42):
+    """Grow the real catalog to `size` diseases with new symptom phrases"""
+    rng = random.Random(seed)
+    base_items = list(base.values())
+    vocabulary = sorted({s for info in base_items for s in info['symptoms']})
+    catalog = dict(base)
+    while len(catalog) < size:
+        n = len(catalog)
+        template = base_items[n % len(base_items)]
+        symptoms = rng.sample(vocabulary, 3) + [f"{s} variant {n}" for s in template['symptoms'][:4]]
+        catalog[f"condition_{n}"] = {'name': f"Condition {n}", 'symptoms': symptoms}
+    return catalog
+
+
+def linear_scan(disease_data, symptoms_text):
+    """The original analyze_symptoms implementation"""
+    symptoms_text = symptoms_text.lower()
+    possible_diseases = []
+    for disease, info in disease_data.items():
+        symptom_matches = 0
+        for symptom in info['symptoms']:
+            if symptom.lower() in symptoms_text:
+                symptom_matches += 1
+        if symptom_matches > 0:
+            confidence = (symptom_matches / len(info['symptoms'])) * 100
+            possible_diseases.append({
+                'disease': info['name'],
+                'confidence': round(confidence, 2),
+                'matched_symptoms': symptom_matches
+            })
+    possible_diseases.sort(key=lambda x: x['confidence'], reverse=True)
+    return possible_diseases[:3]
+
+
+def per_call_us(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            func(query)
+    return (time.perf_counter() - start) / (repeat * len(QUERIES)) * 1e6
+
+
+def main():
+    base = load_diseases()
+    print(f"{'diseases':>10} {'build ms':>10} {'scan us/call':>14} {'index us/call':>14} {'speedup':>8}")
+    print("-" * 60)
+    for size in (len(base), 1000, 10000):
+        catalog = synthetic_catalog(base, size)
+
+        start = time.perf_counter()
+        index = SymptomIndex(catalog)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for query in QUERIES:
+            assert index.score(query) == linear_scan(catalog, query), query
+
+        repeat = max(1, 20000 // size)
+        scan = per_call_us(lambda q: linear_scan(catalog, q), repeat)
+        indexed = per_call_us(index.score, 200)
+        print(f"{size:>10} {build_ms:>10.1f} {scan:>14.1f} {indexed:>14.1f} {scan / indexed:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
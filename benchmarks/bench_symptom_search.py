@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark BM25 SymptomSearch query latency against the phrase-matching SymptomIndex
+
+Usage: python benchmarks/bench_symptom_search.py [--sizes 16 1000 10000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(ROOT), 'backend'))
+sys.path.insert(0, ROOT)
+
+from bench_symptom_index import QUERIES
+from disease_catalog import DiseaseCatalog
+from symptom_index import SymptomIndex
+from symptom_search import SymptomSearch
+
+EXTRA_QUERIES = [
+    "head ache and fever",
+    "headaches, chills and sweating at night",
+    "stomach pains after eating spicy food",
+]
+
+
+def synthetic_catalog(size, seed=42):
+    """Real diseases plus generated ones reusing their symptom, description and cause vocabulary"""
+    with open(os.path.join(os.path.dirname(ROOT), 'data', 'diseases.json')) as f:
+        base = json.load(f)
+    rng = random.Random(seed)
+    symptoms = sorted({s for info in base.values() for s in info['symptoms']})
+    causes = sorted({c for info in base.values() for c in info.get('causes', [])})
+    descriptions = [info['description'] for info in base.values()]
+    catalog = dict(base)
+    while len(catalog) < size:
+        n = len(catalog)
+        catalog[f"condition_{n}"] = {
+            'name': f"Condition {n}",
+            'description': rng.choice(descriptions),
+            'symptoms': rng.sample(symptoms, 7) + [f"marker symptom {n}"],
+            'causes': rng.sample(causes, 3)
+        }
+    return catalog
+
+
+def per_query_ms(engine, queries, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            engine.score(query, limit=3)
+    return (time.perf_counter() - started) * 1000 / (rounds * len(queries))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[16, 1000, 10000])
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    queries = QUERIES + EXTRA_QUERIES
+    print(f"{'diseases':>9} {'bm25 build s':>13} {'bm25 ms/query':>14} {'phrase ms/query':>16}")
+    print('-' * 56)
+    for size in args.sizes:
+        catalog = DiseaseCatalog.from_dict(synthetic_catalog(size))
+        started = time.perf_counter()
+        search = SymptomSearch(catalog)
+        build_seconds = time.perf_counter() - started
+        index = SymptomIndex(catalog)
+        per_query_ms(search, queries, 1)  # warm the stem cache
+        assert search.score_batch(queries) == [search.score(query) for query in queries]
+
+        print(f"{size:>9} {build_seconds:>13.2f} {per_query_ms(search, queries, args.rounds):>14.3f} "
+              f"{per_query_ms(index, queries, args.rounds):>16.3f}")
+
+
+if __name__ == '__main__':
+    main()
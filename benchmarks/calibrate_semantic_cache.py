@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Calibrate the semantic cache threshold on labelled medical question pairs
+
+Scores every pair below with SemanticCache.similarity, prints the lowest
+paraphrase and highest non-paraphrase score, and checks that the
+threshold (--threshold, default SEMANTIC_CACHE_THRESHOLD) separates
+them. Each pair is then run through a real add/lookup, so the meaning
+guard (negations, doses, durations) is applied too. Pairs that only the
+guard tells apart are listed but left out of the cosine gap.
+
+Exits non-zero if any paraphrase misses or any non-paraphrase hits.
+
+Usage: python benchmarks/calibrate_semantic_cache.py [--threshold 0.85] [--verbose]
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(ROOT), 'backend'))
+
+from config import Config  # noqa: E402
+from multilingual import MEDICAL_TERMS  # noqa: E402
+from semantic_cache import SemanticCache, meaning_guard  # noqa: E402
+from symptom_lexicon import build_lexicon  # noqa: E402
+
+# (language, cached question, new question): the cached answer serves the new question
+PARAPHRASES = [
+    ('en', 'fever with head pain', 'headache and high temperature'),
+    ('en', 'I have a headache and fever', 'fever and headache since morning'),
+    ('en', 'What are the symptoms of dengue?', 'signs of dengue fever'),
+    ('en', 'how to treat a sore throat', 'what should I do for throat pain'),
+    ('en', 'I have a stomach ache and loose motions', 'tummy pain with diarrhea'),
+    ('en', 'my child is throwing up', 'my kid keeps vomiting'),
+    ('en', 'How does cholera spread?', 'how is cholera transmitted'),
+    ('en', 'How can I prevent malaria?', 'ways to avoid malaria'),
+    ('en', 'Is there a vaccine for Japanese encephalitis?', 'japanese encephalitis vaccination'),
+    ('en', 'I feel dizzy and tired', 'dizziness and fatigue'),
+    ('en', 'body aches and chills', 'muscle pain and shivering'),
+    ('en', 'What causes typhoid?', 'reasons for typhoid'),
+    ('en', 'I am coughing a lot', 'I have a bad cough'),
+    ('en', 'runny nose and sneezing', 'running nose and sneezing'),
+    ('en', 'symptoms of covid', 'coronavirus symptoms'),
+    ('en', 'flu treatment', 'how to cure influenza'),
+    ('en', 'rash on skin with itching', 'itchy skin rash'),
+    ('en', 'dengue symptoms in children', 'signs of dengue in kids'),
+    ('en', 'I have loose motions and vomiting', 'diarrhea and throwing up'),
+    ('en', 'home remedies for common cold', 'how to treat a cold'),
+    ('en', 'I have feverr and headache', 'fever and headache'),
+    ('en', 'how do I protect my children from malaria', 'preventing malaria in kids'),
+    ('en', 'Is typhoid contagious?', 'how does typhoid spread'),
+    ('en', 'joint pain and fever', 'aching joints with a high temperature'),
+    ('en', 'I am pregnant and have a fever, what should I do', 'fever during pregnancy treatment'),
+    ('hi', 'मुझे बुखार और सिर दर्द है', 'सिरदर्द और बुखार'),
+    ('hi', 'बुखार और खांसी', 'मुझे खाँसी और बुखार है'),
+]
+
+# Same wording, different question: serving the cached answer would be wrong
+NON_PARAPHRASES = [
+    ('en', 'fever and headache', 'fever and cough'),
+    ('en', 'What are the symptoms of dengue?', 'What is the treatment for dengue?'),
+    ('en', 'how to prevent malaria', 'symptoms of malaria'),
+    ('en', 'how does cholera spread', 'how to treat cholera'),
+    ('en', 'fever in a child', 'fever during pregnancy'),
+    ('en', 'symptoms of dengue', 'symptoms of malaria'),
+    ('en', 'I have a fever', 'I have a fever with a rash'),
+    ('en', 'stomach pain and diarrhea', 'stomach pain and vomiting'),
+    ('en', 'sore throat treatment', 'what causes a sore throat'),
+    ('en', 'is there a vaccine for typhoid', 'is there a vaccine for cholera'),
+    ('en', 'dizziness and fatigue', 'dizziness and nausea'),
+    ('en', 'my child has diarrhea', 'I have diarrhea'),
+    ('en', 'can I take ibuprofen for a headache', 'can I take paracetamol for a headache'),
+    ('en', 'dengue fever symptoms', 'fever symptoms'),
+    ('en', 'how to treat fever in children', 'how to treat fever in adults'),
+    ('en', 'fever, headache and cough', 'fever and headache'),
+    ('en', 'my baby has a fever', 'my son has a fever'),
+    ('en', 'cough with fever', 'cough with blood'),
+    ('en', 'symptoms of typhoid', 'symptoms of typhus'),
+    ('en', 'flu vaccine', 'flu symptoms'),
+    ('hi', 'बुखार और सिरदर्द', 'बुखार और खांसी'),
+    # Told apart only by the meaning guard
+    ('en', 'I am pregnant, can I take paracetamol?', 'I am not pregnant, can I take paracetamol?'),
+    ('en', '500mg paracetamol for fever', '5000mg paracetamol for fever'),
+    ('en', 'fever for 2 days', 'fever for 10 days'),
+    ('en', 'I do not have fever but have headache', 'I have fever and headache'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threshold', type=float, default=Config.SEMANTIC_CACHE_THRESHOLD)
+    parser.add_argument('--verbose', action='store_true', help='print every pair and its terms')
+    args = parser.parse_args()
+
+    lexicon = build_lexicon(MEDICAL_TERMS)
+    cache = SemanticCache(threshold=args.threshold, lexicon=lexicon)
+    failures = []
+    scores = {True: [], False: []}
+    for expected, pairs in ((True, PARAPHRASES), (False, NON_PARAPHRASES)):
+        for language, cached, asked in pairs:
+            similarity = cache.similarity(cached, asked, language)
+            guarded = meaning_guard(cached) != meaning_guard(asked)
+            if not guarded:
+                scores[expected].append(similarity)
+
+            probe = SemanticCache(threshold=args.threshold, lexicon=lexicon)
+            probe.add(cached, {'message': cached}, language)
+            hit = probe.lookup(asked, language) is not None
+            if hit != expected:
+                failures.append((expected, language, cached, asked, similarity))
+            if args.verbose:
+                label = 'same' if expected else 'diff'
+                print(f"{label} {'hit ' if hit else 'miss'} {similarity:.3f}{' guard' if guarded else ''}  "
+                      f"{cached!r} / {asked!r}  {sorted(cache.terms(cached, language))} / "
+                      f"{sorted(cache.terms(asked, language))}")
+
+    lowest_hit, highest_miss = min(scores[True]), max(scores[False])
+    print(f"{len(PARAPHRASES)} paraphrase pairs: lowest similarity {lowest_hit:.3f}")
+    print(f"{len(NON_PARAPHRASES)} non-paraphrase pairs: highest similarity {highest_miss:.3f} "
+          f"({len(NON_PARAPHRASES) - len(scores[False])} more told apart by the meaning guard)")
+    print(f"threshold {args.threshold} (any value in ({highest_miss:.3f}, {lowest_hit:.3f}] separates them)")
+
+    for expected, language, cached, asked, similarity in failures:
+        print(f"FAIL: {'paraphrase missed' if expected else 'different question hit'} "
+              f"({similarity:.3f}): {cached!r} / {asked!r} [{language}]")
+    if failures:
+        sys.exit(1)
+    print('PASS')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Fault injection for the Gemini circuit breaker behind /api/chat
+
+Replaces the Gemini model with an in-process stub that can be switched
+between healthy, failing and hanging, then drives /api/chat through
+healthy -> errors -> open -> recovery -> hangs -> recovery, then closes a
+streamed reply mid-way during a half-open probe, and checks that:
+
+  * the circuit opens on errors and on calls that hang past the timeout
+  * while open, replies are rule-based, make no model call and come back fast
+  * after the cool-down a half-open probe closes the circuit again
+  * the adaptive timeout bounds a hanging call near the healthy p95
+  * a client disconnecting mid-stream never leaves a probe slot taken
+
+Breaker settings are shrunk so the run takes a few seconds.
+
+Usage: python benchmarks/fault_injection_breaker.py [--open-seconds 0.5] [--fast-ms 20]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(ROOT), 'backend'))
+os.chdir(os.path.join(os.path.dirname(ROOT), 'backend'))
+
+logging.disable(logging.ERROR)
+import integrated_app  # noqa: E402
+from circuit_breaker import CircuitBreaker  # noqa: E402
+
+HEALTHY_LATENCY = 0.01
+HANG_SECONDS = 5.0
+
+
+class FaultyModel:
+    """Stands in for GenerativeModel; ``mode`` is 'healthy', 'error' or 'hang'"""
+
+    def __init__(self):
+        self.mode = 'healthy'
+        self.calls = 0
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        self.calls += 1
+        if self.mode == 'error':
+            raise RuntimeError('injected 503 from the model')
+        if self.mode == 'hang':
+            # The real client gives up after request_options['timeout']
+            timeout = (request_options or {}).get('timeout', HANG_SECONDS)
+            time.sleep(min(timeout, HANG_SECONDS))
+            raise TimeoutError(f'injected hang, gave up after {timeout:.2f}s')
+        time.sleep(HEALTHY_LATENCY)
+        if stream:
+            return iter([type('Chunk', (), {'text': word + ' '})() for word in 'Stub model answer'.split()])
+        return type('Response', (), {'text': 'Stub model answer'})()
+
+
+def check(condition, message):
+    if not condition:
+        print(f'FAIL: {message}')
+        sys.exit(1)
+    print(f'ok: {message}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--open-seconds', type=float, default=0.5, help='breaker cool-down before probing')
+    parser.add_argument('--fast-ms', type=float, default=20.0, help='max latency of a reply while open')
+    args = parser.parse_args()
+
+    chatbot = integrated_app.chatbot
+    model = FaultyModel()
+    chatbot.gemini_model = model
+    chatbot.gemini_enabled = True
+    # Every request must reach the model path, so nothing may be answered from a cache
+    chatbot.semantic_cache = None
+    breaker = chatbot.gemini_breaker = CircuitBreaker(
+        window_seconds=10, min_calls=5, error_rate_threshold=0.5, slow_call_seconds=0.2,
+        slow_call_rate_threshold=0.8, open_seconds=args.open_seconds, half_open_calls=1,
+        min_timeout=0.05, max_timeout=2.0, timeout_multiplier=2.0
+    )
+    client = integrated_app.app.test_client()
+    counter = iter(range(1_000_000))
+
+    def chat():
+        index = next(counter)
+        started = time.perf_counter()
+        reply = client.post('/api/chat', json={
+            'message': f'I have had a mild cough for {index} days',
+            'session_id': f'fault-{index}'
+        }).get_json()
+        return reply['response']['type'], (time.perf_counter() - started) * 1000
+
+    print('phase: healthy')
+    types = [chat()[0] for _ in range(10)]
+    check(types == ['ai_analysis'] * 10, 'healthy model answers every request')
+    check(breaker.state == 'closed', 'circuit stays closed')
+    check(breaker.timeout <= 0.1, f'timeout adapted to the healthy p95 ({breaker.timeout:.3f}s)')
+
+    print('phase: errors')
+    model.mode = 'error'
+    for _ in range(10):
+        chat()
+    check(breaker.state == 'open', 'circuit opens on the error rate')
+
+    print('phase: open')
+    calls_before = model.calls
+    replies = [chat() for _ in range(50)]
+    slowest = max(latency for _, latency in replies)
+    check(model.calls == calls_before, 'no model calls while open')
+    check(all(reply_type != 'ai_analysis' for reply_type, _ in replies), 'replies come from the rule-based path')
+    check(slowest < args.fast_ms, f'open-state replies are fast (max {slowest:.2f} ms)')
+
+    print('phase: recovery')
+    model.mode = 'healthy'
+    time.sleep(args.open_seconds)
+    check(chat()[0] == 'ai_analysis', 'half-open probe reaches the model')
+    check(breaker.state == 'closed', 'successful probe closes the circuit')
+
+    print('phase: hangs')
+    for _ in range(5):
+        chat()
+    model.mode = 'hang'
+    hung = [chat()[1] for _ in range(10)]
+    check(breaker.state == 'open', 'circuit opens on calls hanging past the timeout')
+    check(max(hung) < HANG_SECONDS * 1000 / 10,
+          f'adaptive timeout bounds a hanging call (max {max(hung):.0f} ms vs {HANG_SECONDS:.0f} s hang)')
+
+    print('phase: failed probe, then recovery')
+    time.sleep(args.open_seconds)
+    chat()
+    check(breaker.state == 'open', 'failed probe re-opens the circuit')
+    model.mode = 'healthy'
+    time.sleep(args.open_seconds)
+    check(chat()[0] == 'ai_analysis', 'next probe reaches the recovered model')
+    check(breaker.state == 'closed', 'circuit closes again')
+
+    def trip():
+        model.mode = 'error'
+        while breaker.state != 'open':
+            chat()
+        model.mode = 'healthy'
+        time.sleep(args.open_seconds)
+
+    print('phase: client disconnects mid-stream during a probe')
+    trip()
+    stream = chatbot.stream_gemini_completion(f'stream probe {next(counter)}')
+    next(stream)
+    check(breaker.state == 'half_open', 'streamed request is the half-open probe')
+    stream.close()
+    check(breaker.state == 'closed', 'closing the stream early settles the probe')
+    check(chat()[0] == 'ai_analysis', 'later requests still reach the model')
+
+    print('phase: probe released without an outcome')
+    trip()
+    breaker.acquire()
+    breaker.release()
+    check(breaker.state == 'half_open' and breaker.acquire() > 0, 'released probe slot can be taken again')
+    breaker.record_success(HEALTHY_LATENCY)
+    check(breaker.state == 'closed', 'next probe closes the circuit')
+
+    metrics = client.get('/api/metrics').get_json()['gemini_breaker']
+    print(f"breaker metrics: {metrics}")
+    expected = {'closed->open': 4, 'open->half_open': 5, 'half_open->open': 1, 'half_open->closed': 4}
+    check(metrics['transitions'] == expected, f'transition counts {expected}')
+    check(metrics['rejected'] >= 50, 'rejected requests are counted')
+
+    chatbot.shutdown()
+    print('PASS')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Load test /api/chat against a local fake Gemini server with injected latency
+
+Starts a fake Gemini REST endpoint, launches the chatbot under the chosen
+server, then drives it with many concurrent chat sessions.
+
+Usage:
+    python benchmarks/load_test_chat.py --server asgi --sessions 150
+    python benchmarks/load_test_chat.py --server wsgi --sessions 150   # gunicorn sync workers, for comparison
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND = os.path.join(ROOT, 'backend')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_fake_gemini(latency, error_rate=0.0):
+    """Serve generateContent responses after `latency` seconds"""
+    counter = {'requests': 0}
+    lock = threading.Lock()
+
+    class FakeGeminiHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            with lock:
+                counter['requests'] += 1
+                n = counter['requests']
+            time.sleep(latency)
+            if error_rate and (n % int(1 / error_rate)) == 0:
+                self.send_error(503, 'Injected failure')
+                return
+            body = json.dumps({
+                'candidates': [{
+                    'content': {'parts': [{'text': f'Fake Gemini answer #{n}'}], 'role': 'model'},
+                    'finishReason': 'STOP'
+                }]
+            }).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer.daemon_threads = True
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(('127.0.0.1', free_port()), FakeGeminiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, counter
+
+
+def start_app(server, port, gemini_url, timeout):
+    env = dict(os.environ,
+               GEMINI_API_KEY='fake-key',
+               GEMINI_API_ENDPOINT=gemini_url,
+               GEMINI_TIMEOUT=str(timeout),
+               GEMINI_MAX_CONCURRENCY='256',
+               SEMANTIC_CACHE_ENABLED='false')
+    if server == 'asgi':
+        cmd = [sys.executable, '-m', 'uvicorn', 'asgi:application', '--port', str(port),
+               '--log-level', 'warning', '--backlog', '2048']
+    else:
+        cmd = [sys.executable, '-m', 'gunicorn', '-w', '4', '-b', f'127.0.0.1:{port}',
+               '--log-level', 'warning', 'integrated_app:app']
+    process = subprocess.Popen(cmd, cwd=BACKEND, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError('Chatbot server did not start')
+
+
+async def post_chat(port, message):
+    body = json.dumps({'message': message, 'language': 'en'}).encode('utf-8')
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(
+        b'POST /api/chat HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: application/json\r\n'
+        b'Connection: close\r\nContent-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status = int(response.split(b' ', 2)[1])
+    payload = json.loads(response.split(b'\r\n\r\n', 1)[1] or b'{}')
+    return status, payload
+
+
+async def session(port, session_id, turns, results):
+    for turn in range(turns):
+        start = time.perf_counter()
+        try:
+            status, payload = await post_chat(port, f'session {session_id} turn {turn}: I have fever and headache')
+            source = payload.get('response', {}).get('powered_by', 'error')
+        except Exception:
+            status, source = 0, 'error'
+        results.append((time.perf_counter() - start, status, source))
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def run_load(port, sessions, turns):
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(session(port, i, turns, results) for i in range(sessions)))
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--server', choices=['asgi', 'wsgi'], default='asgi')
+    parser.add_argument('--sessions', type=int, default=150)
+    parser.add_argument('--turns', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=1.0, help='fake Gemini latency in seconds')
+    parser.add_argument('--timeout', type=float, default=3.0, help='GEMINI_TIMEOUT for the chatbot')
+    args = parser.parse_args()
+
+    gemini, counter = start_fake_gemini(args.latency)
+    gemini_url = f'http://127.0.0.1:{gemini.server_address[1]}'
+    port = free_port()
+    app_process = start_app(args.server, port, gemini_url, args.timeout)
+
+    try:
+        results, elapsed = asyncio.run(run_load(port, args.sessions, args.turns))
+    finally:
+        app_process.terminate()
+        app_process.wait(timeout=10)
+        gemini.shutdown()
+
+    latencies = [latency for latency, status, _ in results if status == 200]
+    sources = {}
+    for _, _, source in results:
+        sources[source] = sources.get(source, 0) + 1
+
+    print(f"Server: {args.server}  sessions: {args.sessions}  turns: {args.turns}  "
+          f"fake Gemini latency: {args.latency:.2f}s  timeout: {args.timeout:.1f}s")
+    print(f"Requests: {len(results)}  ok: {len(latencies)}  wall: {elapsed:.2f}s  "
+          f"throughput: {len(latencies) / elapsed:.1f} req/s  upstream calls: {counter['requests']}")
+    if latencies:
+        print(f"Latency p50: {percentile(latencies, 50) * 1000:.0f} ms  "
+              f"p95: {percentile(latencies, 95) * 1000:.0f} ms  "
+              f"p99: {percentile(latencies, 99) * 1000:.0f} ms")
+    print(f"Answered by: {sources}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Soak test for the conversation store: memory must stay flat under steady traffic
+
+Appends chat turns from a rotating pool of sessions (larger than the
+session cap, so eviction is exercised) and samples traced Python memory
+and process RSS at regular intervals.
+
+Usage:
+    python benchmarks/soak_conversation_store.py --duration 60
+    python benchmarks/soak_conversation_store.py --backend sqlite --duration 86400   # 24-hour soak
+"""
+
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'backend'))
+
+from conversation_store import create_conversation_store, make_turn
+
+RESPONSE = {
+    'type': 'ai_analysis',
+    'message': 'Possible causes: viral fever, common cold. Rest, drink fluids. Consult a doctor.' * 3,
+    'disclaimer': 'This AI-generated response is for informational purposes only.'
+}
+
+
+def rss_mb():
+    # ru_maxrss is the peak; read the current value from /proc where available
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backend', choices=['memory', 'sqlite'], default='memory')
+    parser.add_argument('--duration', type=float, default=60, help='seconds to run')
+    parser.add_argument('--sample-every', type=float, default=None, help='seconds between samples')
+    parser.add_argument('--sessions', type=int, default=50000, help='distinct sessions in the traffic pool')
+    parser.add_argument('--max-sessions', type=int, default=10000)
+    parser.add_argument('--max-turns', type=int, default=20)
+    parser.add_argument('--max-chars', type=int, default=20_000_000, help='message text the memory store keeps')
+    parser.add_argument('--rate', type=float, default=0, help='turns per second (0 = as fast as possible)')
+    args = parser.parse_args()
+    sample_every = args.sample_every or max(1.0, args.duration / 20)
+
+    db_dir = tempfile.mkdtemp()
+    store = create_conversation_store(
+        args.backend,
+        db_path=os.path.join(db_dir, 'soak.db'),
+        max_turns=args.max_turns,
+        max_sessions=args.max_sessions,
+        max_chars=args.max_chars,
+        retention_days=1
+    )
+
+    tracemalloc.start()
+    rng = random.Random(7)
+    start = time.time()
+    next_sample = start
+    turns = 0
+    baseline = None
+
+    print(f"{'elapsed s':>10} {'turns':>12} {'traced MB':>10} {'rss MB':>8} {'sessions':>9}")
+    while time.time() - start < args.duration:
+        session_id = f"session-{rng.randrange(args.sessions)}"
+        message = f"turn {turns}: I have fever and headache for {rng.randrange(10)} days"
+        store.append(session_id, make_turn(message, RESPONSE, 'en', time.strftime('%Y-%m-%dT%H:%M:%S')))
+        turns += 1
+        if turns % 50 == 0:
+            store.recent(session_id, 6)
+        if args.rate:
+            time.sleep(1 / args.rate)
+
+        if time.time() >= next_sample:
+            traced = tracemalloc.get_traced_memory()[0] / 1e6
+            stats = store.stats()
+            if baseline is None and turns > args.max_sessions * 2:
+                baseline = traced
+            print(f"{time.time() - start:>10.0f} {turns:>12} {traced:>10.1f} {rss_mb():>8.1f} "
+                  f"{stats.get('sessions', stats.get('unwritten_sessions')):>9}")
+            next_sample += sample_every
+
+    store.close()
+    traced = tracemalloc.get_traced_memory()[0] / 1e6
+    print(f"\nFinal: {turns} turns, traced {traced:.1f} MB, rss {rss_mb():.1f} MB")
+    print(f"Store: {store.stats()}")
+    if baseline:
+        growth = (traced - baseline) / baseline * 100
+        print(f"Traced memory growth after warm-up: {growth:+.1f}%")
+
+
+if __name__ == "__main__":
+    main()
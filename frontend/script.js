@@ -28,6 +28,7 @@ console.log('Backend API URL:', API_BASE_URL);
 // Global variables
 let currentLanguage = 'en';
 let isLoading = false;
+let chatSessionId = sessionStorage.getItem('chatSessionId'); // Keeps follow-up questions in context
 
 // Initialize the application
 document.addEventListener('DOMContentLoaded', function() {
@@ -172,34 +173,22 @@ function addMessageToChat(message, sender) {
     chatMessages.scrollTop = chatMessages.scrollHeight;
 }
 
+function rememberSession(sessionId) {
+    if (sessionId && sessionId !== chatSessionId) {
+        chatSessionId = sessionId;
+        sessionStorage.setItem('chatSessionId', sessionId);
+    }
+}
+
 async function sendToBot(message) {
     showLoading();
     
     try {
-        console.log('Sending request to:', `${API_BASE_URL}/chat`);
-        console.log('Message:', message);
-        
-        const response = await fetch(`${API_BASE_URL}/chat`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                message: message,
-                language: currentLanguage
-            })
-        });
-        
-        console.log('Response status:', response.status);
-        
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
+        // Prefer the streaming endpoint so the first bytes render as soon as they arrive
+        const streamed = await streamFromBot(message);
+        if (!streamed) {
+            await fetchFromBot(message);
         }
-        
-        const data = await response.json();
-        console.log('Response data:', data);
-        displayBotResponse(data.response);
-        
     } catch (error) {
         console.error('Error details:', error);
         displayErrorMessage(`Connection error: ${error.message}. Please check if the backend server is running.`);
@@ -208,6 +197,117 @@ async function sendToBot(message) {
     hideLoading();
 }
 
+async function fetchFromBot(message) {
+    console.log('Sending request to:', `${API_BASE_URL}/chat`);
+    console.log('Message:', message);
+    
+    const response = await fetch(`${API_BASE_URL}/chat`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            message: message,
+            language: currentLanguage,
+            session_id: chatSessionId
+        })
+    });
+    
+    console.log('Response status:', response.status);
+    
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    
+    const data = await response.json();
+    console.log('Response data:', data);
+    rememberSession(data.session_id);
+    displayBotResponse(data.response);
+}
+
+// Returns false when streaming is unavailable so the caller can fall back to /chat
+async function streamFromBot(message) {
+    const response = await fetch(`${API_BASE_URL}/chat/stream`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            message: message,
+            language: currentLanguage,
+            session_id: chatSessionId
+        })
+    });
+    
+    if (!response.ok || !response.body) {
+        console.log('Streaming unavailable, status:', response.status);
+        return false;
+    }
+    
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let emergencyShown = false;
+    let streamingBubble = null;
+    let streamedText = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        // Server-Sent Events are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            
+            let eventName = 'message';
+            let dataLine = '';
+            rawEvent.split('\n').forEach(line => {
+                if (line.startsWith('event: ')) eventName = line.slice(7);
+                if (line.startsWith('data: ')) dataLine += line.slice(6);
+            });
+            const data = dataLine ? JSON.parse(dataLine) : {};
+            
+            if (eventName === 'classification') {
+                if (data.is_emergency && data.emergency) {
+                    displayBotResponse(data.emergency);
+                    emergencyShown = true;
+                }
+            } else if (eventName === 'delta') {
+                hideLoading();
+                if (!streamingBubble) {
+                    streamingBubble = document.createElement('p');
+                    addMessageToChat(streamingBubble, 'bot');
+                }
+                streamedText += data.text;
+                streamingBubble.innerHTML = streamedText;
+                const chatMessages = document.getElementById('chatMessages');
+                chatMessages.scrollTop = chatMessages.scrollHeight;
+            } else if (eventName === 'done') {
+                rememberSession(data.session_id);
+                const botResponse = data.response;
+                if (streamingBubble) {
+                    streamingBubble.closest('.message').remove();
+                }
+                if (emergencyShown && botResponse.type === 'emergency') {
+                    // Banner is already on screen; only add the model's explanation
+                    if (botResponse.ai_response) {
+                        addMessageToChat(botResponse.ai_response, 'bot');
+                    }
+                } else {
+                    displayBotResponse(botResponse);
+                }
+            } else if (eventName === 'error') {
+                throw new Error(data.error);
+            }
+        }
+    }
+    
+    return true;
+}
+
 function displayBotResponse(response) {
     const content = document.createElement('div');
     
@@ -241,7 +341,7 @@ function displayBotResponse(response) {
             diseaseDiv.innerHTML = `
                 <strong>${disease.disease}</strong>
                 <span style="float: right; background: #28a745; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-size: 0.8rem;">
-                    ${disease.confidence}% match
+                    ${matchLabel(disease)}
                 </span>
             `;
             symptomsDiv.appendChild(diseaseDiv);
@@ -282,6 +382,30 @@ function displayBotResponse(response) {
     }
     
     addMessageToChat(content, 'bot');
+    
+    // Emergency replies arrive before the model's explanation; fetch it when ready
+    if (response.ai_followup) {
+        pollFollowup(response.ai_followup.id);
+    }
+}
+
+async function pollFollowup(followupId, attempts = 30) {
+    for (let attempt = 0; attempt < attempts; attempt++) {
+        await new Promise(resolve => setTimeout(resolve, 1000));
+        try {
+            const response = await fetch(`${API_BASE_URL}/chat/followup/${followupId}`);
+            if (response.status === 202) continue;
+            if (!response.ok) return;
+            const data = await response.json();
+            if (data.status === 'done' && data.ai_response) {
+                addMessageToChat(data.ai_response, 'bot');
+            }
+            return;
+        } catch (error) {
+            console.error('Follow-up poll failed:', error);
+            return;
+        }
+    }
 }
 
 function displayErrorMessage(message) {
@@ -324,6 +448,14 @@ async function checkSymptoms() {
     hideLoading();
 }
 
+// The phrase engine reports 'confidence' (% of symptoms matched); BM25 reports 'relevance'
+function matchLabel(condition) {
+    if (condition.confidence !== undefined) {
+        return `${condition.confidence}% match`;
+    }
+    return `${condition.relevance}% relevance`;
+}
+
 function displaySymptomsResults(data) {
     const resultsContainer = document.getElementById('symptomsResults');
     
@@ -339,7 +471,7 @@ function displaySymptomsResults(data) {
                 <div class="condition-card">
                     <div class="condition-header">
                         <span class="condition-name">${condition.disease}</span>
-                        <span class="confidence-badge">${condition.confidence}% match</span>
+                        <span class="confidence-badge">${matchLabel(condition)}</span>
                     </div>
                     <p>Matched ${condition.matched_symptoms} symptoms</p>
                 </div>